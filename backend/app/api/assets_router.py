@@ -1,8 +1,14 @@
-from fastapi import APIRouter, HTTPException, status, Depends
-from typing import List
+from fastapi import APIRouter, HTTPException, status, Depends, Query, Response, Header
+from typing import List, Optional
 from ..services.asset_service import AssetService
 from ..models.asset_models import AssetIn, AssetOut
+from ..models.common_models import BulkCreateResult
 from ..dependencies import get_asset_service
+from ..utils.pagination import NEXT_CURSOR_HEADER
+from ..utils.etag import ETAG_HEADER, make_etag, is_not_modified, not_modified_response
+from ..config import get_settings
+
+settings = get_settings()
 
 router = APIRouter(
     prefix="/api/assets",
@@ -12,10 +18,32 @@ router = APIRouter(
 
 @router.get("", response_model=List[AssetOut])
 async def get_all_assets(
+    response: Response,
+    limit: Optional[int] = Query(None, ge=1, le=settings.MAX_PAGE_SIZE, description="Page size. Omit to return every matching asset."),
+    after: Optional[str] = Query(None, description="Cursor taken from the X-Next-Cursor header of the previous page."),
+    asset_class: Optional[str] = Query(None, alias="assetClass"),
+    fp_asset_class: Optional[str] = Query(None, alias="fpAssetClass"),
+    if_none_match: Optional[str] = Header(None),
     asset_service: AssetService = Depends(get_asset_service)
 ):
-    """Retrieve all assets."""
-    return await asset_service.get_all_assets()
+    """Retrieve assets, optionally filtered and paginated. The cursor for the next page is returned in the X-Next-Cursor header; a matching If-None-Match gets 304 Not Modified."""
+    etag = make_etag("assets", await asset_service.get_data_version())
+    if is_not_modified(if_none_match, etag):
+        return not_modified_response(etag)
+    try:
+        assets, next_cursor = await asset_service.list_assets(
+            limit=limit,
+            after=after,
+            asset_class=asset_class,
+            fp_asset_class=fp_asset_class
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+    if etag is not None:
+        response.headers[ETAG_HEADER] = etag
+    return assets
 
 @router.get("/{asset_id}", response_model=AssetOut)
 async def get_asset_by_id(
@@ -42,6 +70,21 @@ async def create_new_asset(
         # Log the exception e here for debugging
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="An unexpected error occurred while creating the asset.")
 
+@router.post("/bulk", response_model=BulkCreateResult, status_code=status.HTTP_201_CREATED)
+async def create_assets_bulk(
+    assets: List[AssetIn],
+    asset_service: AssetService = Depends(get_asset_service)
+):
+    """Create many assets in a single transaction. Every item is validated by the AssetIn model before anything is written."""
+    try:
+        ids = await asset_service.create_assets_bulk(assets)
+        return BulkCreateResult(created_count=len(ids), ids=ids)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except Exception as e:
+        # Log the exception e here for debugging
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="An unexpected error occurred while creating the assets.")
+
 @router.put("/{asset_id}", response_model=AssetOut)
 async def update_existing_asset(
     asset_id: str, 
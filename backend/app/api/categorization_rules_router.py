@@ -0,0 +1,73 @@
+from fastapi import APIRouter, HTTPException, status, Depends
+from typing import List
+from ..services.categorization_service import CategorizationService
+from ..models.rule_models import CategorizationRuleIn, CategorizationRuleOut
+from ..dependencies import get_categorization_service
+
+router = APIRouter(
+    prefix="/api/categorization-rules",
+    tags=["categorization rules"], # For grouping in OpenAPI docs
+    responses={404: {"description": "Not found"}},
+)
+
+@router.get("", response_model=List[CategorizationRuleOut])
+async def get_all_rules(
+    categorization_service: CategorizationService = Depends(get_categorization_service)
+):
+    """Retrieve all categorization rules, ordered by keyword."""
+    try:
+        return await categorization_service.get_all_rules()
+    except Exception as e:
+        # Log the exception e here for debugging
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="An unexpected error occurred while retrieving categorization rules.")
+
+@router.post("", response_model=CategorizationRuleOut, status_code=status.HTTP_201_CREATED)
+async def create_new_rule(
+    rule: CategorizationRuleIn,
+    categorization_service: CategorizationService = Depends(get_categorization_service)
+):
+    """Create a new categorization rule. Keywords are unique, ignoring case and extra whitespace."""
+    try:
+        return await categorization_service.create_rule(rule)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except Exception as e:
+        # Log the exception e here for debugging
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="An unexpected error occurred while creating the categorization rule.")
+
+@router.put("/{rule_id}", response_model=CategorizationRuleOut)
+async def update_existing_rule(
+    rule_id: str,
+    rule_data: CategorizationRuleIn,
+    categorization_service: CategorizationService = Depends(get_categorization_service)
+):
+    """Update an existing categorization rule by its ID."""
+    try:
+        updated_rule = await categorization_service.update_rule(rule_id, rule_data)
+        if updated_rule is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Categorization rule with ID {rule_id} not found")
+        return updated_rule
+    except HTTPException as http_exc: # Re-raise the 404 above
+        raise http_exc
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except Exception as e:
+        # Log the exception e here for debugging
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"An unexpected error occurred while updating categorization rule {rule_id}.")
+
+@router.delete("/{rule_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_existing_rule(
+    rule_id: str,
+    categorization_service: CategorizationService = Depends(get_categorization_service)
+):
+    """Delete a categorization rule by its ID."""
+    try:
+        deleted_successfully = await categorization_service.delete_rule(rule_id)
+        if not deleted_successfully:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Categorization rule with ID {rule_id} not found or already deleted")
+        return
+    except HTTPException as http_exc: # Re-raise the 404 above
+        raise http_exc
+    except Exception as e:
+        # Log the exception e here for debugging
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"An unexpected error occurred while deleting categorization rule {rule_id}.")
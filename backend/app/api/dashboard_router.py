@@ -0,0 +1,33 @@
+from fastapi import APIRouter, HTTPException, status, Depends, Query, Response, Header
+from typing import Optional
+from ..services.dashboard_service import DashboardService
+from ..models.dashboard_models import DashboardData
+from ..dependencies import get_dashboard_service
+from ..utils.etag import ETAG_HEADER, make_etag, is_not_modified, not_modified_response
+from ..config import get_settings
+
+settings = get_settings()
+
+router = APIRouter(
+    prefix="/api/dashboard",
+    tags=["dashboard"], # For grouping in OpenAPI docs
+)
+
+@router.get("", response_model=DashboardData)
+async def get_dashboard(
+    response: Response,
+    limit: Optional[int] = Query(None, ge=1, le=settings.MAX_PAGE_SIZE, description="Page size of each list. Omit to return every record."),
+    if_none_match: Optional[str] = Header(None),
+    dashboard_service: DashboardService = Depends(get_dashboard_service)
+):
+    """Retrieve assets, liabilities, expenses, goals and the financial summary in a single request. A matching If-None-Match gets 304 Not Modified."""
+    try:
+        etag = make_etag("dashboard", await dashboard_service.get_data_version())
+        if is_not_modified(if_none_match, etag):
+            return not_modified_response(etag)
+        dashboard = await dashboard_service.get_dashboard(limit=limit)
+        response.headers[ETAG_HEADER] = etag
+        return dashboard
+    except Exception as e:
+        # Log the exception e here for debugging
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="An unexpected error occurred while loading the dashboard.")
@@ -1,8 +1,20 @@
-from fastapi import APIRouter, HTTPException, status, Depends
-from typing import List
+import inspect
+from datetime import date
+from fastapi import APIRouter, HTTPException, status, Depends, Query, Response, Header, Request
+from pydantic import ValidationError
+from typing import Any, Dict, List, Optional
 from ..services.expense_service import ExpenseService
-from ..models.expense_models import ExpenseIn, ExpenseOut
-from ..dependencies import get_expense_service
+from ..services.categorization_service import CategorizationService
+from ..models.expense_models import ExpenseIn, ExpenseOut, ExpenseImportMapping, ExpenseImportResult, AnnualizedExpenses
+from ..models.common_models import BulkCreateResult
+from ..models.rule_models import RecategorizeResult
+from ..dependencies import get_expense_service, get_categorization_service
+from ..utils.pagination import NEXT_CURSOR_HEADER
+from ..utils.etag import ETAG_HEADER, make_etag, is_not_modified, not_modified_response
+from ..utils.csv_stream import iter_csv_rows
+from ..config import get_settings
+
+settings = get_settings()
 
 router = APIRouter(
     prefix="/api/expenses",
@@ -12,11 +24,38 @@ router = APIRouter(
 
 @router.get("", response_model=List[ExpenseOut])
 async def get_all_expenses(
+    response: Response,
+    limit: Optional[int] = Query(None, ge=1, le=settings.MAX_PAGE_SIZE, description="Page size. Omit to return every matching expense."),
+    after: Optional[str] = Query(None, description="Cursor taken from the X-Next-Cursor header of the previous page."),
+    date_from: Optional[date] = Query(None, alias="dateFrom", description="Earliest expense date (inclusive)."),
+    date_to: Optional[date] = Query(None, alias="dateTo", description="Latest expense date (inclusive)."),
+    category: Optional[str] = Query(None),
+    need_want: Optional[str] = Query(None, alias="needWant"),
+    frequency: Optional[str] = Query(None),
+    if_none_match: Optional[str] = Header(None),
     expense_service: ExpenseService = Depends(get_expense_service)
 ):
-    """Retrieve all expenses."""
+    """Retrieve expenses ordered by date, optionally filtered and paginated. The cursor for the next page is returned in the X-Next-Cursor header; a matching If-None-Match gets 304 Not Modified."""
+    etag = make_etag("expenses", await expense_service.get_data_version())
+    if is_not_modified(if_none_match, etag):
+        return not_modified_response(etag)
     try:
-        return await expense_service.get_all_expenses()
+        expenses, next_cursor = await expense_service.list_expenses(
+            limit=limit,
+            after=after,
+            date_from=date_from,
+            date_to=date_to,
+            category=category,
+            need_want=need_want,
+            frequency=frequency
+        )
+        if next_cursor:
+            response.headers[NEXT_CURSOR_HEADER] = next_cursor
+        if etag is not None:
+            response.headers[ETAG_HEADER] = etag
+        return expenses
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     except Exception as e:
         # It's good practice to log the error for debugging purposes
         # For example: print(f"Error in get_all_expenses: {e}") or use a proper logger
@@ -26,6 +65,25 @@ async def get_all_expenses(
             detail="An unexpected error occurred while retrieving expenses."
         )
 
+@router.get("/annualized", response_model=AnnualizedExpenses)
+async def get_annualized_expenses(
+    response: Response,
+    if_none_match: Optional[str] = Header(None),
+    expense_service: ExpenseService = Depends(get_expense_service)
+):
+    """Retrieve the yearly run-rate of expenses, in total and grouped by category and by Need/Want. A matching If-None-Match gets 304 Not Modified."""
+    etag = make_etag("expenses-annualized", await expense_service.get_data_version())
+    if is_not_modified(if_none_match, etag):
+        return not_modified_response(etag)
+    try:
+        annualized = await expense_service.get_annualized_expenses()
+        if etag is not None:
+            response.headers[ETAG_HEADER] = etag
+        return annualized
+    except Exception as e:
+        # Log the exception e here for debugging
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="An unexpected error occurred while annualizing expenses.")
+
 @router.get("/{expense_id}", response_model=ExpenseOut)
 async def get_expense_by_id(
     expense_id: str,
@@ -51,6 +109,60 @@ async def create_new_expense(
         # Log the exception e here for debugging
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="An unexpected error occurred while creating the expense.")
 
+@router.post("/bulk", response_model=BulkCreateResult, status_code=status.HTTP_201_CREATED)
+async def create_expenses_bulk(
+    expenses: List[ExpenseIn],
+    expense_service: ExpenseService = Depends(get_expense_service)
+):
+    """Create many expenses in a single transaction. Every item is validated by the ExpenseIn model before anything is written."""
+    try:
+        ids = await expense_service.create_expenses_bulk(expenses)
+        return BulkCreateResult(created_count=len(ids), ids=ids)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except Exception as e:
+        # Log the exception e here for debugging
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="An unexpected error occurred while creating the expenses.")
+
+def _import_mapping_fields(**fields: Any) -> Dict[str, Any]:
+    """The import mapping query parameters, left for the route to validate so a bad value gets a 400."""
+    return fields
+
+# Same query parameters and defaults as the ExpenseImportMapping fields
+_import_mapping_fields.__signature__ = inspect.signature(ExpenseImportMapping).replace(return_annotation=Dict[str, Any])
+
+@router.post("/import", response_model=ExpenseImportResult)
+async def import_expenses_csv(
+    request: Request,
+    mapping_fields: Dict[str, Any] = Depends(_import_mapping_fields),
+    apply_rules: bool = Query(True, alias="applyRules", description="Categorize rows with the categorization rules when there is no category column."),
+    expense_service: ExpenseService = Depends(get_expense_service),
+    categorization_service: CategorizationService = Depends(get_categorization_service)
+):
+    """Import a bank or card statement sent as the raw CSV request body. The body is parsed as it arrives and inserted in batches; rows that fail validation are reported and skipped. A file that cannot be parsed stops the import with 400, keeping the batches already inserted."""
+    try:
+        mapping = ExpenseImportMapping(**mapping_fields)
+        rules = await categorization_service.get_compiled_rules() if apply_rules else None
+        return await expense_service.import_expenses(iter_csv_rows(request.stream()), mapping, rules)
+    except ValidationError as e: # A mapping value every row would fail
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except Exception as e:
+        # Log the exception e here for debugging
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="An unexpected error occurred while importing the expenses.")
+
+@router.post("/recategorize", response_model=RecategorizeResult)
+async def recategorize_expenses(
+    categorization_service: CategorizationService = Depends(get_categorization_service)
+):
+    """Apply the categorization rules to every existing expense. Expenses matching no rule are left unchanged."""
+    try:
+        return await categorization_service.recategorize_expenses()
+    except Exception as e:
+        # Log the exception e here for debugging
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="An unexpected error occurred while recategorizing expenses.")
+
 @router.put("/{expense_id}", response_model=ExpenseOut)
 async def update_existing_expense(
     expense_id: str, 
@@ -63,6 +175,8 @@ async def update_existing_expense(
         if updated_expense is None:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Expense with ID {expense_id} not found")
         return updated_expense
+    except HTTPException as http_exc: # Re-raise the 404 above
+        raise http_exc
     except ValueError as e: # Catches validation errors from Pydantic models if they are re-raised or occur during service logic
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     except Exception as e:
@@ -80,6 +194,8 @@ async def delete_existing_expense(
         if not deleted_successfully:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Expense with ID {expense_id} not found or already deleted")
         return # FastAPI will return 204 No Content by default
+    except HTTPException as http_exc: # Re-raise the 404 above
+        raise http_exc
     except Exception as e:
         # Add logging for the error e
         raise HTTPException(
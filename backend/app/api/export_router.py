@@ -0,0 +1,26 @@
+from fastapi import APIRouter, HTTPException, status, Depends, Query
+from fastapi.responses import StreamingResponse
+from ..services.export_service import ExportService, EXPORT_MEDIA_TYPES
+from ..dependencies import get_export_service
+
+router = APIRouter(
+    prefix="/api/export",
+    tags=["export"], # For grouping in OpenAPI docs
+)
+
+@router.get("/{entity}", response_class=StreamingResponse)
+async def export_entity(
+    entity: str,
+    export_format: str = Query("csv", alias="format", description="csv or ndjson."),
+    export_service: ExportService = Depends(get_export_service)
+):
+    """Download every asset, liability, expense or goal as CSV or NDJSON, streamed one chunk of rows at a time."""
+    try:
+        chunks = export_service.export(entity, export_format)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    return StreamingResponse(
+        chunks,
+        media_type=EXPORT_MEDIA_TYPES[export_format],
+        headers={"Content-Disposition": f'attachment; filename="{entity}.{export_format}"'}
+    )
@@ -1,8 +1,14 @@
-from fastapi import APIRouter, HTTPException, Depends
+from fastapi import APIRouter, HTTPException, Depends, Header, Response
+from typing import Optional, Union
 
 from ..services.fi_service import FIService
-from ..models.fi_models import FIRequestData, FinancialIndependenceResult, UserFIParameters
+from ..models.fi_models import (
+    FIRequestData, FinancialIndependenceResult, UserFIParameters,
+    FIScenarioRequest, FIScenarioList, FIScenarioMatrix, MonteCarloRequest, MonteCarloResult,
+    FIProjectionRequest, FIProjectionResult
+)
 from ..dependencies import get_fi_service
+from ..utils.etag import ETAG_HEADER, make_etag, is_not_modified, not_modified_response
 
 router = APIRouter(
     prefix="/fi", # All routes in this router will start with /fi
@@ -35,16 +41,76 @@ async def calculate_financial_independence_status(
         # print(f"Error during FI calculation: {e}") 
         raise HTTPException(status_code=500, detail=f"An internal server error occurred during FI calculation: {str(e)}")
 
+@router.post("/scenarios", response_model=Union[FIScenarioMatrix, FIScenarioList])
+async def calculate_financial_independence_scenarios(
+    request_data: FIScenarioRequest,
+    fi_service: FIService = Depends(get_fi_service)
+):
+    """
+    Evaluates many FI scenarios in one request.
+
+    Send either a list of `scenarios` (one result per entry, in order) or a `grid`
+    of SWR x annual expense ranges (a matrix with one row per SWR value). The
+    portfolio aggregates are loaded once and every scenario is evaluated in bulk.
+    """
+    try:
+        if request_data.grid is not None:
+            return await fi_service.calculate_fi_grid(request_data.grid)
+        return await fi_service.calculate_fi_scenarios(request_data.scenarios)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"An internal server error occurred during FI scenario calculation: {str(e)}")
+
+@router.post("/monte-carlo", response_model=MonteCarloResult)
+async def simulate_financial_independence_success(
+    request_data: MonteCarloRequest,
+    fi_service: FIService = Depends(get_fi_service)
+) -> MonteCarloResult:
+    """
+    Simulates many retirement paths to estimate how likely the current FI corpus
+    is to last, returning the success probability and corpus percentile bands.
+
+    Returns are drawn per year from asset-class assumptions weighted by the
+    investable portfolio mix. Pass `seed` for reproducible results and
+    `use_process_pool` to spread large runs across CPU cores.
+    """
+    try:
+        return await fi_service.simulate_fi_success(request_data)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"An internal server error occurred during Monte Carlo simulation: {str(e)}")
+
+@router.post("/projection", response_model=FIProjectionResult)
+async def project_financial_independence(
+    request_data: FIProjectionRequest,
+    fi_service: FIService = Depends(get_fi_service)
+) -> FIProjectionResult:
+    """
+    Projects the FI corpus month by month for one or more monthly savings amounts,
+    starting from the current net FI corpus, and reports when each projection
+    reaches the required FI corpus.
+    """
+    try:
+        return await fi_service.project_fi(request_data)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"An internal server error occurred during FI projection: {str(e)}")
+
 @router.get("/summary")
 async def get_fi_summary(
+    response: Response,
+    if_none_match: Optional[str] = Header(None),
     fi_service: FIService = Depends(get_fi_service)
 ):
     """
     Get a summary of current financial status including net worth and basic FI metrics.
+    A matching If-None-Match gets 304 Not Modified.
     """
     try:
+        etag = make_etag("summary", await fi_service.get_summary_data_version())
+        if is_not_modified(if_none_match, etag):
+            return not_modified_response(etag)
         # Get basic financial summary without requiring user FI parameters
         summary = await fi_service.get_financial_summary()
+        if etag is not None:
+            response.headers[ETAG_HEADER] = etag
         return summary
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error getting financial summary: {str(e)}")
@@ -1,8 +1,14 @@
-from fastapi import APIRouter, HTTPException, status, Depends
-from typing import List
+from fastapi import APIRouter, HTTPException, status, Depends, Query, Response, Header
+from typing import List, Optional
 from ..services.goal_service import GoalService
 from ..models.goal_models import GoalIn, GoalOut
+from ..models.common_models import BulkCreateResult
 from ..dependencies import get_goal_service
+from ..utils.pagination import NEXT_CURSOR_HEADER
+from ..utils.etag import ETAG_HEADER, make_etag, is_not_modified, not_modified_response
+from ..config import get_settings
+
+settings = get_settings()
 
 router = APIRouter(
     prefix="/api/goals",
@@ -12,10 +18,32 @@ router = APIRouter(
 
 @router.get("", response_model=List[GoalOut])
 async def get_all_goals(
+    response: Response,
+    limit: Optional[int] = Query(None, ge=1, le=settings.MAX_PAGE_SIZE, description="Page size. Omit to return every matching goal."),
+    after: Optional[str] = Query(None, description="Cursor taken from the X-Next-Cursor header of the previous page."),
+    category: Optional[str] = Query(None),
+    priority: Optional[str] = Query(None),
+    if_none_match: Optional[str] = Header(None),
     goal_service: GoalService = Depends(get_goal_service)
 ):
-    """Retrieve all goals."""
-    return await goal_service.get_all_goals()
+    """Retrieve goals ordered by target date, optionally filtered and paginated. The cursor for the next page is returned in the X-Next-Cursor header; a matching If-None-Match gets 304 Not Modified."""
+    etag = make_etag("goals", await goal_service.get_data_version())
+    if is_not_modified(if_none_match, etag):
+        return not_modified_response(etag)
+    try:
+        goals, next_cursor = await goal_service.list_goals(
+            limit=limit,
+            after=after,
+            category=category,
+            priority=priority
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+    if etag is not None:
+        response.headers[ETAG_HEADER] = etag
+    return goals
 
 @router.get("/{goal_id}", response_model=GoalOut)
 async def get_goal_by_id(
@@ -42,6 +70,21 @@ async def create_new_goal(
         # Log the exception e here for debugging
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="An unexpected error occurred while creating the goal.")
 
+@router.post("/bulk", response_model=BulkCreateResult, status_code=status.HTTP_201_CREATED)
+async def create_goals_bulk(
+    goals: List[GoalIn],
+    goal_service: GoalService = Depends(get_goal_service)
+):
+    """Create many goals in a single transaction. Every item is validated by the GoalIn model before anything is written."""
+    try:
+        ids = await goal_service.create_goals_bulk(goals)
+        return BulkCreateResult(created_count=len(ids), ids=ids)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except Exception as e:
+        # Log the exception e here for debugging
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="An unexpected error occurred while creating the goals.")
+
 @router.put("/{goal_id}", response_model=GoalOut)
 async def update_existing_goal(
     goal_id: str, 
@@ -1,8 +1,16 @@
-from fastapi import APIRouter, HTTPException, status, Depends
-from typing import List
+import hashlib
+from datetime import date
+from fastapi import APIRouter, HTTPException, status, Depends, Query, Response, Header
+from typing import List, Optional
 from ..services.liability_service import LiabilityService
-from ..models.liability_models import LiabilityIn, LiabilityOut
+from ..models.liability_models import LiabilityIn, LiabilityOut, AmortizationSummary, PayoffStrategyRequest, PayoffComparison
+from ..models.common_models import BulkCreateResult
 from ..dependencies import get_liability_service
+from ..utils.pagination import NEXT_CURSOR_HEADER
+from ..utils.etag import ETAG_HEADER, make_etag, is_not_modified, not_modified_response
+from ..config import get_settings
+
+settings = get_settings()
 
 router = APIRouter(
     prefix="/api/liabilities",
@@ -12,10 +20,77 @@ router = APIRouter(
 
 @router.get("", response_model=List[LiabilityOut])
 async def get_all_liabilities(
+    response: Response,
+    limit: Optional[int] = Query(None, ge=1, le=settings.MAX_PAGE_SIZE, description="Page size. Omit to return every matching liability."),
+    after: Optional[str] = Query(None, description="Cursor taken from the X-Next-Cursor header of the previous page."),
+    liability_type: Optional[str] = Query(None, alias="type"),
+    if_none_match: Optional[str] = Header(None),
+    liability_service: LiabilityService = Depends(get_liability_service)
+):
+    """Retrieve liabilities, optionally filtered and paginated. The cursor for the next page is returned in the X-Next-Cursor header; a matching If-None-Match gets 304 Not Modified."""
+    etag = make_etag("liabilities", await liability_service.get_data_version())
+    if is_not_modified(if_none_match, etag):
+        return not_modified_response(etag)
+    try:
+        liabilities, next_cursor = await liability_service.list_liabilities(
+            limit=limit,
+            after=after,
+            liability_type=liability_type
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+    if etag is not None:
+        response.headers[ETAG_HEADER] = etag
+    return liabilities
+
+@router.get("/amortization", response_model=AmortizationSummary)
+async def get_liabilities_amortization(
+    response: Response,
+    if_none_match: Optional[str] = Header(None),
+    liability_service: LiabilityService = Depends(get_liability_service)
+):
+    """EMI schedules for all liabilities (revolving debt at the assumed minimum payment), total interest outstanding and the monthly debt-service curve. A matching If-None-Match gets 304 Not Modified."""
+    try:
+        # Schedules are dated from today, so the tag changes daily as well as with every write
+        etag = make_etag(f"liabilities-amortization-{date.today().isoformat()}", await liability_service.get_data_version())
+        if is_not_modified(if_none_match, etag):
+            return not_modified_response(etag)
+        amortization = await liability_service.get_amortization()
+        if etag is not None:
+            response.headers[ETAG_HEADER] = etag
+        return amortization
+    except Exception as e:
+        # Log the exception e here for debugging
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="An unexpected error occurred while computing the amortization schedules.")
+
+@router.post("/payoff-strategies", response_model=PayoffComparison)
+async def compare_liability_payoff_strategies(
+    request_data: PayoffStrategyRequest,
+    response: Response,
+    if_none_match: Optional[str] = Header(None),
     liability_service: LiabilityService = Depends(get_liability_service)
 ):
-    """Retrieve all liabilities."""
-    return await liability_service.get_all_liabilities()
+    """Compare avalanche, snowball and custom-order payoff of all liabilities with an extra monthly payment, against the same budget without it. A matching If-None-Match for the same request gets 304 Not Modified."""
+    try:
+        # The tag also covers the request, since each payment and order has its own result
+        request_digest = hashlib.sha256(request_data.model_dump_json().encode()).hexdigest()[:16]
+        etag = make_etag(
+            f"liabilities-payoff-{date.today().isoformat()}-{request_digest}",
+            await liability_service.get_data_version()
+        )
+        if is_not_modified(if_none_match, etag):
+            return not_modified_response(etag)
+        comparison = await liability_service.compare_payoff_strategies(request_data.extraMonthlyPayment, request_data.customOrder)
+        if etag is not None:
+            response.headers[ETAG_HEADER] = etag
+        return comparison
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except Exception as e:
+        # Log the exception e here for debugging
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="An unexpected error occurred while simulating payoff strategies.")
 
 @router.get("/{liability_id}", response_model=LiabilityOut)
 async def get_liability_by_id(
@@ -42,6 +117,21 @@ async def create_new_liability(
         # Log the exception e here for debugging
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="An unexpected error occurred while creating the liability.")
 
+@router.post("/bulk", response_model=BulkCreateResult, status_code=status.HTTP_201_CREATED)
+async def create_liabilities_bulk(
+    liabilities: List[LiabilityIn],
+    liability_service: LiabilityService = Depends(get_liability_service)
+):
+    """Create many liabilities in a single transaction. Every item is validated by the LiabilityIn model before anything is written."""
+    try:
+        ids = await liability_service.create_liabilities_bulk(liabilities)
+        return BulkCreateResult(created_count=len(ids), ids=ids)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except Exception as e:
+        # Log the exception e here for debugging
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="An unexpected error occurred while creating the liabilities.")
+
 @router.put("/{liability_id}", response_model=LiabilityOut)
 async def update_existing_liability(
     liability_id: str, 
@@ -54,6 +144,8 @@ async def update_existing_liability(
         if updated_liability is None:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Liability with ID {liability_id} not found")
         return updated_liability
+    except HTTPException as http_exc: # Re-raise the 404 above
+        raise http_exc
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     except Exception as e:
@@ -0,0 +1,34 @@
+from fastapi import APIRouter, HTTPException, status, Depends, Query, Response
+from typing import List, Optional
+from ..services.search_service import SearchService
+from ..models.search_models import SearchHit
+from ..dependencies import get_search_service
+from ..utils.pagination import NEXT_CURSOR_HEADER
+from ..config import get_settings
+
+settings = get_settings()
+
+router = APIRouter(
+    prefix="/api/search",
+    tags=["search"], # For grouping in OpenAPI docs
+)
+
+@router.get("", response_model=List[SearchHit])
+async def search(
+    response: Response,
+    q: str = Query(..., min_length=1, description="Words to find; every word must match, as a whole word or the start of one."),
+    limit: int = Query(20, ge=1, le=settings.MAX_PAGE_SIZE),
+    after: Optional[str] = Query(None, description="Cursor taken from the X-Next-Cursor header of the previous page."),
+    search_service: SearchService = Depends(get_search_service)
+):
+    """Search expense categories and details, goal names and notes, and asset names, best match first. The cursor for the next page is returned in the X-Next-Cursor header."""
+    try:
+        hits, next_cursor = await search_service.search(q, limit=limit, after=after)
+        if next_cursor:
+            response.headers[NEXT_CURSOR_HEADER] = next_cursor
+        return hits
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except Exception as e:
+        # Log the exception e here for debugging
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="An unexpected error occurred while searching.")
@@ -0,0 +1,24 @@
+from fastapi import APIRouter, HTTPException, status, Depends, Query
+from typing import Optional
+from ..services.sync_service import SyncService
+from ..models.sync_models import SyncResult
+from ..dependencies import get_sync_service
+
+router = APIRouter(
+    prefix="/api/sync",
+    tags=["sync"], # For grouping in OpenAPI docs
+)
+
+@router.get("", response_model=SyncResult)
+async def sync_changes(
+    since: Optional[str] = Query(None, description="Watermark returned by the previous sync. Omit for a full snapshot."),
+    sync_service: SyncService = Depends(get_sync_service)
+):
+    """Retrieve assets, liabilities, expenses and goals changed since a watermark, plus the IDs deleted since then."""
+    try:
+        return await sync_service.get_changes(since)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except Exception as e:
+        # Log the exception e here for debugging
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="An unexpected error occurred while syncing.")
@@ -1,4 +1,5 @@
-from typing import List
+import os
+from typing import Dict, List, Tuple
 from functools import lru_cache
 
 class Settings:
@@ -28,6 +29,11 @@ class Settings:
         "One-Time", "Monthly", "Quarterly", "Semi-Annually", "Annually"
     ]
     
+    # Occurrences per year of each expense frequency; one-time expenses count once
+    EXPENSE_FREQUENCY_ANNUAL_MULTIPLIERS: Dict[str, int] = {
+        "One-Time": 1, "Monthly": 12, "Quarterly": 4, "Semi-Annually": 2, "Annually": 1
+    }
+    
     ALLOWED_NEED_WANT_CATEGORIES: List[str] = [
         "Need", "Want"
     ]
@@ -43,17 +49,67 @@ class Settings:
     ]
     
     # FI calculation constants
-    DEFAULT_GOALS_PLACEHOLDER: float = 102863884.0
     DEFAULT_SWR_PERCENTAGE: float = 4.0
     DEFAULT_FP_ASSET_CLASSES_FOR_INVESTABLE: List[str] = [
         "Retirement", "General Investment / Wealth Creation"
     ]
+    MAX_FI_SCENARIOS: int = 10000
+    MAX_FI_GRID_STEPS: int = 200
+    
+    # Monte Carlo assumptions: annual (expected return %, volatility %) per asset class
+    ASSET_CLASS_RETURN_ASSUMPTIONS: Dict[str, Tuple[float, float]] = {
+        "Cash / Cash Equivalent": (4.0, 1.0),
+        "Equity": (12.0, 18.0),
+        "Debt": (7.0, 4.0),
+        "Real Estate": (8.0, 10.0),
+        "Commodities": (7.0, 15.0),
+        "Alternatives": (10.0, 20.0),
+        "Other": (6.0, 8.0)
+    }
+    DEFAULT_INFLATION_PERCENTAGE: float = 6.0
+    MONTE_CARLO_MAX_PATHS: int = 200000
+    MONTE_CARLO_MAX_YEARS: int = 100
+    MONTE_CARLO_CHUNK_PATHS: int = 25000  # Paths per RNG stream / process pool task
+    MAX_PROJECTION_YEARS: int = 100
+    MAX_PROJECTION_SERIES: int = 50
+    
+    # Liabilities without a due date (credit cards, credit lines) are amortized as revolving debt at a fixed
+    # minimum payment: this share of the current balance, at least the floor amount
+    REVOLVING_MINIMUM_PAYMENT_PERCENTAGE: float = 5.0
+    REVOLVING_MINIMUM_PAYMENT_INR: float = 500.0
     
     # API settings
     API_TITLE: str = "Financial Agent API"
     API_DESCRIPTION: str = "API for managing personal finance data."
     API_VERSION: str = "0.1.0"
     
+    # Render responses with orjson instead of the stdlib json module (opt in with FAST_JSON_RESPONSES=1)
+    FAST_JSON_RESPONSES: bool = os.getenv("FAST_JSON_RESPONSES", "0").lower() in ("1", "true", "yes")
+    
+    # FI result cache: maximum entries kept by the in-process LRU backend
+    FI_CACHE_MAX_ENTRIES: int = 1024
+    
+    # Compiled categorization rule sets kept in memory (one per user and rule set version)
+    RULE_CACHE_MAX_ENTRIES: int = 64
+    
+    # Delta sync: seconds the returned watermark is set back, so writes stamped just before it are not missed
+    SYNC_WATERMARK_OVERLAP_SECONDS: int = 2
+    
+    # Export: rows fetched from the database and encoded per streamed chunk
+    EXPORT_CHUNK_SIZE: int = 1000
+    
+    # CSV import: rows validated and inserted per transaction, and how many row errors are reported
+    IMPORT_BATCH_SIZE: int = 500
+    IMPORT_MAX_REPORTED_ERRORS: int = 100
+    # CSV import: statement dates whose repeated-row counts are kept; statements are date-ordered, so this bounds memory
+    IMPORT_OCCURRENCE_DATES: int = 62
+    
+    # Recategorization: expenses read, matched and updated per transaction
+    RECATEGORIZE_BATCH_SIZE: int = 1000
+    
+    # Pagination settings
+    MAX_PAGE_SIZE: int = 1000
+    
     # CORS settings
     ALLOWED_ORIGINS: List[str] = [
         "http://localhost",
@@ -1,3 +1,5 @@
+from typing import Awaitable, Callable, TypeVar
+from sqlalchemy import inspect, text
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 from sqlalchemy.orm import DeclarativeBase
 from .config import get_settings
@@ -30,10 +32,35 @@ async def get_db_session():
         finally:
             await session.close()
 
+T = TypeVar("T")
+
+async def run_in_session(operation: Callable[[AsyncSession], Awaitable[T]]) -> T:
+    """Run `operation` on its own short-lived session, so independent reads can run concurrently."""
+    async with AsyncSessionLocal() as session:
+        return await operation(session)
+
+def _add_missing_columns(sync_conn):
+    """Add nullable columns added to the models after their tables already existed."""
+    inspector = inspect(sync_conn)
+    for table in Base.metadata.sorted_tables:
+        existing = {column["name"] for column in inspector.get_columns(table.name)}
+        for column in table.columns:
+            if column.name not in existing and column.nullable:
+                column_type = column.type.compile(dialect=sync_conn.dialect)
+                sync_conn.execute(text(f"ALTER TABLE {table.name} ADD COLUMN {column.name} {column_type}"))
+
+def _create_missing_indexes(sync_conn):
+    """Create indexes added to the models after their tables already existed."""
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(sync_conn, checkfirst=True)
+
 async def create_tables():
     """Create all database tables."""
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
+        await conn.run_sync(_add_missing_columns)
+        await conn.run_sync(_create_missing_indexes)
 
 async def drop_tables():
     """Drop all database tables."""
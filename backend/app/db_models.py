@@ -1,8 +1,12 @@
-from sqlalchemy import Column, Integer, String, Float, Date, DateTime, Text, ForeignKey
+from sqlalchemy import Column, Integer, String, Float, Date, DateTime, Text, ForeignKey, Index, event, insert_sentinel
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from .database import Base
 
+def _bulk_insert_sentinel() -> Column:
+    """Client-filled column that lets one batched INSERT ... RETURNING report ids in row order on SQLite."""
+    return insert_sentinel("insert_sentinel")
+
 class User(Base):
     """User model for future multi-user support."""
     __tablename__ = "users"
@@ -22,6 +26,12 @@ class User(Base):
 class Asset(Base):
     """Asset database model."""
     __tablename__ = "assets"
+    __table_args__ = (
+        Index("ix_assets_user_id_id", "user_id", "id"),
+        Index("ix_assets_user_id_asset_class_value", "user_id", "asset_class", "value_inr"),
+        Index("ix_assets_user_id_fp_asset_class_value", "user_id", "fp_asset_class", "value_inr"),
+        Index("ix_assets_user_id_updated_at", "user_id", "updated_at"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
@@ -30,6 +40,7 @@ class Asset(Base):
     asset_class = Column(String(100), nullable=False)
     asset_type = Column(String(100), nullable=False)
     fp_asset_class = Column(String(100), nullable=False)
+    _insert_sentinel = _bulk_insert_sentinel()
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
     
@@ -39,6 +50,11 @@ class Asset(Base):
 class Liability(Base):
     """Liability database model."""
     __tablename__ = "liabilities"
+    __table_args__ = (
+        Index("ix_liabilities_user_id_id", "user_id", "id"),
+        Index("ix_liabilities_user_id_type_outstanding", "user_id", "type", "outstanding_amount_inr"),
+        Index("ix_liabilities_user_id_updated_at", "user_id", "updated_at"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
@@ -47,6 +63,7 @@ class Liability(Base):
     outstanding_amount_inr = Column(Float, nullable=False)
     interest_rate = Column(Float, nullable=True)
     due_date = Column(Date, nullable=True)
+    _insert_sentinel = _bulk_insert_sentinel()
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
     
@@ -56,6 +73,13 @@ class Liability(Base):
 class Expense(Base):
     """Expense database model."""
     __tablename__ = "expenses"
+    __table_args__ = (
+        Index("ix_expenses_user_id_date_id", "user_id", "date", "id"),
+        Index("ix_expenses_user_id_updated_at", "user_id", "updated_at"),
+        Index("ix_expenses_user_id_fingerprint", "user_id", "fingerprint", unique=True),
+        # Leads with (user_id, frequency, category) and covers the annualized rollup
+        Index("ix_expenses_user_id_frequency_category", "user_id", "frequency", "category", "need_want", "amount"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
@@ -65,6 +89,9 @@ class Expense(Base):
     frequency = Column(String(50), nullable=False)
     need_want = Column(String(10), nullable=False)
     date = Column(Date, nullable=False)
+    # Hash of the statement row an imported expense came from; NULL for expenses entered by hand
+    fingerprint = Column(String(64), nullable=True)
+    _insert_sentinel = _bulk_insert_sentinel()
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
     
@@ -74,6 +101,10 @@ class Expense(Base):
 class Goal(Base):
     """Goal database model."""
     __tablename__ = "goals"
+    __table_args__ = (
+        Index("ix_goals_user_id_target_date_id", "user_id", "target_date", "id"),
+        Index("ix_goals_user_id_updated_at", "user_id", "updated_at"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
@@ -84,8 +115,103 @@ class Goal(Base):
     priority = Column(String(20), nullable=False)
     category = Column(String(100), nullable=False)
     notes = Column(Text, nullable=True)
+    _insert_sentinel = _bulk_insert_sentinel()
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
     
     # Relationships
     user = relationship("User", back_populates="goals")
+
+class DataVersion(Base):
+    """Per-user, per-resource write counter, bumped in the same transaction as every write."""
+    __tablename__ = "data_versions"
+    
+    user_id = Column(Integer, ForeignKey("users.id"), primary_key=True)
+    resource = Column(String(50), primary_key=True)
+    version = Column(Integer, nullable=False, default=0)
+
+class DeletedRecord(Base):
+    """Tombstone written in the same transaction as every delete, so delta sync can report deletions."""
+    __tablename__ = "deleted_records"
+    __table_args__ = (
+        Index("ix_deleted_records_user_id_deleted_at", "user_id", "deleted_at"),
+    )
+    
+    id = Column(Integer, primary_key=True)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    resource = Column(String(50), nullable=False)
+    record_id = Column(Integer, nullable=False)
+    deleted_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+
+class CategorizationRule(Base):
+    """Keyword rule that assigns a category (and optionally need/want) to matching expenses."""
+    __tablename__ = "categorization_rules"
+    __table_args__ = (
+        Index("ix_categorization_rules_user_id_keyword", "user_id", "keyword", unique=True),
+    )
+    
+    id = Column(Integer, primary_key=True, index=True)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    keyword = Column(String(255), nullable=False)  # Normalized: casefolded, whitespace collapsed
+    category = Column(String(100), nullable=False)
+    need_want = Column(String(10), nullable=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+# Full-text search index: an FTS5 table over expense categories and details,
+# goal names and notes, and asset names, kept in sync by triggers. Each row's
+# rowid is the record id times SEARCH_ROWID_STRIDE plus its resource code, so
+# triggers reach an entry by rowid and search hits decode back to records.
+SEARCH_ROWID_STRIDE = 4
+SEARCH_RESOURCE_CODES = {"expenses": 1, "goals": 2, "assets": 3}
+
+# (table, title column, body column) indexed for each resource
+_SEARCH_SOURCES = {
+    "expenses": ("expenses", "category", "details"),
+    "goals": ("goals", "name", "notes"),
+    "assets": ("assets", "name", "NULL")
+}
+
+def _search_index_ddl():
+    """CREATE statements for the search index and the triggers that keep it current."""
+    statements = [
+        "CREATE VIRTUAL TABLE IF NOT EXISTS search_index USING fts5("
+        "title, body, user_id UNINDEXED, tokenize = 'unicode61 remove_diacritics 2')"
+    ]
+    for resource, (table, title, body) in _SEARCH_SOURCES.items():
+        rowid = f"id * {SEARCH_ROWID_STRIDE} + {SEARCH_RESOURCE_CODES[resource]}"
+        new_body = "NULL" if body == "NULL" else f"new.{body}"
+        body_columns = "" if body == "NULL" else f", {body}"
+        statements += [
+            f"CREATE TRIGGER IF NOT EXISTS {table}_search_insert AFTER INSERT ON {table} BEGIN "
+            f"INSERT INTO search_index (rowid, title, body, user_id) "
+            f"VALUES (new.{rowid}, new.{title}, {new_body}, new.user_id); END",
+            f"CREATE TRIGGER IF NOT EXISTS {table}_search_update AFTER UPDATE OF {title}{body_columns}, user_id ON {table} BEGIN "
+            f"UPDATE search_index SET title = new.{title}, body = {new_body}, user_id = new.user_id "
+            f"WHERE rowid = old.{rowid}; END",
+            f"CREATE TRIGGER IF NOT EXISTS {table}_search_delete AFTER DELETE ON {table} BEGIN "
+            f"DELETE FROM search_index WHERE rowid = old.{rowid}; END"
+        ]
+    return statements
+
+def _create_search_index(target, connection, **kw):
+    """Create the search index and its triggers, indexing existing rows when the index is new."""
+    if connection.dialect.name != "sqlite":
+        return
+    exists = connection.exec_driver_sql("SELECT 1 FROM sqlite_master WHERE name = 'search_index'").first()
+    for statement in _search_index_ddl():
+        connection.exec_driver_sql(statement)
+    if not exists:
+        for resource, (table, title, body) in _SEARCH_SOURCES.items():
+            connection.exec_driver_sql(
+                f"INSERT INTO search_index (rowid, title, body, user_id) "
+                f"SELECT id * {SEARCH_ROWID_STRIDE} + {SEARCH_RESOURCE_CODES[resource]}, {title}, {body}, user_id FROM {table}"
+            )
+
+def _drop_search_index(target, connection, **kw):
+    """Drop the search index along with the tables it mirrors (their triggers go with them)."""
+    if connection.dialect.name == "sqlite":
+        connection.exec_driver_sql("DROP TABLE IF EXISTS search_index")
+
+event.listen(Base.metadata, "after_create", _create_search_index)
+event.listen(Base.metadata, "before_drop", _drop_search_index)
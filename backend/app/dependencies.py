@@ -4,12 +4,18 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from .fixtures.sample_data import StaticDataManager
 from .config import Settings, get_settings
 from .database import get_db_session
-from .repositories import AssetRepository, LiabilityRepository, ExpenseRepository, GoalRepository, UserRepository
+from .utils.cache import get_fi_cache, get_rule_cache
+from .repositories import AssetRepository, LiabilityRepository, ExpenseRepository, GoalRepository, UserRepository, SyncRepository, CategorizationRuleRepository, SearchRepository
 from .services.asset_service import AssetService
 from .services.liability_service import LiabilityService
 from .services.expense_service import ExpenseService
 from .services.goal_service import GoalService
 from .services.fi_service import FIService
+from .services.dashboard_service import DashboardService
+from .services.sync_service import SyncService
+from .services.export_service import ExportService
+from .services.categorization_service import CategorizationService
+from .services.search_service import SearchService
 
 # Legacy static data manager (will be phased out)
 @lru_cache()
@@ -47,6 +53,24 @@ def get_expense_repository(
     """Get the expense repository with database session."""
     return ExpenseRepository(db_session)
 
+def get_sync_repository(
+    db_session: AsyncSession = Depends(get_db_session)
+) -> SyncRepository:
+    """Get the sync repository with database session."""
+    return SyncRepository(db_session)
+
+def get_categorization_rule_repository(
+    db_session: AsyncSession = Depends(get_db_session)
+) -> CategorizationRuleRepository:
+    """Get the categorization rule repository with database session."""
+    return CategorizationRuleRepository(db_session)
+
+def get_search_repository(
+    db_session: AsyncSession = Depends(get_db_session)
+) -> SearchRepository:
+    """Get the search repository with database session."""
+    return SearchRepository(db_session)
+
 def get_goal_repository(
     db_session: AsyncSession = Depends(get_db_session)
 ) -> GoalRepository:
@@ -63,8 +87,8 @@ def get_asset_service(
 def get_liability_service(
     liability_repository: LiabilityRepository = Depends(get_liability_repository)
 ) -> LiabilityService:
-    """Get the liability service with database repository."""
-    return LiabilityService(liability_repository)
+    """Get the liability service with database repository and the result cache."""
+    return LiabilityService(liability_repository, get_fi_cache())
 
 def get_expense_service(
     expense_repository: ExpenseRepository = Depends(get_expense_repository)
@@ -78,12 +102,40 @@ def get_goal_service(
     """Get the goal service with database repository."""
     return GoalService(goal_repository)
 
-def get_fi_service(
-    asset_service: AssetService = Depends(get_asset_service),
-    liability_service: LiabilityService = Depends(get_liability_service)
-) -> FIService:
-    """Get the FI service with injected dependencies."""
-    return FIService(asset_service, liability_service)
+def get_categorization_service(
+    rule_repository: CategorizationRuleRepository = Depends(get_categorization_rule_repository),
+    expense_repository: ExpenseRepository = Depends(get_expense_repository)
+) -> CategorizationService:
+    """Get the categorization service with database repositories and the compiled rule cache."""
+    return CategorizationService(rule_repository, expense_repository, get_rule_cache())
+
+def get_search_service(
+    search_repository: SearchRepository = Depends(get_search_repository)
+) -> SearchService:
+    """Get the search service with database repository."""
+    return SearchService(search_repository)
+
+def get_fi_service() -> FIService:
+    """Get the FI service. It opens its own sessions, one per concurrent read, and caches results per data version."""
+    return FIService(cache=get_fi_cache())
+
+def get_dashboard_service() -> DashboardService:
+    """Get the dashboard service. It opens its own sessions, one per concurrent query."""
+    return DashboardService()
+
+def get_sync_service(
+    asset_repository: AssetRepository = Depends(get_asset_repository),
+    liability_repository: LiabilityRepository = Depends(get_liability_repository),
+    expense_repository: ExpenseRepository = Depends(get_expense_repository),
+    goal_repository: GoalRepository = Depends(get_goal_repository),
+    sync_repository: SyncRepository = Depends(get_sync_repository)
+) -> SyncService:
+    """Get the sync service with database repositories."""
+    return SyncService(asset_repository, liability_repository, expense_repository, goal_repository, sync_repository)
+
+def get_export_service() -> ExportService:
+    """Get the export service. It opens its own session while the response streams."""
+    return ExportService()
 
 # Legacy services with static data manager (for backward compatibility during migration)
 def get_legacy_asset_service(
@@ -0,0 +1,6 @@
+from pydantic import BaseModel, Field
+from typing import List
+
+class BulkCreateResult(BaseModel):
+    created_count: int = Field(..., ge=0, description="Number of records created.")
+    ids: List[str] = Field(..., description="IDs of the created records, in request order.")
@@ -0,0 +1,14 @@
+from pydantic import BaseModel, Field
+from typing import Any, Dict, List, Optional
+from .asset_models import AssetOut
+from .liability_models import LiabilityOut
+from .expense_models import ExpenseOut
+from .goal_models import GoalOut
+
+class DashboardData(BaseModel):
+    assets: List[AssetOut]
+    liabilities: List[LiabilityOut]
+    expenses: List[ExpenseOut]
+    goals: List[GoalOut]
+    nextCursors: Dict[str, Optional[str]] = Field(..., description="Per list, the `after` cursor of its next page on the list endpoint, or null when the list is complete.")
+    summary: Dict[str, Any] = Field(..., description="Same payload as GET /fi/summary.")
@@ -1,5 +1,5 @@
 from pydantic import BaseModel, field_validator, Field
-from typing import Optional
+from typing import Dict, List, Optional
 from ..config import get_settings
 
 settings = get_settings()
@@ -61,3 +61,41 @@ class ExpenseIn(ExpenseBase):
 
 class ExpenseOut(ExpenseBase):
     id: str
+
+class ExpenseImportMapping(BaseModel):
+    dateColumn: str = Field("Date", description="CSV column holding the transaction date.")
+    amountColumn: str = Field("Amount", description="CSV column holding the debit amount.")
+    detailsColumn: Optional[str] = Field("Description", description="CSV column holding the narration, if any.")
+    categoryColumn: Optional[str] = Field(None, description="CSV column holding the category, if any.")
+    dateFormat: str = Field("%Y-%m-%d", description="strptime format of the date column.")
+    category: str = Field("Other", description="Category for rows without one.")
+    frequency: str = Field("One-Time", description="Frequency given to every imported expense.")
+    needWant: str = Field("Need", description="Need/Want given to every imported expense.")
+
+    # Checked once here so a bad value rejects the request instead of every row
+    category_not_empty = field_validator('category')(ExpenseBase.category_not_empty.__func__)
+    validate_frequency = field_validator('frequency')(ExpenseBase.validate_frequency.__func__)
+    validate_need_want = field_validator('needWant')(ExpenseBase.validate_need_want.__func__)
+
+class ExpenseImportError(BaseModel):
+    row: int = Field(..., description="CSV record number, counting the header as 1.")
+    error: str
+
+class ExpenseImportResult(BaseModel):
+    importedCount: int = Field(..., ge=0, description="Number of expenses created.")
+    skippedCount: int = Field(..., ge=0, description="Rows with an empty amount or a credit marked Cr or in parentheses.")
+    duplicateCount: int = Field(..., ge=0, description="Rows already imported before, left out.")
+    errorCount: int = Field(..., ge=0, description="Rows rejected by validation.")
+    errors: List[ExpenseImportError] = Field(..., description="The first rejected rows and why, up to a fixed limit.")
+
+class AnnualizedExpenseGroup(BaseModel):
+    category: str
+    needWant: str
+    annualAmount: float = Field(..., description="Yearly run-rate: amount times occurrences per year of its frequency.")
+    expenseCount: int
+
+class AnnualizedExpenses(BaseModel):
+    totalAnnualAmount: float = Field(..., description="Yearly run-rate of all expenses; one-time expenses count once.")
+    byCategory: Dict[str, float] = Field(..., description="Yearly run-rate per category, largest first.")
+    byNeedWant: Dict[str, float] = Field(..., description="Yearly run-rate of Needs and of Wants.")
+    groups: List[AnnualizedExpenseGroup] = Field(..., description="Yearly run-rate per category and need/want, largest first.")
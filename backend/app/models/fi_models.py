@@ -1,5 +1,8 @@
-from pydantic import BaseModel
-from typing import List, Optional, Union
+from pydantic import BaseModel, Field, field_validator, model_validator
+from typing import Dict, List, Optional, Union
+from ..config import get_settings
+
+settings = get_settings()
 
 # Asset and Liability models are now imported from their respective service/model files
 # and are not redefined here. The FI service will use those directly.
@@ -11,14 +14,23 @@ class Goal(BaseModel):
     isEssentialForFI: Optional[bool] = True
     # Add other goal fields as necessary
 
-class UserFIParameters(BaseModel):
-    desired_annual_fi_expenses: float
-    swr_percentage: float
+class FIPortfolioParameters(BaseModel):
+    """Adjustments applied to the portfolio before comparing it against the FI target."""
     emergency_fund_to_exclude: Optional[float] = 0.0
     primary_residence_equity_to_exclude: Optional[float] = 0.0
-    fp_asset_classes_for_investable: Optional[List[str]] = ["Retirement", "General Investment"]
+    fp_asset_classes_for_investable: Optional[List[str]] = Field(
+        default_factory=lambda: list(settings.DEFAULT_FP_ASSET_CLASSES_FOR_INVESTABLE),
+        description="FP asset classes counted towards the investable FI corpus."
+    )
+    goals_inflation_percentage: Optional[float] = Field(
+        0.0, ge=0, description="Annual inflation applied to open goals up to their target year."
+    )
     # current_year: Optional[int] # Not used in current calculation logic directly
 
+class UserFIParameters(FIPortfolioParameters):
+    desired_annual_fi_expenses: float
+    swr_percentage: float
+
 class FIDetails(BaseModel):
     net_investable_assets: float
     total_current_cost_of_goals_to_set_aside: float
@@ -34,4 +46,110 @@ class FinancialIndependenceResult(BaseModel):
 
 # Model for the request body - only UserFIParameters are needed from the client
 class FIRequestData(BaseModel):
-    user_fi_parameters: UserFIParameters 
\ No newline at end of file
+    user_fi_parameters: UserFIParameters
+
+
+class FIRange(BaseModel):
+    start: float
+    stop: float
+    steps: int = Field(..., ge=1, le=settings.MAX_FI_GRID_STEPS, description="Number of evenly spaced values from start to stop, inclusive.")
+
+class FIScenarioGrid(FIPortfolioParameters):
+    swr_percentage: FIRange
+    desired_annual_fi_expenses: FIRange
+
+class FIScenarioRequest(BaseModel):
+    scenarios: Optional[List[UserFIParameters]] = Field(None, min_length=1, max_length=settings.MAX_FI_SCENARIOS)
+    grid: Optional[FIScenarioGrid] = None
+
+    @model_validator(mode='after')
+    def validate_exactly_one_mode(self):
+        if (self.scenarios is None) == (self.grid is None):
+            raise ValueError("Provide exactly one of 'scenarios' or 'grid'.")
+        return self
+
+class FIScenarioList(BaseModel):
+    """Results aligned with the requested scenarios. required_fi_corpus is null where SWR is not positive."""
+    is_financially_independent: List[bool]
+    fi_ratio_percentage: List[float]
+    net_fi_corpus_available: List[float]
+    required_fi_corpus: List[Optional[float]]
+
+class FIScenarioMatrix(BaseModel):
+    """Results with one row per SWR value and one column per annual expense value."""
+    swr_percentages: List[float]
+    annual_expenses: List[float]
+    net_fi_corpus_available: float
+    required_fi_corpus: List[List[Optional[float]]]
+    fi_ratio_percentage: List[List[float]]
+    is_financially_independent: List[List[bool]]
+
+class AssetClassAssumption(BaseModel):
+    expected_return_percentage: float = Field(..., gt=-100, description="Expected annual return in percent.")
+    volatility_percentage: float = Field(..., ge=0, description="Annual volatility (standard deviation) in percent.")
+
+class MonteCarloRequest(BaseModel):
+    user_fi_parameters: UserFIParameters
+    years: int = Field(50, ge=1, le=settings.MONTE_CARLO_MAX_YEARS, description="Length of retirement to simulate.")
+    num_paths: int = Field(10000, ge=100, le=settings.MONTE_CARLO_MAX_PATHS, description="Number of simulated paths.")
+    inflation_percentage: float = Field(settings.DEFAULT_INFLATION_PERCENTAGE, ge=0, description="Annual growth of withdrawals.")
+    asset_class_assumptions: Optional[Dict[str, AssetClassAssumption]] = Field(
+        None, description="Overrides of the default return assumptions, keyed by asset class."
+    )
+    percentiles: List[float] = Field([5, 25, 50, 75, 95], min_length=1, description="Corpus percentile bands to return.")
+    seed: Optional[int] = Field(None, ge=0, description="Seed for reproducible simulations.")
+    use_process_pool: bool = Field(False, description="Split the paths across worker processes.")
+
+    @field_validator('asset_class_assumptions')
+    @classmethod
+    def validate_asset_classes(cls, value: Optional[Dict[str, AssetClassAssumption]]):
+        if value is not None:
+            unknown = [asset_class for asset_class in value if asset_class not in settings.ALLOWED_ASSET_CLASSES]
+            if unknown:
+                raise ValueError(f"Invalid asset class. Allowed values are: {', '.join(settings.ALLOWED_ASSET_CLASSES)}")
+        return value
+
+    @field_validator('percentiles')
+    @classmethod
+    def validate_percentiles(cls, value: List[float]):
+        if any(not 0 <= percentile <= 100 for percentile in value):
+            raise ValueError("Percentiles must be between 0 and 100.")
+        return value
+
+class MonteCarloResult(BaseModel):
+    success_probability_percentage: float
+    num_paths: int
+    years: int
+    starting_corpus: float
+    annual_withdrawal: float
+    portfolio_expected_return_percentage: float
+    portfolio_volatility_percentage: float
+    percentiles: List[float]
+    corpus_percentiles: List[List[float]] # One row per percentile, one column per year starting today
+
+class FIProjectionRequest(BaseModel):
+    user_fi_parameters: UserFIParameters
+    monthly_savings: List[float] = Field(
+        ..., min_length=1, max_length=settings.MAX_PROJECTION_SERIES, description="Monthly savings amounts to project, one trajectory each."
+    )
+    expected_annual_return_percentage: float = Field(..., gt=-100, description="Expected annual return on the corpus in percent.")
+    max_years: int = Field(50, ge=1, le=settings.MAX_PROJECTION_YEARS, description="Length of the projection.")
+
+    @field_validator('monthly_savings')
+    @classmethod
+    def validate_monthly_savings(cls, value: List[float]):
+        if any(amount < 0 for amount in value):
+            raise ValueError("Monthly savings cannot be negative.")
+        return value
+
+class FIProjectionSeries(BaseModel):
+    monthly_savings: float
+    months_to_fi: Optional[int] # None if FI is not reached within the projection
+    fi_date: Optional[str] # First day of the month in which FI is reached (YYYY-MM-DD)
+    corpus: List[float] # Month-end corpus, starting with the current corpus
+
+class FIProjectionResult(BaseModel):
+    starting_corpus: float
+    required_fi_corpus: Union[float, str] # Can be float or "N/A"
+    months: int
+    projections: List[FIProjectionSeries]
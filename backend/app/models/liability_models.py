@@ -1,5 +1,5 @@
 from pydantic import BaseModel, field_validator, Field
-from typing import Optional
+from typing import List, Optional
 import re
 
 class LiabilityBase(BaseModel):
@@ -47,3 +47,44 @@ class LiabilityIn(LiabilityBase):
 
 class LiabilityOut(LiabilityBase):
     id: str
+
+class LiabilitySchedule(BaseModel):
+    id: str
+    name: str
+    outstandingAmountINR: float
+    interestRate: float
+    emi: float
+    monthsRemaining: int
+    payoffDate: str
+    totalInterestRemaining: float
+
+class AmortizationSummary(BaseModel):
+    totalOutstandingINR: float
+    totalInterestRemaining: float
+    currentMonthlyDebtService: float
+    monthsToDebtFree: int
+    debtFreeDate: Optional[str]
+    monthlyDebtService: List[float] # Total instalments due in each coming month
+    monthlyInterest: List[float] # Interest part of those instalments
+    liabilities: List[LiabilitySchedule]
+    revolvingLiabilityIds: List[str] # Liabilities without a due date, amortized at the assumed minimum payment
+
+class PayoffStrategyRequest(BaseModel):
+    extraMonthlyPayment: float = Field(..., ge=0, description="Monthly amount paid on top of the EMIs.")
+    customOrder: Optional[List[str]] = Field(None, description="Liability IDs to pay off first, in order, for the custom strategy.")
+
+class PayoffStrategyResult(BaseModel):
+    strategy: str
+    monthsToDebtFree: int
+    debtFreeDate: Optional[str]
+    totalInterest: float
+    interestSaved: float
+    payoffOrder: List[str] # Liability IDs in the order they are paid off
+
+class PayoffComparison(BaseModel):
+    extraMonthlyPayment: float
+    # Same budget and rollover as the strategies, without the extra payment or a target order
+    baselineMonthsToDebtFree: int
+    baselineTotalInterest: float
+    strategies: List[PayoffStrategyResult]
+    revolvingLiabilityIds: List[str] # Liabilities without a due date, paid at the assumed minimum payment
@@ -0,0 +1,46 @@
+from pydantic import BaseModel, field_validator, Field
+from typing import Optional
+from ..config import get_settings
+
+settings = get_settings()
+
+class CategorizationRuleBase(BaseModel):
+    keyword: str = Field(..., min_length=1, description="Text to look for in expense details; matching ignores case and extra whitespace.")
+    category: str = Field(..., min_length=1, description="Category given to matching expenses.")
+    needWant: Optional[str] = Field(None, description="Need or Want given to matching expenses; omit to leave it unchanged.")
+
+    @field_validator('keyword')
+    @classmethod
+    def normalize_keyword(cls, value: str):
+        # Stored the way rule_engine.normalize_text normalizes the details it is matched against
+        normalized = " ".join(value.split()).casefold()
+        if not normalized:
+            raise ValueError("Keyword cannot be empty or just whitespace.")
+        return normalized
+
+    @field_validator('category')
+    @classmethod
+    def category_not_empty(cls, value: str):
+        if not value.strip():
+            raise ValueError("Category cannot be empty or just whitespace.")
+        return value.strip()
+
+    @field_validator('needWant')
+    @classmethod
+    def validate_need_want(cls, value: Optional[str]):
+        if value is None:
+            return value
+        stripped_value = value.strip()
+        if stripped_value not in settings.ALLOWED_NEED_WANT_CATEGORIES:
+            raise ValueError(f"Invalid needWant value. Allowed values are: {', '.join(settings.ALLOWED_NEED_WANT_CATEGORIES)}")
+        return stripped_value
+
+class CategorizationRuleIn(CategorizationRuleBase):
+    pass
+
+class CategorizationRuleOut(CategorizationRuleBase):
+    id: str
+
+class RecategorizeResult(BaseModel):
+    scannedCount: int = Field(..., ge=0, description="Expenses checked against the rules.")
+    updatedCount: int = Field(..., ge=0, description="Expenses whose category or need/want changed.")
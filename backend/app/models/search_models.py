@@ -0,0 +1,8 @@
+from pydantic import BaseModel, Field
+
+class SearchHit(BaseModel):
+    resource: str = Field(..., description="expenses, goals or assets.")
+    id: str = Field(..., description="ID of the matching record.")
+    title: str = Field(..., description="Expense category, goal name or asset name.")
+    snippet: str = Field(..., description="Matching text with the matched terms in [brackets].")
+    score: float = Field(..., description="Relevance; higher is better.")
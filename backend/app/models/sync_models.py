@@ -0,0 +1,20 @@
+from pydantic import BaseModel, Field
+from typing import List
+from .asset_models import AssetOut
+from .liability_models import LiabilityOut
+from .expense_models import ExpenseOut
+from .goal_models import GoalOut
+
+class SyncDeletions(BaseModel):
+    assets: List[str]
+    liabilities: List[str]
+    expenses: List[str]
+    goals: List[str]
+
+class SyncResult(BaseModel):
+    watermark: str = Field(..., description="Pass as `since` on the next sync. Changes near it may be returned twice; apply them idempotently.")
+    assets: List[AssetOut]
+    liabilities: List[LiabilityOut]
+    expenses: List[ExpenseOut]
+    goals: List[GoalOut]
+    deleted: SyncDeletions = Field(..., description="IDs deleted since the watermark. Apply them before the changed rows, since an ID can be reused.")
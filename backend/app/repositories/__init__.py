@@ -4,6 +4,10 @@ from .asset_repository import AssetRepository
 from .liability_repository import LiabilityRepository
 from .expense_repository import ExpenseRepository
 from .goal_repository import GoalRepository
+from .data_version_repository import DataVersionRepository
+from .sync_repository import SyncRepository
+from .categorization_rule_repository import CategorizationRuleRepository
+from .search_repository import SearchRepository
 
 __all__ = [
     "BaseRepository",
@@ -11,5 +15,9 @@ __all__ = [
     "AssetRepository",
     "LiabilityRepository",
     "ExpenseRepository",
-    "GoalRepository"
+    "GoalRepository",
+    "DataVersionRepository",
+    "SyncRepository",
+    "CategorizationRuleRepository",
+    "SearchRepository"
 ]
@@ -1,19 +1,90 @@
-from typing import List, Optional, Dict, Any
+from datetime import datetime
+from typing import AsyncIterator, List, Optional, Dict, Any, Tuple, Sequence
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, insert, update, delete, func, cast, String, Row, Select, literal
 from .base_repository import BaseRepository
 from ..db_models import Asset
+from ..utils.converters import to_db_timestamp
+
+# API fields in response order, read without ORM hydration. IDs and dates are
+# cast to text in SQL so rows match the response models as they come back.
+_ASSET_API_COLUMNS = (
+    cast(Asset.id, String).label("id"),
+    Asset.name,
+    Asset.value_inr.label("valueINR"),
+    Asset.asset_class.label("assetClass"),
+    Asset.asset_type.label("assetType"),
+    Asset.fp_asset_class.label("fpAssetClass")
+)
 
 class AssetRepository(BaseRepository):
     """Repository for asset operations."""
     
-    async def get_all(self, user_id: int = 1) -> List[Asset]:
-        """Get all assets for a user."""
-        result = await self.db.execute(
-            select(Asset).where(Asset.user_id == user_id)
-        )
+    resource = "assets"
+    api_fields = tuple(column.key for column in _ASSET_API_COLUMNS)
+    
+    def _list_query(
+        self,
+        query: Select,
+        user_id: int,
+        limit: Optional[int],
+        after: Optional[int],
+        asset_class: Optional[str],
+        fp_asset_class: Optional[str]
+    ) -> Select:
+        """Add the user, filter, keyset and ordering clauses shared by the list reads."""
+        query = query.where(Asset.user_id == user_id)
+        if asset_class is not None:
+            query = query.where(Asset.asset_class == asset_class)
+        if fp_asset_class is not None:
+            query = query.where(Asset.fp_asset_class == fp_asset_class)
+        if after is not None:
+            query = query.where(Asset.id > after)
+        query = query.order_by(Asset.id)
+        if limit is not None:
+            query = query.limit(limit)
+        return query
+    
+    async def get_all(
+        self,
+        user_id: int = 1,
+        limit: Optional[int] = None,
+        after: Optional[int] = None,
+        asset_class: Optional[str] = None,
+        fp_asset_class: Optional[str] = None
+    ) -> List[Asset]:
+        """Get assets for a user ordered by id, optionally filtered and keyset-paginated."""
+        query = self._list_query(select(Asset), user_id, limit, after, asset_class, fp_asset_class)
+        result = await self.db.execute(query)
         return list(result.scalars().all())
     
+    async def get_all_rows(
+        self,
+        user_id: int = 1,
+        limit: Optional[int] = None,
+        after: Optional[int] = None,
+        asset_class: Optional[str] = None,
+        fp_asset_class: Optional[str] = None
+    ) -> List[Row]:
+        """Same as get_all, but returns plain rows of the API fields without building ORM objects."""
+        query = self._list_query(select(*_ASSET_API_COLUMNS), user_id, limit, after, asset_class, fp_asset_class)
+        result = await self.db.execute(query)
+        return list(result.all())
+    
+    async def get_changed_rows(self, user_id: int = 1, since: Optional[datetime] = None) -> List[Row]:
+        """API-field rows created or updated at or after `since` (every row when omitted), oldest change first."""
+        query = select(*_ASSET_API_COLUMNS).where(Asset.user_id == user_id)
+        if since is not None:
+            # Range scan on ix_assets_user_id_updated_at; the bound is formatted like the stored timestamps
+            query = query.where(Asset.updated_at >= literal(to_db_timestamp(since), String))
+        result = await self.db.execute(query.order_by(Asset.updated_at, Asset.id))
+        return list(result.all())
+    
+    def stream_rows(self, user_id: int = 1, chunk_size: int = 1000) -> AsyncIterator[Sequence[Row]]:
+        """Every API-field row for a user in list order, yielded in chunks of `chunk_size` rows."""
+        query = self._list_query(select(*_ASSET_API_COLUMNS), user_id, None, None, None, None)
+        return self._stream_row_chunks(query, chunk_size)
+    
     async def get_by_id(self, asset_id: int, user_id: int = 1) -> Optional[Asset]:
         """Get asset by ID for a specific user."""
         result = await self.db.execute(
@@ -24,10 +95,9 @@ class AssetRepository(BaseRepository):
         )
         return result.scalar_one_or_none()
     
-    async def create(self, asset_data: Dict[str, Any], user_id: int = 1) -> Asset:
-        """Create new asset."""
-        # Convert field names to match database schema
-        db_data = {
+    def _to_db_data(self, asset_data: Dict[str, Any], user_id: int) -> Dict[str, Any]:
+        """Convert API field names to match database schema."""
+        return {
             "user_id": user_id,
             "name": asset_data["name"],
             "value_inr": asset_data["valueINR"],
@@ -35,40 +105,86 @@ class AssetRepository(BaseRepository):
             "asset_type": asset_data["assetType"],
             "fp_asset_class": asset_data["fpAssetClass"]
         }
-        asset = Asset(**db_data)
+    
+    async def get_total_value(self, user_id: int = 1, fp_asset_classes: Optional[List[str]] = None) -> float:
+        """Get total value of a user's assets, optionally restricted to the given FP asset classes."""
+        query = select(func.coalesce(func.sum(Asset.value_inr), 0.0)).where(Asset.user_id == user_id)
+        if fp_asset_classes is not None:
+            query = query.where(Asset.fp_asset_class.in_(fp_asset_classes))
+        result = await self.db.execute(query)
+        return result.scalar_one()
+    
+    async def get_value_by_class(self, user_id: int = 1, fp_asset_classes: Optional[List[str]] = None) -> Dict[str, Tuple[float, int]]:
+        """Get total value and count of a user's assets grouped by asset class, optionally restricted to FP asset classes."""
+        query = select(Asset.asset_class, func.sum(Asset.value_inr), func.count()).where(Asset.user_id == user_id)
+        if fp_asset_classes is not None:
+            query = query.where(Asset.fp_asset_class.in_(fp_asset_classes))
+        result = await self.db.execute(query.group_by(Asset.asset_class))
+        return {asset_class: (total, count) for asset_class, total, count in result.all()}
+    
+    async def create(self, asset_data: Dict[str, Any], user_id: int = 1) -> Asset:
+        """Create new asset."""
+        asset = Asset(**self._to_db_data(asset_data, user_id))
         self.db.add(asset)
+        await self._bump_data_version(user_id)
         await self.db.commit()
         await self.db.refresh(asset)
         return asset
     
+    async def create_many(self, assets_data: List[Dict[str, Any]], user_id: int = 1) -> List[int]:
+        """Create many assets in a single transaction and return their generated IDs."""
+        if not assets_data:
+            return []
+        result = await self.db.execute(
+            insert(Asset).returning(Asset.id, sort_by_parameter_order=True),
+            [self._to_db_data(asset_data, user_id) for asset_data in assets_data]
+        )
+        ids = list(result.scalars().all())
+        await self._bump_data_version(user_id)
+        await self.db.commit()
+        return ids
+    
     async def update(self, asset_id: int, asset_data: Dict[str, Any], user_id: int = 1) -> Optional[Asset]:
-        """Update existing asset."""
-        asset = await self.get_by_id(asset_id, user_id)
-        if not asset:
-            return None
-        
+        """Update existing asset with a single UPDATE ... RETURNING statement."""
         # Convert field names to match database schema
+        values: Dict[str, Any] = {}
         if "name" in asset_data:
-            asset.name = asset_data["name"]
+            values["name"] = asset_data["name"]
         if "valueINR" in asset_data:
-            asset.value_inr = asset_data["valueINR"]
+            values["value_inr"] = asset_data["valueINR"]
         if "assetClass" in asset_data:
-            asset.asset_class = asset_data["assetClass"]
+            values["asset_class"] = asset_data["assetClass"]
         if "assetType" in asset_data:
-            asset.asset_type = asset_data["assetType"]
+            values["asset_type"] = asset_data["assetType"]
         if "fpAssetClass" in asset_data:
-            asset.fp_asset_class = asset_data["fpAssetClass"]
+            values["fp_asset_class"] = asset_data["fpAssetClass"]
+        if not values:
+            return await self.get_by_id(asset_id, user_id)
         
+        result = await self.db.execute(
+            update(Asset)
+            .where(Asset.id == asset_id, Asset.user_id == user_id)
+            .values(**values)
+            .returning(Asset)
+            .execution_options(synchronize_session=False, populate_existing=True)
+        )
+        asset = result.scalar_one_or_none()
+        if asset is not None:
+            await self._bump_data_version(user_id)
         await self.db.commit()
-        await self.db.refresh(asset)
         return asset
     
     async def delete(self, asset_id: int, user_id: int = 1) -> bool:
-        """Delete asset by ID."""
-        asset = await self.get_by_id(asset_id, user_id)
-        if not asset:
-            return False
-        
-        await self.db.delete(asset)
+        """Delete asset by ID with a single DELETE ... RETURNING statement."""
+        result = await self.db.execute(
+            delete(Asset)
+            .where(Asset.id == asset_id, Asset.user_id == user_id)
+            .returning(Asset.id)
+            .execution_options(synchronize_session=False)
+        )
+        deleted = result.scalar_one_or_none() is not None
+        if deleted:
+            await self._bump_data_version(user_id)
+            await self._record_deletion(user_id, asset_id)
         await self.db.commit()
-        return True
+        return deleted
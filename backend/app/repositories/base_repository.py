@@ -1,13 +1,40 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional, Dict, Any
+from datetime import datetime
+from typing import AsyncIterator, List, Optional, Dict, Any, Sequence, Tuple
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import Row, Select
+from .data_version_repository import DataVersionRepository
+from .sync_repository import SyncRepository
 
 class BaseRepository(ABC):
     """Base repository interface for all entities."""
     
+    # Name under which writes to this entity bump the user's data version and are logged for sync
+    resource: str
+    # Column names of the API-field rows this repository returns, in order
+    api_fields: Tuple[str, ...]
+    
     def __init__(self, db_session: AsyncSession):
         self.db = db_session
     
+    async def get_data_version(self, user_id: int = 1) -> int:
+        """Current data version of this entity for a user, read without loading any rows."""
+        return await DataVersionRepository(self.db).get_version(user_id, [self.resource])
+    
+    async def _bump_data_version(self, user_id: int) -> None:
+        """Record a write to this entity; call before the write's commit so both land together."""
+        await DataVersionRepository(self.db).bump(user_id, self.resource)
+    
+    async def _record_deletion(self, user_id: int, entity_id: int) -> None:
+        """Log a tombstone for delta sync; call before the delete's commit so both land together."""
+        await SyncRepository(self.db).record_deletion(user_id, self.resource, entity_id)
+    
+    async def _stream_row_chunks(self, query: Select, chunk_size: int) -> AsyncIterator[Sequence[Row]]:
+        """Yield the rows of `query` in chunks fetched from the cursor as they are consumed, never all at once."""
+        result = await self.db.stream(query.execution_options(yield_per=chunk_size))
+        async for chunk in result.partitions():
+            yield chunk
+    
     @abstractmethod
     async def get_all(self, user_id: int = 1) -> List[Any]:
         pass
@@ -20,6 +47,10 @@ class BaseRepository(ABC):
     async def create(self, entity_data: Dict[str, Any], user_id: int = 1) -> Any:
         pass
     
+    @abstractmethod
+    async def create_many(self, entities_data: List[Dict[str, Any]], user_id: int = 1) -> List[int]:
+        pass
+    
     @abstractmethod
     async def update(self, entity_id: int, entity_data: Dict[str, Any], user_id: int = 1) -> Optional[Any]:
         pass
@@ -27,3 +58,11 @@ class BaseRepository(ABC):
     @abstractmethod
     async def delete(self, entity_id: int, user_id: int = 1) -> bool:
         pass
+    
+    @abstractmethod
+    async def get_changed_rows(self, user_id: int = 1, since: Optional[datetime] = None) -> List[Row]:
+        pass
+    
+    @abstractmethod
+    def stream_rows(self, user_id: int = 1, chunk_size: int = 1000) -> AsyncIterator[Sequence[Row]]:
+        pass
@@ -0,0 +1,87 @@
+from typing import Any, Dict, List, Optional
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, update, delete
+from sqlalchemy.dialects.sqlite import insert
+from sqlalchemy.exc import IntegrityError
+from .data_version_repository import DataVersionRepository
+from ..db_models import CategorizationRule
+
+class CategorizationRuleRepository:
+    """Repository for expense categorization rules."""
+    
+    # Name under which rule writes bump the user's data version
+    resource = "categorization_rules"
+    
+    def __init__(self, db_session: AsyncSession):
+        self.db = db_session
+    
+    async def get_data_version(self, user_id: int = 1) -> int:
+        """Current version of a user's rule set."""
+        return await DataVersionRepository(self.db).get_version(user_id, [self.resource])
+    
+    async def get_all(self, user_id: int = 1) -> List[CategorizationRule]:
+        """Get all rules for a user ordered by keyword."""
+        result = await self.db.execute(
+            select(CategorizationRule)
+            .where(CategorizationRule.user_id == user_id)
+            .order_by(CategorizationRule.keyword)
+        )
+        return list(result.scalars().all())
+    
+    def _to_db_data(self, rule_data: Dict[str, Any], user_id: int) -> Dict[str, Any]:
+        """Convert API field names to match database schema."""
+        return {
+            "user_id": user_id,
+            "keyword": rule_data["keyword"],
+            "category": rule_data["category"],
+            "need_want": rule_data.get("needWant")
+        }
+    
+    async def create(self, rule_data: Dict[str, Any], user_id: int = 1) -> Optional[CategorizationRule]:
+        """Create a rule; None if the user already has a rule for the keyword."""
+        result = await self.db.execute(
+            insert(CategorizationRule)
+            .values(**self._to_db_data(rule_data, user_id))
+            .on_conflict_do_nothing(index_elements=[CategorizationRule.user_id, CategorizationRule.keyword])
+            .returning(CategorizationRule)
+        )
+        rule = result.scalar_one_or_none()
+        if rule is not None:
+            await DataVersionRepository(self.db).bump(user_id, self.resource)
+        await self.db.commit()
+        return rule
+    
+    async def update(self, rule_id: int, rule_data: Dict[str, Any], user_id: int = 1) -> Optional[CategorizationRule]:
+        """Replace a rule with a single UPDATE ... RETURNING statement. Raises ValueError if the keyword is taken by another rule."""
+        values = self._to_db_data(rule_data, user_id)
+        del values["user_id"]
+        try:
+            result = await self.db.execute(
+                update(CategorizationRule)
+                .where(CategorizationRule.id == rule_id, CategorizationRule.user_id == user_id)
+                .values(**values)
+                .returning(CategorizationRule)
+                .execution_options(synchronize_session=False, populate_existing=True)
+            )
+        except IntegrityError:
+            await self.db.rollback()
+            raise ValueError(f"A rule for keyword '{rule_data['keyword']}' already exists.")
+        rule = result.scalar_one_or_none()
+        if rule is not None:
+            await DataVersionRepository(self.db).bump(user_id, self.resource)
+        await self.db.commit()
+        return rule
+    
+    async def delete(self, rule_id: int, user_id: int = 1) -> bool:
+        """Delete a rule by ID with a single DELETE ... RETURNING statement."""
+        result = await self.db.execute(
+            delete(CategorizationRule)
+            .where(CategorizationRule.id == rule_id, CategorizationRule.user_id == user_id)
+            .returning(CategorizationRule.id)
+            .execution_options(synchronize_session=False)
+        )
+        deleted = result.scalar_one_or_none() is not None
+        if deleted:
+            await DataVersionRepository(self.db).bump(user_id, self.resource)
+        await self.db.commit()
+        return deleted
@@ -0,0 +1,28 @@
+from typing import Iterable, Optional
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, func
+from sqlalchemy.dialects.sqlite import insert
+from ..db_models import DataVersion
+
+class DataVersionRepository:
+    """Repository for the per-user, per-resource data version counters."""
+    
+    def __init__(self, db_session: AsyncSession):
+        self.db = db_session
+    
+    async def bump(self, user_id: int, resource: str) -> None:
+        """Increment a resource's version as part of the caller's transaction (the caller commits)."""
+        statement = insert(DataVersion).values(user_id=user_id, resource=resource, version=1)
+        await self.db.execute(statement.on_conflict_do_update(
+            index_elements=[DataVersion.user_id, DataVersion.resource],
+            set_={"version": DataVersion.version + 1}
+        ))
+    
+    async def get_version(self, user_id: int, resources: Optional[Iterable[str]] = None) -> int:
+        """Combined version of the given resources (all resources when omitted); it grows with every write to any of them."""
+        query = select(func.coalesce(func.sum(DataVersion.version), 0)).where(DataVersion.user_id == user_id)
+        if resources is not None:
+            query = query.where(DataVersion.resource.in_(list(resources)))
+        result = await self.db.execute(query)
+        return int(result.scalar_one())
+
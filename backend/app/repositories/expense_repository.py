@@ -1,18 +1,149 @@
-from typing import List, Optional, Dict, Any
+from datetime import date, datetime
+from typing import AsyncIterator, List, Optional, Dict, Any, Tuple, Sequence
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, insert, update, delete, tuple_, literal, bindparam, case, func, Date, cast, String, Row, Select
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from .base_repository import BaseRepository
 from ..db_models import Expense
+from ..utils.converters import str_to_date, to_db_timestamp
+
+# API fields in response order, read without ORM hydration. IDs and dates are
+# cast to text in SQL so rows match the response models as they come back.
+_EXPENSE_API_COLUMNS = (
+    cast(Expense.id, String).label("id"),
+    Expense.category,
+    Expense.details,
+    Expense.amount,
+    Expense.frequency,
+    Expense.need_want.label("needWant"),
+    cast(Expense.date, String).label("date")
+)
 
 class ExpenseRepository(BaseRepository):
     """Repository for expense operations."""
     
-    async def get_all(self, user_id: int = 1) -> List[Expense]:
-        """Get all expenses for a user."""
+    resource = "expenses"
+    api_fields = tuple(column.key for column in _EXPENSE_API_COLUMNS)
+    
+    def _list_query(
+        self,
+        query: Select,
+        user_id: int,
+        limit: Optional[int],
+        after: Optional[Tuple[date, int]],
+        date_from: Optional[date],
+        date_to: Optional[date],
+        category: Optional[str],
+        need_want: Optional[str],
+        frequency: Optional[str]
+    ) -> Select:
+        """Add the user, filter, keyset and ordering clauses shared by the list reads."""
+        query = query.where(Expense.user_id == user_id)
+        if date_from is not None:
+            query = query.where(Expense.date >= date_from)
+        if date_to is not None:
+            query = query.where(Expense.date <= date_to)
+        if category is not None:
+            query = query.where(Expense.category == category)
+        if need_want is not None:
+            query = query.where(Expense.need_want == need_want)
+        if frequency is not None:
+            query = query.where(Expense.frequency == frequency)
+        if after is not None:
+            # Row-value comparison keeps the page a range scan on ix_expenses_user_id_date_id
+            query = query.where(tuple_(Expense.date, Expense.id) > tuple_(literal(after[0], Date), literal(after[1])))
+        query = query.order_by(Expense.date, Expense.id)
+        if limit is not None:
+            query = query.limit(limit)
+        return query
+    
+    async def get_all(
+        self,
+        user_id: int = 1,
+        limit: Optional[int] = None,
+        after: Optional[Tuple[date, int]] = None,
+        date_from: Optional[date] = None,
+        date_to: Optional[date] = None,
+        category: Optional[str] = None,
+        need_want: Optional[str] = None,
+        frequency: Optional[str] = None
+    ) -> List[Expense]:
+        """Get expenses for a user ordered by (date, id), optionally filtered and keyset-paginated."""
+        query = self._list_query(select(Expense), user_id, limit, after, date_from, date_to, category, need_want, frequency)
+        result = await self.db.execute(query)
+        return list(result.scalars().all())
+    
+    async def get_all_rows(
+        self,
+        user_id: int = 1,
+        limit: Optional[int] = None,
+        after: Optional[Tuple[date, int]] = None,
+        date_from: Optional[date] = None,
+        date_to: Optional[date] = None,
+        category: Optional[str] = None,
+        need_want: Optional[str] = None,
+        frequency: Optional[str] = None
+    ) -> List[Row]:
+        """Same as get_all, but returns plain rows of the API fields without building ORM objects."""
+        query = self._list_query(select(*_EXPENSE_API_COLUMNS), user_id, limit, after, date_from, date_to, category, need_want, frequency)
+        result = await self.db.execute(query)
+        return list(result.all())
+    
+    async def get_changed_rows(self, user_id: int = 1, since: Optional[datetime] = None) -> List[Row]:
+        """API-field rows created or updated at or after `since` (every row when omitted), oldest change first."""
+        query = select(*_EXPENSE_API_COLUMNS).where(Expense.user_id == user_id)
+        if since is not None:
+            # Range scan on ix_expenses_user_id_updated_at; the bound is formatted like the stored timestamps
+            query = query.where(Expense.updated_at >= literal(to_db_timestamp(since), String))
+        result = await self.db.execute(query.order_by(Expense.updated_at, Expense.id))
+        return list(result.all())
+    
+    def stream_rows(self, user_id: int = 1, chunk_size: int = 1000) -> AsyncIterator[Sequence[Row]]:
+        """Every API-field row for a user in list order, yielded in chunks of `chunk_size` rows."""
+        query = self._list_query(select(*_EXPENSE_API_COLUMNS), user_id, None, None, None, None, None, None, None)
+        return self._stream_row_chunks(query, chunk_size)
+    
+    async def get_annualized_totals(self, multipliers: Dict[str, int], user_id: int = 1) -> List[Row]:
+        """(category, needWant, annualAmount, expenseCount) per category and need/want, annualizing amounts by frequency in SQL."""
+        # Frequencies missing from `multipliers` contribute nothing
+        annual_amount = func.sum(Expense.amount * case(multipliers, value=Expense.frequency, else_=0))
         result = await self.db.execute(
-            select(Expense).where(Expense.user_id == user_id)
+            select(
+                Expense.category,
+                Expense.need_want.label("needWant"),
+                func.coalesce(annual_amount, 0.0).label("annualAmount"),
+                func.count().label("expenseCount")
+            )
+            .where(Expense.user_id == user_id)
+            .group_by(Expense.category, Expense.need_want)
         )
-        return list(result.scalars().all())
+        return list(result.all())
+    
+    async def get_category_rows(self, user_id: int = 1, after_id: Optional[int] = None, limit: int = 1000) -> List[Row]:
+        """(id, details, category, need_want) rows in id order, one keyset page at a time."""
+        query = select(Expense.id, Expense.details, Expense.category, Expense.need_want).where(Expense.user_id == user_id)
+        if after_id is not None:
+            query = query.where(Expense.id > after_id)
+        result = await self.db.execute(query.order_by(Expense.id).limit(limit))
+        return list(result.all())
+    
+    async def update_categories(self, updates: List[Dict[str, Any]], user_id: int = 1) -> None:
+        """Set the category and need/want of many expenses ({"id", "category", "needWant"} dicts) in one transaction."""
+        if not updates:
+            return
+        # One executemany UPDATE on the table, rather than a statement and ORM load per expense
+        table = Expense.__table__
+        await self.db.execute(
+            update(table)
+            .where(table.c.id == bindparam("expense_id"), table.c.user_id == user_id)
+            .values(category=bindparam("new_category"), need_want=bindparam("new_need_want")),
+            [
+                {"expense_id": item["id"], "new_category": item["category"], "new_need_want": item["needWant"]}
+                for item in updates
+            ]
+        )
+        await self._bump_data_version(user_id)
+        await self.db.commit()
     
     async def get_by_id(self, expense_id: int, user_id: int = 1) -> Optional[Expense]:
         """Get expense by ID for a specific user."""
@@ -24,54 +155,101 @@ class ExpenseRepository(BaseRepository):
         )
         return result.scalar_one_or_none()
     
-    async def create(self, expense_data: Dict[str, Any], user_id: int = 1) -> Expense:
-        """Create new expense."""
-        # Convert field names to match database schema
-        db_data = {
+    def _to_db_data(self, expense_data: Dict[str, Any], user_id: int) -> Dict[str, Any]:
+        """Convert API field names to match database schema."""
+        return {
             "user_id": user_id,
             "category": expense_data["category"],
             "details": expense_data.get("details"),
             "amount": expense_data["amount"],
             "frequency": expense_data["frequency"],
             "need_want": expense_data["needWant"],
-            "date": expense_data["date"]
+            "date": str_to_date(expense_data["date"]),
+            "fingerprint": expense_data.get("fingerprint")
         }
-        expense = Expense(**db_data)
+    
+    async def create(self, expense_data: Dict[str, Any], user_id: int = 1) -> Expense:
+        """Create new expense."""
+        expense = Expense(**self._to_db_data(expense_data, user_id))
         self.db.add(expense)
+        await self._bump_data_version(user_id)
         await self.db.commit()
         await self.db.refresh(expense)
         return expense
     
+    async def create_many(self, expenses_data: List[Dict[str, Any]], user_id: int = 1) -> List[int]:
+        """Create many expenses in a single transaction and return their generated IDs."""
+        if not expenses_data:
+            return []
+        result = await self.db.execute(
+            insert(Expense).returning(Expense.id, sort_by_parameter_order=True),
+            [self._to_db_data(expense_data, user_id) for expense_data in expenses_data]
+        )
+        ids = list(result.scalars().all())
+        await self._bump_data_version(user_id)
+        await self.db.commit()
+        return ids
+    
+    async def create_many_skipping_duplicates(self, expenses_data: List[Dict[str, Any]], user_id: int = 1) -> List[int]:
+        """Create many fingerprinted expenses in one transaction, skipping fingerprints the user already has; returns the new IDs."""
+        if not expenses_data:
+            return []
+        # The unique (user_id, fingerprint) index does the duplicate lookup for every row in the batch
+        result = await self.db.execute(
+            sqlite_insert(Expense)
+            .on_conflict_do_nothing(index_elements=[Expense.user_id, Expense.fingerprint])
+            .returning(Expense.id),
+            [self._to_db_data(expense_data, user_id) for expense_data in expenses_data]
+        )
+        ids = sorted(result.scalars().all())
+        if ids:
+            await self._bump_data_version(user_id)
+        await self.db.commit()
+        return ids
+    
     async def update(self, expense_id: int, expense_data: Dict[str, Any], user_id: int = 1) -> Optional[Expense]:
-        """Update existing expense."""
-        expense = await self.get_by_id(expense_id, user_id)
-        if not expense:
-            return None
-        
+        """Update existing expense with a single UPDATE ... RETURNING statement."""
         # Convert field names to match database schema
+        values: Dict[str, Any] = {}
         if "category" in expense_data:
-            expense.category = expense_data["category"]
+            values["category"] = expense_data["category"]
         if "details" in expense_data:
-            expense.details = expense_data["details"]
+            values["details"] = expense_data["details"]
         if "amount" in expense_data:
-            expense.amount = expense_data["amount"]
+            values["amount"] = expense_data["amount"]
         if "frequency" in expense_data:
-            expense.frequency = expense_data["frequency"]
+            values["frequency"] = expense_data["frequency"]
         if "needWant" in expense_data:
-            expense.need_want = expense_data["needWant"]
+            values["need_want"] = expense_data["needWant"]
         if "date" in expense_data:
-            expense.date = expense_data["date"]
+            values["date"] = str_to_date(expense_data["date"])
+        if not values:
+            return await self.get_by_id(expense_id, user_id)
         
+        result = await self.db.execute(
+            update(Expense)
+            .where(Expense.id == expense_id, Expense.user_id == user_id)
+            .values(**values)
+            .returning(Expense)
+            .execution_options(synchronize_session=False, populate_existing=True)
+        )
+        expense = result.scalar_one_or_none()
+        if expense is not None:
+            await self._bump_data_version(user_id)
         await self.db.commit()
-        await self.db.refresh(expense)
         return expense
     
     async def delete(self, expense_id: int, user_id: int = 1) -> bool:
-        """Delete expense by ID."""
-        expense = await self.get_by_id(expense_id, user_id)
-        if not expense:
-            return False
-        
-        await self.db.delete(expense)
+        """Delete expense by ID with a single DELETE ... RETURNING statement."""
+        result = await self.db.execute(
+            delete(Expense)
+            .where(Expense.id == expense_id, Expense.user_id == user_id)
+            .returning(Expense.id)
+            .execution_options(synchronize_session=False)
+        )
+        deleted = result.scalar_one_or_none() is not None
+        if deleted:
+            await self._bump_data_version(user_id)
+            await self._record_deletion(user_id, expense_id)
         await self.db.commit()
-        return True
+        return deleted
@@ -1,19 +1,92 @@
-from typing import List, Optional, Dict, Any
+from datetime import date, datetime
+from typing import AsyncIterator, List, Optional, Dict, Any, Tuple, Sequence
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, insert, update, delete, tuple_, literal, Date, extract, func, cast, String, Row, Select
 from .base_repository import BaseRepository
 from ..db_models import Goal
+from ..utils.converters import str_to_date, to_db_timestamp
+
+# API fields in response order, read without ORM hydration. IDs and dates are
+# cast to text in SQL so rows match the response models as they come back.
+_GOAL_API_COLUMNS = (
+    cast(Goal.id, String).label("id"),
+    Goal.name,
+    Goal.target_amount.label("targetAmount"),
+    Goal.current_amount.label("currentAmount"),
+    cast(Goal.target_date, String).label("targetDate"),
+    Goal.priority,
+    Goal.category,
+    Goal.notes
+)
 
 class GoalRepository(BaseRepository):
     """Repository for goal operations."""
     
-    async def get_all(self, user_id: int = 1) -> List[Goal]:
-        """Get all goals for a user."""
-        result = await self.db.execute(
-            select(Goal).where(Goal.user_id == user_id)
-        )
+    resource = "goals"
+    api_fields = tuple(column.key for column in _GOAL_API_COLUMNS)
+    
+    def _list_query(
+        self,
+        query: Select,
+        user_id: int,
+        limit: Optional[int],
+        after: Optional[Tuple[date, int]],
+        category: Optional[str],
+        priority: Optional[str]
+    ) -> Select:
+        """Add the user, filter, keyset and ordering clauses shared by the list reads."""
+        query = query.where(Goal.user_id == user_id)
+        if category is not None:
+            query = query.where(Goal.category == category)
+        if priority is not None:
+            query = query.where(Goal.priority == priority)
+        if after is not None:
+            query = query.where(tuple_(Goal.target_date, Goal.id) > tuple_(literal(after[0], Date), literal(after[1])))
+        query = query.order_by(Goal.target_date, Goal.id)
+        if limit is not None:
+            query = query.limit(limit)
+        return query
+    
+    async def get_all(
+        self,
+        user_id: int = 1,
+        limit: Optional[int] = None,
+        after: Optional[Tuple[date, int]] = None,
+        category: Optional[str] = None,
+        priority: Optional[str] = None
+    ) -> List[Goal]:
+        """Get goals for a user ordered by (target_date, id), optionally filtered and keyset-paginated."""
+        query = self._list_query(select(Goal), user_id, limit, after, category, priority)
+        result = await self.db.execute(query)
         return list(result.scalars().all())
     
+    async def get_all_rows(
+        self,
+        user_id: int = 1,
+        limit: Optional[int] = None,
+        after: Optional[Tuple[date, int]] = None,
+        category: Optional[str] = None,
+        priority: Optional[str] = None
+    ) -> List[Row]:
+        """Same as get_all, but returns plain rows of the API fields without building ORM objects."""
+        query = self._list_query(select(*_GOAL_API_COLUMNS), user_id, limit, after, category, priority)
+        result = await self.db.execute(query)
+        return list(result.all())
+    
+    async def get_changed_rows(self, user_id: int = 1, since: Optional[datetime] = None) -> List[Row]:
+        """API-field rows created or updated at or after `since` (every row when omitted), oldest change first."""
+        query = select(*_GOAL_API_COLUMNS).where(Goal.user_id == user_id)
+        if since is not None:
+            # Range scan on ix_goals_user_id_updated_at; the bound is formatted like the stored timestamps
+            query = query.where(Goal.updated_at >= literal(to_db_timestamp(since), String))
+        result = await self.db.execute(query.order_by(Goal.updated_at, Goal.id))
+        return list(result.all())
+    
+    def stream_rows(self, user_id: int = 1, chunk_size: int = 1000) -> AsyncIterator[Sequence[Row]]:
+        """Every API-field row for a user in list order, yielded in chunks of `chunk_size` rows."""
+        query = self._list_query(select(*_GOAL_API_COLUMNS), user_id, None, None, None, None)
+        return self._stream_row_chunks(query, chunk_size)
+    
     async def get_by_id(self, goal_id: int, user_id: int = 1) -> Optional[Goal]:
         """Get goal by ID for a specific user."""
         result = await self.db.execute(
@@ -24,57 +97,96 @@ class GoalRepository(BaseRepository):
         )
         return result.scalar_one_or_none()
     
-    async def create(self, goal_data: Dict[str, Any], user_id: int = 1) -> Goal:
-        """Create new goal."""
-        # Convert field names to match database schema
-        db_data = {
+    async def get_open_amounts_by_year(self, user_id: int = 1) -> Dict[int, float]:
+        """Get the amount still needed for unfinished goals, grouped by target year."""
+        target_year = extract("year", Goal.target_date)
+        result = await self.db.execute(
+            select(target_year, func.sum(Goal.target_amount - Goal.current_amount))
+            .where(Goal.user_id == user_id, Goal.current_amount < Goal.target_amount)
+            .group_by(target_year)
+        )
+        return {int(year): remaining for year, remaining in result.all()}
+    
+    def _to_db_data(self, goal_data: Dict[str, Any], user_id: int) -> Dict[str, Any]:
+        """Convert API field names to match database schema."""
+        return {
             "user_id": user_id,
             "name": goal_data["name"],
             "target_amount": goal_data["targetAmount"],
             "current_amount": goal_data["currentAmount"],
-            "target_date": goal_data["targetDate"],
+            "target_date": str_to_date(goal_data["targetDate"]),
             "priority": goal_data["priority"],
             "category": goal_data["category"],
             "notes": goal_data.get("notes")
         }
-        goal = Goal(**db_data)
+    
+    async def create(self, goal_data: Dict[str, Any], user_id: int = 1) -> Goal:
+        """Create new goal."""
+        goal = Goal(**self._to_db_data(goal_data, user_id))
         self.db.add(goal)
+        await self._bump_data_version(user_id)
         await self.db.commit()
         await self.db.refresh(goal)
         return goal
     
+    async def create_many(self, goals_data: List[Dict[str, Any]], user_id: int = 1) -> List[int]:
+        """Create many goals in a single transaction and return their generated IDs."""
+        if not goals_data:
+            return []
+        result = await self.db.execute(
+            insert(Goal).returning(Goal.id, sort_by_parameter_order=True),
+            [self._to_db_data(goal_data, user_id) for goal_data in goals_data]
+        )
+        ids = list(result.scalars().all())
+        await self._bump_data_version(user_id)
+        await self.db.commit()
+        return ids
+    
     async def update(self, goal_id: int, goal_data: Dict[str, Any], user_id: int = 1) -> Optional[Goal]:
-        """Update existing goal."""
-        goal = await self.get_by_id(goal_id, user_id)
-        if not goal:
-            return None
-        
+        """Update existing goal with a single UPDATE ... RETURNING statement."""
         # Convert field names to match database schema
+        values: Dict[str, Any] = {}
         if "name" in goal_data:
-            goal.name = goal_data["name"]
+            values["name"] = goal_data["name"]
         if "targetAmount" in goal_data:
-            goal.target_amount = goal_data["targetAmount"]
+            values["target_amount"] = goal_data["targetAmount"]
         if "currentAmount" in goal_data:
-            goal.current_amount = goal_data["currentAmount"]
+            values["current_amount"] = goal_data["currentAmount"]
         if "targetDate" in goal_data:
-            goal.target_date = goal_data["targetDate"]
+            values["target_date"] = str_to_date(goal_data["targetDate"])
         if "priority" in goal_data:
-            goal.priority = goal_data["priority"]
+            values["priority"] = goal_data["priority"]
         if "category" in goal_data:
-            goal.category = goal_data["category"]
+            values["category"] = goal_data["category"]
         if "notes" in goal_data:
-            goal.notes = goal_data["notes"]
+            values["notes"] = goal_data["notes"]
+        if not values:
+            return await self.get_by_id(goal_id, user_id)
         
+        result = await self.db.execute(
+            update(Goal)
+            .where(Goal.id == goal_id, Goal.user_id == user_id)
+            .values(**values)
+            .returning(Goal)
+            .execution_options(synchronize_session=False, populate_existing=True)
+        )
+        goal = result.scalar_one_or_none()
+        if goal is not None:
+            await self._bump_data_version(user_id)
         await self.db.commit()
-        await self.db.refresh(goal)
         return goal
     
     async def delete(self, goal_id: int, user_id: int = 1) -> bool:
-        """Delete goal by ID."""
-        goal = await self.get_by_id(goal_id, user_id)
-        if not goal:
-            return False
-        
-        await self.db.delete(goal)
+        """Delete goal by ID with a single DELETE ... RETURNING statement."""
+        result = await self.db.execute(
+            delete(Goal)
+            .where(Goal.id == goal_id, Goal.user_id == user_id)
+            .returning(Goal.id)
+            .execution_options(synchronize_session=False)
+        )
+        deleted = result.scalar_one_or_none() is not None
+        if deleted:
+            await self._bump_data_version(user_id)
+            await self._record_deletion(user_id, goal_id)
         await self.db.commit()
-        return True
+        return deleted
@@ -1,19 +1,85 @@
-from typing import List, Optional, Dict, Any
+from datetime import datetime
+from typing import AsyncIterator, List, Optional, Dict, Any, Tuple, Sequence
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, insert, update, delete, func, Row, cast, String, Select, literal
 from .base_repository import BaseRepository
 from ..db_models import Liability
+from ..utils.converters import str_to_date, to_db_timestamp
+
+# API fields in response order, read without ORM hydration. IDs and dates are
+# cast to text in SQL so rows match the response models as they come back.
+_LIABILITY_API_COLUMNS = (
+    cast(Liability.id, String).label("id"),
+    Liability.name,
+    Liability.type,
+    Liability.outstanding_amount_inr.label("outstandingAmountINR"),
+    Liability.interest_rate.label("interestRate"),
+    cast(Liability.due_date, String).label("dueDate")
+)
 
 class LiabilityRepository(BaseRepository):
     """Repository for liability operations."""
     
-    async def get_all(self, user_id: int = 1) -> List[Liability]:
-        """Get all liabilities for a user."""
-        result = await self.db.execute(
-            select(Liability).where(Liability.user_id == user_id)
-        )
+    resource = "liabilities"
+    api_fields = tuple(column.key for column in _LIABILITY_API_COLUMNS)
+    
+    def _list_query(
+        self,
+        query: Select,
+        user_id: int,
+        limit: Optional[int],
+        after: Optional[int],
+        liability_type: Optional[str]
+    ) -> Select:
+        """Add the user, filter, keyset and ordering clauses shared by the list reads."""
+        query = query.where(Liability.user_id == user_id)
+        if liability_type is not None:
+            query = query.where(Liability.type == liability_type)
+        if after is not None:
+            query = query.where(Liability.id > after)
+        query = query.order_by(Liability.id)
+        if limit is not None:
+            query = query.limit(limit)
+        return query
+    
+    async def get_all(
+        self,
+        user_id: int = 1,
+        limit: Optional[int] = None,
+        after: Optional[int] = None,
+        liability_type: Optional[str] = None
+    ) -> List[Liability]:
+        """Get liabilities for a user ordered by id, optionally filtered and keyset-paginated."""
+        query = self._list_query(select(Liability), user_id, limit, after, liability_type)
+        result = await self.db.execute(query)
         return list(result.scalars().all())
     
+    async def get_all_rows(
+        self,
+        user_id: int = 1,
+        limit: Optional[int] = None,
+        after: Optional[int] = None,
+        liability_type: Optional[str] = None
+    ) -> List[Row]:
+        """Same as get_all, but returns plain rows of the API fields without building ORM objects."""
+        query = self._list_query(select(*_LIABILITY_API_COLUMNS), user_id, limit, after, liability_type)
+        result = await self.db.execute(query)
+        return list(result.all())
+    
+    async def get_changed_rows(self, user_id: int = 1, since: Optional[datetime] = None) -> List[Row]:
+        """API-field rows created or updated at or after `since` (every row when omitted), oldest change first."""
+        query = select(*_LIABILITY_API_COLUMNS).where(Liability.user_id == user_id)
+        if since is not None:
+            # Range scan on ix_liabilities_user_id_updated_at; the bound is formatted like the stored timestamps
+            query = query.where(Liability.updated_at >= literal(to_db_timestamp(since), String))
+        result = await self.db.execute(query.order_by(Liability.updated_at, Liability.id))
+        return list(result.all())
+    
+    def stream_rows(self, user_id: int = 1, chunk_size: int = 1000) -> AsyncIterator[Sequence[Row]]:
+        """Every API-field row for a user in list order, yielded in chunks of `chunk_size` rows."""
+        query = self._list_query(select(*_LIABILITY_API_COLUMNS), user_id, None, None, None)
+        return self._stream_row_chunks(query, chunk_size)
+    
     async def get_by_id(self, liability_id: int, user_id: int = 1) -> Optional[Liability]:
         """Get liability by ID for a specific user."""
         result = await self.db.execute(
@@ -24,51 +90,112 @@ class LiabilityRepository(BaseRepository):
         )
         return result.scalar_one_or_none()
     
-    async def create(self, liability_data: Dict[str, Any], user_id: int = 1) -> Liability:
-        """Create new liability."""
-        # Convert field names to match database schema
-        db_data = {
+    def _to_db_data(self, liability_data: Dict[str, Any], user_id: int) -> Dict[str, Any]:
+        """Convert API field names to match database schema."""
+        return {
             "user_id": user_id,
             "name": liability_data["name"],
             "type": liability_data["type"],
             "outstanding_amount_inr": liability_data["outstandingAmountINR"],
             "interest_rate": liability_data.get("interestRate"),
-            "due_date": liability_data.get("dueDate")
+            "due_date": str_to_date(liability_data.get("dueDate"))
         }
-        liability = Liability(**db_data)
+    
+    async def get_amortization_inputs(self, user_id: int = 1) -> List[Row]:
+        """Get the columns needed for amortization for all of a user's liabilities, without loading ORM objects."""
+        result = await self.db.execute(
+            select(
+                Liability.id,
+                Liability.name,
+                Liability.outstanding_amount_inr,
+                Liability.interest_rate,
+                Liability.due_date
+            )
+            .where(Liability.user_id == user_id)
+            .order_by(Liability.id)
+        )
+        return list(result.all())
+    
+    async def get_total_outstanding(self, user_id: int = 1) -> float:
+        """Get total outstanding amount of a user's liabilities."""
+        result = await self.db.execute(
+            select(func.coalesce(func.sum(Liability.outstanding_amount_inr), 0.0))
+            .where(Liability.user_id == user_id)
+        )
+        return result.scalar_one()
+    
+    async def get_outstanding_by_type(self, user_id: int = 1) -> Dict[str, Tuple[float, int]]:
+        """Get total outstanding amount and count of a user's liabilities grouped by type."""
+        result = await self.db.execute(
+            select(Liability.type, func.sum(Liability.outstanding_amount_inr), func.count())
+            .where(Liability.user_id == user_id)
+            .group_by(Liability.type)
+        )
+        return {liability_type: (total, count) for liability_type, total, count in result.all()}
+    
+    async def create(self, liability_data: Dict[str, Any], user_id: int = 1) -> Liability:
+        """Create new liability."""
+        liability = Liability(**self._to_db_data(liability_data, user_id))
         self.db.add(liability)
+        await self._bump_data_version(user_id)
         await self.db.commit()
         await self.db.refresh(liability)
         return liability
     
+    async def create_many(self, liabilities_data: List[Dict[str, Any]], user_id: int = 1) -> List[int]:
+        """Create many liabilities in a single transaction and return their generated IDs."""
+        if not liabilities_data:
+            return []
+        result = await self.db.execute(
+            insert(Liability).returning(Liability.id, sort_by_parameter_order=True),
+            [self._to_db_data(liability_data, user_id) for liability_data in liabilities_data]
+        )
+        ids = list(result.scalars().all())
+        await self._bump_data_version(user_id)
+        await self.db.commit()
+        return ids
+    
     async def update(self, liability_id: int, liability_data: Dict[str, Any], user_id: int = 1) -> Optional[Liability]:
-        """Update existing liability."""
-        liability = await self.get_by_id(liability_id, user_id)
-        if not liability:
-            return None
-        
+        """Update existing liability with a single UPDATE ... RETURNING statement."""
         # Convert field names to match database schema
+        values: Dict[str, Any] = {}
         if "name" in liability_data:
-            liability.name = liability_data["name"]
+            values["name"] = liability_data["name"]
         if "type" in liability_data:
-            liability.type = liability_data["type"]
+            values["type"] = liability_data["type"]
         if "outstandingAmountINR" in liability_data:
-            liability.outstanding_amount_inr = liability_data["outstandingAmountINR"]
+            values["outstanding_amount_inr"] = liability_data["outstandingAmountINR"]
         if "interestRate" in liability_data:
-            liability.interest_rate = liability_data["interestRate"]
+            values["interest_rate"] = liability_data["interestRate"]
         if "dueDate" in liability_data:
-            liability.due_date = liability_data["dueDate"]
+            values["due_date"] = str_to_date(liability_data["dueDate"])
+        if not values:
+            return await self.get_by_id(liability_id, user_id)
         
+        result = await self.db.execute(
+            update(Liability)
+            .where(Liability.id == liability_id, Liability.user_id == user_id)
+            .values(**values)
+            .returning(Liability)
+            .execution_options(synchronize_session=False, populate_existing=True)
+        )
+        liability = result.scalar_one_or_none()
+        if liability is not None:
+            await self._bump_data_version(user_id)
         await self.db.commit()
-        await self.db.refresh(liability)
         return liability
     
     async def delete(self, liability_id: int, user_id: int = 1) -> bool:
-        """Delete liability by ID."""
-        liability = await self.get_by_id(liability_id, user_id)
-        if not liability:
-            return False
-        
-        await self.db.delete(liability)
+        """Delete liability by ID with a single DELETE ... RETURNING statement."""
+        result = await self.db.execute(
+            delete(Liability)
+            .where(Liability.id == liability_id, Liability.user_id == user_id)
+            .returning(Liability.id)
+            .execution_options(synchronize_session=False)
+        )
+        deleted = result.scalar_one_or_none() is not None
+        if deleted:
+            await self._bump_data_version(user_id)
+            await self._record_deletion(user_id, liability_id)
         await self.db.commit()
-        return True
+        return deleted
@@ -0,0 +1,32 @@
+from typing import List
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, func, table, column, literal_column, Integer, Text, Row
+
+# The FTS5 table created in db_models; referenced by name as it has no ORM model
+_search_index = table("search_index", column("rowid", Integer), column("title", Text), column("body", Text), column("user_id", Integer))
+_search_table = literal_column("search_index")
+
+class SearchRepository:
+    """Repository for full-text search over expenses, goals and assets."""
+    
+    def __init__(self, db_session: AsyncSession):
+        self.db = db_session
+    
+    async def search(self, match_query: str, user_id: int = 1, limit: int = 20, offset: int = 0) -> List[Row]:
+        """(rowid, title, snippet, score) rows matching an FTS5 query, best match first."""
+        # bm25() is lower for better matches; title matches count double
+        score = func.bm25(_search_table, 2.0, 1.0).label("score")
+        query = (
+            select(
+                _search_index.c.rowid,
+                _search_index.c.title,
+                func.snippet(_search_table, -1, "[", "]", "…", 12).label("snippet"),
+                score
+            )
+            .where(_search_table.op("MATCH")(match_query), _search_index.c.user_id == user_id)
+            .order_by(score, _search_index.c.rowid)
+            .limit(limit)
+            .offset(offset)
+        )
+        result = await self.db.execute(query)
+        return list(result.all())
@@ -0,0 +1,32 @@
+from datetime import datetime
+from typing import Dict, List, Optional
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, insert, func, literal, String
+from ..db_models import DeletedRecord
+from ..utils.converters import to_db_timestamp
+
+class SyncRepository:
+    """Repository for the deletion log and database clock used by delta sync."""
+    
+    def __init__(self, db_session: AsyncSession):
+        self.db = db_session
+    
+    async def record_deletion(self, user_id: int, resource: str, record_id: int) -> None:
+        """Write a tombstone as part of the caller's delete transaction (the caller commits)."""
+        await self.db.execute(insert(DeletedRecord).values(user_id=user_id, resource=resource, record_id=record_id))
+    
+    async def get_deleted_ids(self, user_id: int, since: Optional[datetime] = None) -> Dict[str, List[str]]:
+        """IDs deleted at or after `since` (all tombstones when omitted), grouped by resource."""
+        query = select(DeletedRecord.resource, DeletedRecord.record_id).where(DeletedRecord.user_id == user_id)
+        if since is not None:
+            query = query.where(DeletedRecord.deleted_at >= literal(to_db_timestamp(since), String))
+        result = await self.db.execute(query.order_by(DeletedRecord.id))
+        deleted_ids: Dict[str, List[str]] = {}
+        for resource, record_id in result.all():
+            deleted_ids.setdefault(resource, []).append(str(record_id))
+        return deleted_ids
+    
+    async def get_current_timestamp(self) -> datetime:
+        """Current time on the database clock, which stamps updated_at and deleted_at."""
+        result = await self.db.execute(select(func.current_timestamp().cast(String)))
+        return datetime.strptime(result.scalar_one(), "%Y-%m-%d %H:%M:%S")
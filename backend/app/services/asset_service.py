@@ -1,8 +1,9 @@
-from typing import List, Optional, Union
+from typing import Dict, List, Optional, Tuple, Union
 from ..models.asset_models import AssetIn, AssetOut
 from ..fixtures.sample_data import StaticDataManager
 from ..repositories import AssetRepository
-from ..utils.converters import asset_db_to_pydantic
+from ..utils.converters import asset_db_to_pydantic, asset_row_to_pydantic
+from ..utils.pagination import decode_id_cursor, encode_cursor, fetch_size, split_page
 
 class AssetService:
     """Service for managing assets."""
@@ -15,13 +16,57 @@ class AssetService:
         """Retrieves all assets."""
         if self.is_repository:
             # Database repository
-            assets = await self.data_source.get_all(user_id)
-            return [asset_db_to_pydantic(asset) for asset in assets]
+            assets = await self.data_source.get_all_rows(user_id)
+            return [asset_row_to_pydantic(row) for row in assets]
         else:
             # Static data manager (legacy)
             asset_data = self.data_source.get_all_assets()
             return [AssetOut(**asset) for asset in asset_data]
     
+    async def get_data_version(self, user_id: int = 1) -> Optional[int]:
+        """Version counter that changes with every asset write; None for the legacy data source."""
+        if self.is_repository:
+            return await self.data_source.get_data_version(user_id)
+        return None
+    
+    async def list_assets(
+        self,
+        limit: Optional[int] = None,
+        after: Optional[str] = None,
+        asset_class: Optional[str] = None,
+        fp_asset_class: Optional[str] = None,
+        user_id: int = 1
+    ) -> Tuple[List[AssetOut], Optional[str]]:
+        """Retrieves one page of assets ordered by id and the cursor of the next page."""
+        after_id = decode_id_cursor(after)
+        if self.is_repository:
+            # Database repository
+            assets = await self.data_source.get_all_rows(
+                user_id,
+                limit=fetch_size(limit),
+                after=after_id,
+                asset_class=asset_class,
+                fp_asset_class=fp_asset_class
+            )
+            assets, has_more = split_page(assets, limit)
+            next_cursor = encode_cursor(int(assets[-1].id)) if has_more else None
+            return [asset_row_to_pydantic(row) for row in assets], next_cursor
+        else:
+            # Static data manager (legacy): filter and paginate in memory
+            assets = sorted(
+                (AssetOut(**asset) for asset in self.data_source.get_all_assets()),
+                key=lambda asset: int(asset.id)
+            )
+            assets = [
+                asset for asset in assets
+                if (asset_class is None or asset.assetClass == asset_class)
+                and (fp_asset_class is None or asset.fpAssetClass == fp_asset_class)
+                and (after_id is None or int(asset.id) > after_id)
+            ]
+            assets, has_more = split_page(assets, limit)
+            next_cursor = encode_cursor(int(assets[-1].id)) if has_more else None
+            return assets, next_cursor
+    
     async def get_asset_by_id(self, asset_id: str, user_id: int = 1) -> Optional[AssetOut]:
         """Retrieves an asset by ID."""
         if self.is_repository:
@@ -33,6 +78,33 @@ class AssetService:
             asset_data = self.data_source.get_asset_by_id(asset_id)
             return AssetOut(**asset_data) if asset_data else None
     
+    async def get_total_value(self, fp_asset_classes: Optional[List[str]] = None, user_id: int = 1) -> float:
+        """Retrieves total asset value, optionally restricted to the given FP asset classes."""
+        if self.is_repository:
+            # Database repository: aggregated in SQL
+            return await self.data_source.get_total_value(user_id, fp_asset_classes)
+        else:
+            # Static data manager (legacy)
+            return sum(
+                asset["valueINR"] for asset in self.data_source.get_all_assets()
+                if fp_asset_classes is None or asset["fpAssetClass"] in fp_asset_classes
+            )
+    
+    async def get_value_by_class(self, fp_asset_classes: Optional[List[str]] = None, user_id: int = 1) -> Dict[str, Tuple[float, int]]:
+        """Retrieves total value and count of assets grouped by asset class, optionally restricted to FP asset classes."""
+        if self.is_repository:
+            # Database repository: aggregated in SQL
+            return await self.data_source.get_value_by_class(user_id, fp_asset_classes)
+        else:
+            # Static data manager (legacy)
+            breakdown: Dict[str, Tuple[float, int]] = {}
+            for asset in self.data_source.get_all_assets():
+                if fp_asset_classes is not None and asset["fpAssetClass"] not in fp_asset_classes:
+                    continue
+                total, count = breakdown.get(asset["assetClass"], (0.0, 0))
+                breakdown[asset["assetClass"]] = (total + asset["valueINR"], count + 1)
+            return breakdown
+    
     async def create_asset(self, asset_data: AssetIn, user_id: int = 1) -> AssetOut:
         """Creates a new asset."""
         if self.is_repository:
@@ -44,6 +116,16 @@ class AssetService:
             new_asset_dict = self.data_source.create_asset(asset_data.model_dump())
             return AssetOut(**new_asset_dict)
     
+    async def create_assets_bulk(self, assets_data: List[AssetIn], user_id: int = 1) -> List[str]:
+        """Creates many assets at once and returns their IDs."""
+        if self.is_repository:
+            # Database repository: one batched insert in a single transaction
+            ids = await self.data_source.create_many([asset_data.model_dump() for asset_data in assets_data], user_id)
+            return [str(asset_id) for asset_id in ids]
+        else:
+            # Static data manager (legacy)
+            return [self.data_source.create_asset(asset_data.model_dump())["id"] for asset_data in assets_data]
+    
     async def update_asset(self, asset_id: str, asset_update_data: AssetIn, user_id: int = 1) -> Optional[AssetOut]:
         """Updates an existing asset."""
         if self.is_repository:
@@ -0,0 +1,76 @@
+from typing import Any, Dict, List, Optional
+from ..models.rule_models import CategorizationRuleIn, CategorizationRuleOut, RecategorizeResult
+from ..repositories import CategorizationRuleRepository, ExpenseRepository
+from ..utils.cache import CacheBackend
+from ..utils.converters import categorization_rule_db_to_pydantic
+from ..utils.rule_engine import CompiledRules, RuleOutcome
+from ..config import get_settings
+
+settings = get_settings()
+
+class CategorizationService:
+    """Service for categorization rules and applying them to expenses."""
+    
+    def __init__(
+        self,
+        rule_repository: CategorizationRuleRepository,
+        expense_repository: ExpenseRepository,
+        cache: CacheBackend
+    ):
+        self.rule_repository = rule_repository
+        self.expense_repository = expense_repository
+        self.cache = cache
+    
+    async def get_all_rules(self, user_id: int = 1) -> List[CategorizationRuleOut]:
+        """Retrieves all rules."""
+        rules = await self.rule_repository.get_all(user_id)
+        return [categorization_rule_db_to_pydantic(rule) for rule in rules]
+    
+    async def create_rule(self, rule_data: CategorizationRuleIn, user_id: int = 1) -> CategorizationRuleOut:
+        """Creates a new rule."""
+        rule = await self.rule_repository.create(rule_data.model_dump(), user_id)
+        if rule is None:
+            raise ValueError(f"A rule for keyword '{rule_data.keyword}' already exists.")
+        return categorization_rule_db_to_pydantic(rule)
+    
+    async def update_rule(self, rule_id: str, rule_data: CategorizationRuleIn, user_id: int = 1) -> Optional[CategorizationRuleOut]:
+        """Updates an existing rule."""
+        rule = await self.rule_repository.update(int(rule_id), rule_data.model_dump(), user_id)
+        return categorization_rule_db_to_pydantic(rule) if rule else None
+    
+    async def delete_rule(self, rule_id: str, user_id: int = 1) -> bool:
+        """Deletes a rule by ID."""
+        return await self.rule_repository.delete(int(rule_id), user_id)
+    
+    async def get_compiled_rules(self, user_id: int = 1) -> CompiledRules:
+        """The user's rules compiled for matching; rebuilt only after the rule set changes."""
+        key = ("categorization_rules", user_id, await self.rule_repository.get_data_version(user_id))
+        compiled = self.cache.get(key)
+        if compiled is None:
+            rules = await self.rule_repository.get_all(user_id)
+            compiled = CompiledRules({rule.keyword: RuleOutcome(rule.category, rule.need_want) for rule in rules})
+            self.cache.set(key, compiled)
+        return compiled
+    
+    async def recategorize_expenses(self, user_id: int = 1) -> RecategorizeResult:
+        """Applies the rules to every expense, updating those whose category or need/want changes, a page at a time."""
+        rules = await self.get_compiled_rules(user_id)
+        scanned_count = updated_count = 0
+        after_id: Optional[int] = None
+        while True:
+            rows = await self.expense_repository.get_category_rows(user_id, after_id, settings.RECATEGORIZE_BATCH_SIZE)
+            if not rows:
+                break
+            updates: List[Dict[str, Any]] = []
+            for row in rows:
+                outcome = rules.match(row.details)
+                if outcome is None:
+                    continue
+                need_want = outcome.need_want or row.need_want
+                if (outcome.category, need_want) != (row.category, row.need_want):
+                    updates.append({"id": row.id, "category": outcome.category, "needWant": need_want})
+            await self.expense_repository.update_categories(updates, user_id)
+            scanned_count += len(rows)
+            updated_count += len(updates)
+            after_id = rows[-1].id
+        return RecategorizeResult(scannedCount=scanned_count, updatedCount=updated_count)
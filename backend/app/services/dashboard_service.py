@@ -0,0 +1,48 @@
+import asyncio
+from typing import Optional
+
+from ..database import run_in_session
+from ..models.dashboard_models import DashboardData
+from ..repositories import AssetRepository, LiabilityRepository, ExpenseRepository, GoalRepository, DataVersionRepository
+from ..services.asset_service import AssetService
+from ..services.liability_service import LiabilityService
+from ..services.expense_service import ExpenseService
+from ..services.goal_service import GoalService
+from ..services.fi_service import FIService
+from ..utils.cache import get_fi_cache
+
+class DashboardService:
+    """Service that loads everything the dashboard needs in one call."""
+    
+    async def get_data_version(self, user_id: int = 1) -> int:
+        """Version counter that changes with every write to any dashboard data."""
+        return await run_in_session(lambda session: DataVersionRepository(session).get_version(user_id))
+    
+    async def get_dashboard(self, limit: Optional[int] = None, user_id: int = 1) -> DashboardData:
+        """Loads the first page of every list and the financial summary concurrently, each on its own session."""
+        (
+            (assets, assets_cursor),
+            (liabilities, liabilities_cursor),
+            (expenses, expenses_cursor),
+            (goals, goals_cursor),
+            summary
+        ) = await asyncio.gather(
+            run_in_session(lambda session: AssetService(AssetRepository(session)).list_assets(limit=limit, user_id=user_id)),
+            run_in_session(lambda session: LiabilityService(LiabilityRepository(session)).list_liabilities(limit=limit, user_id=user_id)),
+            run_in_session(lambda session: ExpenseService(ExpenseRepository(session)).list_expenses(limit=limit, user_id=user_id)),
+            run_in_session(lambda session: GoalService(GoalRepository(session)).list_goals(limit=limit, user_id=user_id)),
+            FIService(cache=get_fi_cache()).get_financial_summary(user_id)
+        )
+        return DashboardData(
+            assets=assets,
+            liabilities=liabilities,
+            expenses=expenses,
+            goals=goals,
+            nextCursors={
+                "assets": assets_cursor,
+                "liabilities": liabilities_cursor,
+                "expenses": expenses_cursor,
+                "goals": goals_cursor
+            },
+            summary=summary
+        )
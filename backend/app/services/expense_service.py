@@ -1,8 +1,35 @@
-from typing import List, Optional, Union
-from ..models.expense_models import ExpenseIn, ExpenseOut
+import hashlib
+import re
+from collections import OrderedDict
+from datetime import date, datetime
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple, Union
+from pydantic import ValidationError
+from ..models.expense_models import (
+    ExpenseIn, ExpenseOut, ExpenseImportMapping, ExpenseImportError, ExpenseImportResult,
+    AnnualizedExpenseGroup, AnnualizedExpenses
+)
 from ..fixtures.sample_data import StaticDataManager
 from ..repositories import ExpenseRepository
-from ..utils.converters import expense_db_to_pydantic
+from ..utils.converters import expense_db_to_pydantic, expense_row_to_pydantic
+from ..utils.pagination import decode_date_id_cursor, encode_cursor, fetch_size, split_page
+from ..utils.rule_engine import CompiledRules
+from ..config import get_settings
+
+settings = get_settings()
+
+# Everything but digits, the decimal point and a minus sign, e.g. currency symbols, thousands separators and "Dr"
+_AMOUNT_NOISE = re.compile(r"[^0-9.\-]")
+# Credits in the amount column: a leading or trailing "Cr" tag, or an accounting-style amount in parentheses
+_CREDIT_AMOUNT = re.compile(r"^\(.*\)$|^cr\b|cr\.?$", re.IGNORECASE)
+
+def _statement_row_identity(expense: ExpenseIn) -> str:
+    """Normalized date, amount, category and details of an imported row."""
+    details = " ".join((expense.details or "").split()).casefold()
+    return "\x1f".join([expense.date, f"{expense.amount:.2f}", expense.category.casefold(), details])
+
+def _largest_first(totals: Dict[str, float]) -> Dict[str, float]:
+    """Totals rounded to cents, ordered from the largest amount down."""
+    return {key: round(amount, 2) for key, amount in sorted(totals.items(), key=lambda item: -item[1])}
 
 class ExpenseService:
     """Service for managing expenses."""
@@ -15,13 +42,99 @@ class ExpenseService:
         """Retrieves all expenses."""
         if self.is_repository:
             # Database repository
-            expenses = await self.data_source.get_all(user_id)
-            return [expense_db_to_pydantic(expense) for expense in expenses]
+            expenses = await self.data_source.get_all_rows(user_id)
+            return [expense_row_to_pydantic(row) for row in expenses]
         else:
             # Static data manager (legacy)
             expense_data = self.data_source.get_all_expenses()
             return [ExpenseOut(**expense) for expense in expense_data]
     
+    async def get_data_version(self, user_id: int = 1) -> Optional[int]:
+        """Version counter that changes with every expense write; None for the legacy data source."""
+        if self.is_repository:
+            return await self.data_source.get_data_version(user_id)
+        return None
+    
+    async def list_expenses(
+        self,
+        limit: Optional[int] = None,
+        after: Optional[str] = None,
+        date_from: Optional[date] = None,
+        date_to: Optional[date] = None,
+        category: Optional[str] = None,
+        need_want: Optional[str] = None,
+        frequency: Optional[str] = None,
+        user_id: int = 1
+    ) -> Tuple[List[ExpenseOut], Optional[str]]:
+        """Retrieves one page of expenses ordered by (date, id) and the cursor of the next page."""
+        after_key = decode_date_id_cursor(after)
+        if self.is_repository:
+            # Database repository
+            expenses = await self.data_source.get_all_rows(
+                user_id,
+                limit=fetch_size(limit),
+                after=after_key,
+                date_from=date_from,
+                date_to=date_to,
+                category=category,
+                need_want=need_want,
+                frequency=frequency
+            )
+            expenses, has_more = split_page(expenses, limit)
+            next_cursor = encode_cursor(expenses[-1].date, int(expenses[-1].id)) if has_more else None
+            return [expense_row_to_pydantic(row) for row in expenses], next_cursor
+        else:
+            # Static data manager (legacy): filter and paginate in memory
+            expenses = sorted(
+                (ExpenseOut(**expense) for expense in self.data_source.get_all_expenses()),
+                key=lambda expense: (expense.date, int(expense.id))
+            )
+            expenses = [
+                expense for expense in expenses
+                if (date_from is None or expense.date >= date_from.isoformat())
+                and (date_to is None or expense.date <= date_to.isoformat())
+                and (category is None or expense.category == category)
+                and (need_want is None or expense.needWant == need_want)
+                and (frequency is None or expense.frequency == frequency)
+                and (after_key is None or (expense.date, int(expense.id)) > (after_key[0].isoformat(), after_key[1]))
+            ]
+            expenses, has_more = split_page(expenses, limit)
+            next_cursor = encode_cursor(expenses[-1].date, int(expenses[-1].id)) if has_more else None
+            return expenses, next_cursor
+    
+    async def get_annualized_expenses(self, user_id: int = 1) -> AnnualizedExpenses:
+        """Yearly run-rate of expenses in total, per category, per need/want and per both."""
+        multipliers = settings.EXPENSE_FREQUENCY_ANNUAL_MULTIPLIERS
+        if self.is_repository:
+            # Database repository: one grouped query annualizes and sums in SQL
+            rows = await self.data_source.get_annualized_totals(multipliers, user_id)
+            groups = [AnnualizedExpenseGroup(**row._asdict()) for row in rows]
+        else:
+            # Static data manager (legacy)
+            totals: Dict[Tuple[str, str], List[float]] = {}
+            for expense in self.data_source.get_all_expenses():
+                total = totals.setdefault((expense["category"], expense["needWant"]), [0.0, 0])
+                total[0] += expense["amount"] * multipliers.get(expense["frequency"], 0)
+                total[1] += 1
+            groups = [
+                AnnualizedExpenseGroup(category=category, needWant=need_want, annualAmount=amount, expenseCount=count)
+                for (category, need_want), (amount, count) in totals.items()
+            ]
+        
+        by_category: Dict[str, float] = {}
+        by_need_want: Dict[str, float] = {}
+        for group in groups:
+            by_category[group.category] = by_category.get(group.category, 0.0) + group.annualAmount
+            by_need_want[group.needWant] = by_need_want.get(group.needWant, 0.0) + group.annualAmount
+        for group in groups:
+            group.annualAmount = round(group.annualAmount, 2)
+        return AnnualizedExpenses(
+            totalAnnualAmount=round(sum(by_category.values()), 2),
+            byCategory=_largest_first(by_category),
+            byNeedWant=_largest_first(by_need_want),
+            groups=sorted(groups, key=lambda group: -group.annualAmount)
+        )
+    
     async def get_expense_by_id(self, expense_id: str, user_id: int = 1) -> Optional[ExpenseOut]:
         """Retrieves an expense by ID."""
         if self.is_repository:
@@ -44,6 +157,156 @@ class ExpenseService:
             new_expense_dict = self.data_source.create_expense(expense_data.model_dump())
             return ExpenseOut(**new_expense_dict)
     
+    async def create_expenses_bulk(self, expenses_data: List[ExpenseIn], user_id: int = 1) -> List[str]:
+        """Creates many expenses at once and returns their IDs."""
+        if self.is_repository:
+            # Database repository: one batched insert in a single transaction
+            ids = await self.data_source.create_many([expense_data.model_dump() for expense_data in expenses_data], user_id)
+            return [str(expense_id) for expense_id in ids]
+        else:
+            # Static data manager (legacy)
+            return [self.data_source.create_expense(expense_data.model_dump())["id"] for expense_data in expenses_data]
+    
+    async def import_expenses(
+        self,
+        rows: AsyncIterator[List[str]],
+        mapping: ExpenseImportMapping,
+        rules: Optional[CompiledRules] = None,
+        user_id: int = 1
+    ) -> ExpenseImportResult:
+        """
+        Imports CSV rows (header first) as expenses, validating and inserting them in batches.
+
+        Each batch is one transaction. Invalid rows are reported and left out
+        without failing the rest of their batch. Every row gets a fingerprint of
+        its normalized fields and its occurrence among identical rows of the same
+        day, so re-importing an overlapping statement skips the rows already
+        imported while genuine repeats within a day are kept. Occurrences are
+        kept for the most recently seen statement dates only, so memory stays
+        bounded; rows of those dates may be interleaved.
+
+        Without a category column, `rules` matched against the details replace
+        the default category and need/want. The fingerprint is taken before the
+        rules apply, so editing rules does not defeat duplicate detection.
+        """
+        header = await anext(rows, None)
+        if header is None:
+            raise ValueError("The CSV file is empty.")
+        columns = self._import_columns(header, mapping)
+        batch: List[Dict[str, Any]] = []
+        imported_count = skipped_count = duplicate_count = error_count = 0
+        errors: List[ExpenseImportError] = []
+        # Row digest counts per statement date, least recently seen date first
+        occurrences: OrderedDict[str, Dict[bytes, int]] = OrderedDict()
+        row_number = 1
+        async for row in rows:
+            row_number += 1
+            try:
+                expense = self._import_row(row, columns, mapping)
+            except ValueError as e:
+                error_count += 1
+                if len(errors) < settings.IMPORT_MAX_REPORTED_ERRORS:
+                    errors.append(ExpenseImportError(row=row_number, error=self._import_error_message(e)))
+                continue
+            if expense is None:
+                skipped_count += 1
+                continue
+            day_occurrences = occurrences.get(expense.date)
+            if day_occurrences is None:
+                day_occurrences = occurrences[expense.date] = {}
+                if len(occurrences) > settings.IMPORT_OCCURRENCE_DATES:
+                    occurrences.popitem(last=False)
+            else:
+                occurrences.move_to_end(expense.date)
+            identity = _statement_row_identity(expense)
+            identity_digest = hashlib.sha256(identity.encode()).digest()
+            occurrence = day_occurrences.get(identity_digest, 0)
+            day_occurrences[identity_digest] = occurrence + 1
+            if rules is not None and mapping.categoryColumn is None:
+                outcome = rules.match(expense.details)
+                if outcome is not None:
+                    expense = expense.model_copy(update={
+                        "category": outcome.category,
+                        "needWant": outcome.need_want or expense.needWant
+                    })
+            batch.append({
+                **expense.model_dump(),
+                "fingerprint": hashlib.sha256(f"{identity}\x1f{occurrence}".encode()).hexdigest()
+            })
+            if len(batch) >= settings.IMPORT_BATCH_SIZE:
+                # Awaiting the insert before reading on keeps the upload from outrunning the database
+                inserted = await self._insert_import_batch(batch, user_id)
+                imported_count += inserted
+                duplicate_count += len(batch) - inserted
+                batch = []
+        if batch:
+            inserted = await self._insert_import_batch(batch, user_id)
+            imported_count += inserted
+            duplicate_count += len(batch) - inserted
+        return ExpenseImportResult(
+            importedCount=imported_count,
+            skippedCount=skipped_count,
+            duplicateCount=duplicate_count,
+            errorCount=error_count,
+            errors=errors
+        )
+    
+    async def _insert_import_batch(self, batch: List[Dict[str, Any]], user_id: int) -> int:
+        """Inserts one batch of imported expenses and returns how many were not duplicates."""
+        if self.is_repository:
+            # Database repository: one insert that skips fingerprints already stored
+            return len(await self.data_source.create_many_skipping_duplicates(batch, user_id))
+        else:
+            # Static data manager (legacy): no fingerprints are kept, so nothing is skipped
+            for expense_data in batch:
+                self.data_source.create_expense(ExpenseIn(**expense_data).model_dump())
+            return len(batch)
+    
+    def _import_columns(self, header: List[str], mapping: ExpenseImportMapping) -> Dict[str, Optional[int]]:
+        """Positions of the mapped columns in the CSV header."""
+        positions = {name.strip(): index for index, name in enumerate(header)}
+        columns: Dict[str, Optional[int]] = {}
+        for field, column in (
+            ("date", mapping.dateColumn),
+            ("amount", mapping.amountColumn),
+            ("details", mapping.detailsColumn),
+            ("category", mapping.categoryColumn)
+        ):
+            if column is not None and column not in positions:
+                raise ValueError(f"Column '{column}' not found in the CSV header.")
+            columns[field] = positions.get(column) if column is not None else None
+        return columns
+    
+    def _import_row(self, row: List[str], columns: Dict[str, Optional[int]], mapping: ExpenseImportMapping) -> Optional[ExpenseIn]:
+        """Maps one CSV row to a validated expense; None for rows without an amount and for credits."""
+        def cell(field: str) -> str:
+            index = columns[field]
+            return row[index].strip() if index is not None and index < len(row) else ""
+        
+        if _CREDIT_AMOUNT.search(cell("amount")):
+            return None
+        amount = _AMOUNT_NOISE.sub("", cell("amount"))
+        if not amount:
+            return None
+        try:
+            expense_date = datetime.strptime(cell("date"), mapping.dateFormat).date()
+        except ValueError:
+            raise ValueError(f"Date '{cell('date')}' does not match the format '{mapping.dateFormat}'.")
+        return ExpenseIn(
+            category=cell("category") or mapping.category,
+            details=cell("details") or None,
+            amount=float(amount),
+            frequency=mapping.frequency,
+            needWant=mapping.needWant,
+            date=expense_date.isoformat()
+        )
+    
+    def _import_error_message(self, error: ValueError) -> str:
+        """One-line description of why a row was rejected."""
+        if isinstance(error, ValidationError):
+            return "; ".join(f"{'.'.join(map(str, detail['loc']))}: {detail['msg']}" for detail in error.errors())
+        return str(error)
+    
     async def update_expense(self, expense_id: str, expense_update_data: ExpenseIn, user_id: int = 1) -> Optional[ExpenseOut]:
         """Updates an existing expense."""
         if self.is_repository:
@@ -0,0 +1,61 @@
+import csv
+import io
+from typing import AsyncIterator, Dict, Type
+
+import orjson
+
+from ..database import AsyncSessionLocal
+from ..repositories import AssetRepository, LiabilityRepository, ExpenseRepository, GoalRepository
+from ..repositories.base_repository import BaseRepository
+from ..config import get_settings
+
+settings = get_settings()
+
+# Exportable entities and the repositories that stream their rows
+_EXPORT_ENTITIES: Dict[str, Type[BaseRepository]] = {
+    "assets": AssetRepository,
+    "liabilities": LiabilityRepository,
+    "expenses": ExpenseRepository,
+    "goals": GoalRepository
+}
+
+EXPORT_MEDIA_TYPES: Dict[str, str] = {
+    "csv": "text/csv; charset=utf-8",
+    "ndjson": "application/x-ndjson"
+}
+
+class ExportService:
+    """Service that streams a user's records as CSV or NDJSON."""
+    
+    def export(self, entity: str, export_format: str, user_id: int = 1) -> AsyncIterator[bytes]:
+        """
+        Validate the request and return the export body as an async iterator of byte chunks.
+
+        Nothing is read until the iterator is consumed. It opens its own session
+        because the request's session is closed before a streamed body is sent.
+        """
+        if entity not in _EXPORT_ENTITIES:
+            raise ValueError(f"Unknown export entity '{entity}'. Use one of: {', '.join(_EXPORT_ENTITIES)}.")
+        if export_format not in EXPORT_MEDIA_TYPES:
+            raise ValueError(f"Unknown export format '{export_format}'. Use one of: {', '.join(EXPORT_MEDIA_TYPES)}.")
+        encode = self._encode_csv if export_format == "csv" else self._encode_ndjson
+        return encode(_EXPORT_ENTITIES[entity], user_id)
+    
+    async def _encode_csv(self, repository_class: Type[BaseRepository], user_id: int) -> AsyncIterator[bytes]:
+        """CSV with a header row, one chunk of output per chunk of rows."""
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(repository_class.api_fields)
+        yield buffer.getvalue().encode()
+        async with AsyncSessionLocal() as session:
+            async for rows in repository_class(session).stream_rows(user_id, settings.EXPORT_CHUNK_SIZE):
+                buffer.seek(0)
+                buffer.truncate()
+                writer.writerows(rows)
+                yield buffer.getvalue().encode()
+    
+    async def _encode_ndjson(self, repository_class: Type[BaseRepository], user_id: int) -> AsyncIterator[bytes]:
+        """One JSON object per line, one chunk of output per chunk of rows."""
+        async with AsyncSessionLocal() as session:
+            async for rows in repository_class(session).stream_rows(user_id, settings.EXPORT_CHUNK_SIZE):
+                yield b"".join(orjson.dumps(row._asdict()) + b"\n" for row in rows)
@@ -1,33 +1,81 @@
-from typing import List
+import asyncio
+from datetime import date
+import hashlib
+from typing import Any, Awaitable, Callable, Hashable, List, NamedTuple, Optional, Tuple
 
-from ..models.fi_models import UserFIParameters, FinancialIndependenceResult, FIDetails
-from ..models.asset_models import AssetOut
-from ..models.liability_models import LiabilityOut
+import numpy as np
+
+from ..models.fi_models import (
+    UserFIParameters, FinancialIndependenceResult, FIDetails, FIPortfolioParameters,
+    FIScenarioGrid, FIScenarioList, FIScenarioMatrix, MonteCarloRequest, MonteCarloResult,
+    FIProjectionRequest, FIProjectionResult, FIProjectionSeries
+)
 from ..services.asset_service import AssetService
 from ..services.liability_service import LiabilityService
+from ..services.goal_service import GoalService
+from ..repositories import AssetRepository, LiabilityRepository, GoalRepository, DataVersionRepository
+from ..database import run_in_session
+from ..utils.converters import add_months
+from ..utils.cache import CacheBackend
+from ..utils.monte_carlo import get_process_pool, portfolio_return_assumptions, run_monte_carlo
 from ..config import get_settings
 
 settings = get_settings()
 
+# Resources each cached result is computed from
+_SUMMARY_RESOURCES = ("assets", "liabilities")
+_FI_DETAILS_RESOURCES = ("assets", "liabilities", "goals")
+
+class _FIDataServices(NamedTuple):
+    assets: AssetService
+    liabilities: LiabilityService
+    goals: GoalService
+
 class FIService:
     """Service for Financial Independence calculations."""
     
-    def __init__(self, asset_service: AssetService, liability_service: LiabilityService):
-        self.asset_service = asset_service
-        self.liability_service = liability_service
+    def __init__(self, cache: Optional[CacheBackend] = None):
+        # Every read runs on its own short-lived session, so independent reads run concurrently.
+        # Summaries and FI results are cached per data version when a cache is provided
+        self.cache = cache
+    
+    async def _get_data_version(self, resources: Tuple[str, ...], user_id: int = 1) -> int:
+        """Current version of `resources`, read on its own session."""
+        return await run_in_session(lambda session: DataVersionRepository(session).get_version(user_id, resources))
+    
+    async def _cached(
+        self,
+        key: Tuple[Hashable, ...],
+        resources: Tuple[str, ...],
+        compute: Callable[[], Awaitable[Any]],
+        user_id: int = 1
+    ) -> Any:
+        """Return the cached result for `key` at the user's current data version, computing it on a miss."""
+        if self.cache is None:
+            return await compute()
+        # Reading the version first means a concurrent write can only make the
+        # stored result newer than its key, never older
+        versioned_key = (*key, user_id, await self._get_data_version(resources, user_id))
+        result = self.cache.get(versioned_key)
+        if result is None:
+            result = await compute()
+            self.cache.set(versioned_key, result)
+        return result
+    
+    async def _gather_reads(self, *reads: Callable[[_FIDataServices], Awaitable[Any]]) -> List[Any]:
+        """Run independent reads concurrently, each on its own session, and return their results in order."""
+        async def read_in_own_session(read: Callable[[_FIDataServices], Awaitable[Any]]) -> Any:
+            return await run_in_session(lambda session: read(_FIDataServices(
+                AssetService(AssetRepository(session)),
+                LiabilityService(LiabilityRepository(session)),
+                GoalService(GoalRepository(session))
+            )))
+        return list(await asyncio.gather(*(read_in_own_session(read) for read in reads)))
     
     def _calculate_required_fi_corpus(self, fi_annual_expenses: float, swr: float) -> float:
         """Calculate the required FI corpus based on annual expenses and SWR."""
         return float('inf') if swr <= 0 else fi_annual_expenses / swr
     
-    def _calculate_total_asset_value(self, assets: List[AssetOut]) -> float:
-        """Calculate total value of all assets."""
-        return sum(asset.valueINR for asset in assets)
-    
-    def _calculate_total_liabilities_value(self, liabilities: List[LiabilityOut]) -> float:
-        """Calculate total outstanding amount of all liabilities."""
-        return sum(liability.outstandingAmountINR for liability in liabilities)
-    
     def _calculate_fi_status(self, net_fi_corpus_available: float, required_fi_corpus: float) -> tuple[bool, float]:
         """Calculate FI status and ratio percentage."""
         if required_fi_corpus > 0:
@@ -42,35 +90,105 @@ class FIService:
         
         return is_fi, ratio
 
-    async def calculate_fi_details(self, user_fi_parameters: UserFIParameters) -> FinancialIndependenceResult:
+    def _calculate_required_fi_corpus_array(self, fi_annual_expenses: np.ndarray, swr: np.ndarray) -> np.ndarray:
+        """Vectorized _calculate_required_fi_corpus; broadcasts expenses against SWRs."""
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return np.where(swr <= 0, np.inf, fi_annual_expenses / swr)
+
+    def _calculate_fi_status_array(self, net_fi_corpus_available: np.ndarray, required_fi_corpus: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Vectorized _calculate_fi_status."""
+        positive = np.isfinite(required_fi_corpus) & (required_fi_corpus > 0)
+        zero_and_covered = (required_fi_corpus == 0) & (net_fi_corpus_available >= 0)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            ratio = np.where(
+                positive,
+                np.maximum(0.0, (net_fi_corpus_available / required_fi_corpus) * 100),
+                np.where(zero_and_covered, 100.0, 0.0)
+            )
+        is_fi = np.where(positive, net_fi_corpus_available >= required_fi_corpus, zero_and_covered)
+        return is_fi, ratio
+
+    def _required_corpus_to_json(self, required_fi_corpus: np.ndarray) -> list:
+        """Round required corpora and map the unreachable (infinite) ones to None."""
+        rounded = np.round(required_fi_corpus, 2).astype(object)
+        rounded[~np.isfinite(required_fi_corpus)] = None
+        return rounded.tolist()
+
+    def _resolve_fp_asset_classes(self, parameters: FIPortfolioParameters) -> List[str]:
+        """FP asset classes counted as investable, falling back to the configured default."""
+        if parameters.fp_asset_classes_for_investable is None:
+            return settings.DEFAULT_FP_ASSET_CLASSES_FOR_INVESTABLE
+        return parameters.fp_asset_classes_for_investable
+
+    async def _load_portfolio_aggregates(
+        self,
+        parameter_sets: List[FIPortfolioParameters],
+        user_id: int = 1
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Net investable assets and goals corpus per parameter set, querying each distinct aggregate once."""
+        fp_asset_classes_by_key: dict = {}
+        for parameters in parameter_sets:
+            fp_asset_classes = self._resolve_fp_asset_classes(parameters)
+            fp_asset_classes_by_key.setdefault(frozenset(fp_asset_classes), fp_asset_classes)
+        inflations = list(dict.fromkeys(parameters.goals_inflation_percentage or 0.0 for parameters in parameter_sets))
+        
+        # The liability total, asset totals and goal corpora do not depend on each other
+        results = await self._gather_reads(
+            lambda services: services.liabilities.get_total_outstanding(user_id),
+            *(
+                lambda services, fp_asset_classes=fp_asset_classes: services.assets.get_total_value(fp_asset_classes, user_id)
+                for fp_asset_classes in fp_asset_classes_by_key.values()
+            ),
+            *(
+                lambda services, inflation=inflation: services.goals.get_goals_corpus(inflation, user_id)
+                for inflation in inflations
+            )
+        )
+        total_liabilities_value = results[0]
+        investable_by_classes = dict(zip(fp_asset_classes_by_key, results[1:1 + len(fp_asset_classes_by_key)]))
+        goals_by_inflation = dict(zip(inflations, results[1 + len(fp_asset_classes_by_key):]))
+        
+        net_investable_assets = np.empty(len(parameter_sets))
+        goals_corpus = np.empty(len(parameter_sets))
+        for i, parameters in enumerate(parameter_sets):
+            classes_key = frozenset(self._resolve_fp_asset_classes(parameters))
+            inflation = parameters.goals_inflation_percentage or 0.0
+            net_investable_assets[i] = (
+                investable_by_classes[classes_key] -
+                (parameters.emergency_fund_to_exclude or 0.0) -
+                (parameters.primary_residence_equity_to_exclude or 0.0) -
+                total_liabilities_value
+            )
+            goals_corpus[i] = goals_by_inflation[inflation]
+        return net_investable_assets, goals_corpus
+
+    async def calculate_fi_details(self, user_fi_parameters: UserFIParameters, user_id: int = 1) -> FinancialIndependenceResult:
+        """Calculates Financial Independence status and related metrics (cached per data version and parameters)."""
+        parameters_hash = hashlib.sha256(user_fi_parameters.model_dump_json().encode()).hexdigest()
+        return await self._cached(
+            ("fi_details", parameters_hash),
+            _FI_DETAILS_RESOURCES,
+            lambda: self._calculate_fi_details(user_fi_parameters, user_id),
+            user_id
+        )
+    
+    async def _calculate_fi_details(self, user_fi_parameters: UserFIParameters, user_id: int) -> FinancialIndependenceResult:
         """Calculates Financial Independence status and related metrics."""
         # Extract parameters
         fi_annual_expenses = user_fi_parameters.desired_annual_fi_expenses
         swr_percentage = user_fi_parameters.swr_percentage
         swr = swr_percentage / 100.0
-        emergency_fund_to_exclude = user_fi_parameters.emergency_fund_to_exclude
-        primary_residence_equity_to_exclude = user_fi_parameters.primary_residence_equity_to_exclude
 
         # Calculate required FI corpus
         required_fi_corpus = self._calculate_required_fi_corpus(fi_annual_expenses, swr)
 
-        # Fetch data from services
-        assets = await self.asset_service.get_all_assets()
-        liabilities = await self.liability_service.get_all_liabilities()
+        # Aggregate investable assets, liabilities and open goals in the database
+        net_investable_assets, goals_corpus = await self._load_portfolio_aggregates([user_fi_parameters], user_id)
+        net_investable_assets = float(net_investable_assets[0])
+        goals_corpus = float(goals_corpus[0])
 
-        # Calculate net investable assets
-        total_asset_value = self._calculate_total_asset_value(assets)
-        total_liabilities_value = self._calculate_total_liabilities_value(liabilities)
-        
-        net_investable_assets = (
-            total_asset_value - 
-            emergency_fund_to_exclude - 
-            primary_residence_equity_to_exclude - 
-            total_liabilities_value
-        )
-
-        # Calculate net FI corpus available (using configured goals placeholder)
-        net_fi_corpus_available = net_investable_assets - settings.DEFAULT_GOALS_PLACEHOLDER
+        # Calculate net FI corpus available
+        net_fi_corpus_available = net_investable_assets - goals_corpus
 
         # Determine FI status
         is_financially_independent, fi_ratio_percentage = self._calculate_fi_status(
@@ -80,7 +198,7 @@ class FIService:
         # Build result
         result_details = FIDetails(
             net_investable_assets=round(net_investable_assets, 2),
-            total_current_cost_of_goals_to_set_aside=round(settings.DEFAULT_GOALS_PLACEHOLDER, 2)
+            total_current_cost_of_goals_to_set_aside=round(goals_corpus, 2)
         )
 
         return FinancialIndependenceResult(
@@ -93,39 +211,160 @@ class FIService:
             details=result_details
         )
     
-    async def get_financial_summary(self) -> dict:
+    async def calculate_fi_scenarios(self, scenarios: List[UserFIParameters]) -> FIScenarioList:
+        """Evaluates many FI parameter sets at once, loading each portfolio aggregate only once."""
+        net_investable_assets, goals_corpus = await self._load_portfolio_aggregates(scenarios)
+        net_fi_corpus_available = net_investable_assets - goals_corpus
+        fi_annual_expenses = np.fromiter((scenario.desired_annual_fi_expenses for scenario in scenarios), float, len(scenarios))
+        swr = np.fromiter((scenario.swr_percentage for scenario in scenarios), float, len(scenarios)) / 100.0
+
+        required_fi_corpus = self._calculate_required_fi_corpus_array(fi_annual_expenses, swr)
+        is_fi, fi_ratio_percentage = self._calculate_fi_status_array(net_fi_corpus_available, required_fi_corpus)
+
+        return FIScenarioList(
+            is_financially_independent=is_fi.tolist(),
+            fi_ratio_percentage=np.round(fi_ratio_percentage, 2).tolist(),
+            net_fi_corpus_available=np.round(net_fi_corpus_available, 2).tolist(),
+            required_fi_corpus=self._required_corpus_to_json(required_fi_corpus)
+        )
+
+    async def calculate_fi_grid(self, grid: FIScenarioGrid) -> FIScenarioMatrix:
+        """Evaluates an SWR x annual expenses sensitivity grid against the current portfolio."""
+        net_investable_assets, goals_corpus = await self._load_portfolio_aggregates([grid])
+        net_fi_corpus_available = float(net_investable_assets[0] - goals_corpus[0])
+        swr_percentages = np.linspace(grid.swr_percentage.start, grid.swr_percentage.stop, grid.swr_percentage.steps)
+        annual_expenses = np.linspace(
+            grid.desired_annual_fi_expenses.start, grid.desired_annual_fi_expenses.stop, grid.desired_annual_fi_expenses.steps
+        )
+
+        # Rows are SWR values, columns are annual expense values
+        required_fi_corpus = self._calculate_required_fi_corpus_array(annual_expenses[np.newaxis, :], swr_percentages[:, np.newaxis] / 100.0)
+        is_fi, fi_ratio_percentage = self._calculate_fi_status_array(net_fi_corpus_available, required_fi_corpus)
+
+        return FIScenarioMatrix(
+            swr_percentages=np.round(swr_percentages, 4).tolist(),
+            annual_expenses=np.round(annual_expenses, 2).tolist(),
+            net_fi_corpus_available=round(net_fi_corpus_available, 2),
+            required_fi_corpus=self._required_corpus_to_json(required_fi_corpus),
+            fi_ratio_percentage=np.round(fi_ratio_percentage, 2).tolist(),
+            is_financially_independent=is_fi.tolist()
+        )
+    
+    async def simulate_fi_success(self, request: MonteCarloRequest) -> MonteCarloResult:
+        """Estimates the probability that the FI corpus sustains inflation-linked withdrawals."""
+        parameters = request.user_fi_parameters
+        net_investable_assets, goals_corpus = await self._load_portfolio_aggregates([parameters])
+        starting_corpus = float(net_investable_assets[0] - goals_corpus[0])
+
+        # Blend per-asset-class assumptions using the investable portfolio mix
+        assumptions = dict(settings.ASSET_CLASS_RETURN_ASSUMPTIONS)
+        for asset_class, override in (request.asset_class_assumptions or {}).items():
+            assumptions[asset_class] = (override.expected_return_percentage, override.volatility_percentage)
+        (value_by_class,) = await self._gather_reads(
+            lambda services: services.assets.get_value_by_class(self._resolve_fp_asset_classes(parameters))
+        )
+        weights: dict = {}
+        for asset_class, (total, _) in value_by_class.items():
+            key = asset_class if asset_class in assumptions else "Other"
+            weights[key] = weights.get(key, 0.0) + total
+        expected_return_percentage, volatility_percentage = portfolio_return_assumptions(weights, assumptions)
+
+        success_rate, corpus_percentiles = await run_monte_carlo(
+            starting_corpus=starting_corpus,
+            annual_withdrawal=parameters.desired_annual_fi_expenses,
+            inflation=request.inflation_percentage / 100.0,
+            expected_return=expected_return_percentage / 100.0,
+            volatility=volatility_percentage / 100.0,
+            years=request.years,
+            num_paths=request.num_paths,
+            percentiles=request.percentiles,
+            seed=request.seed,
+            chunk_paths=settings.MONTE_CARLO_CHUNK_PATHS,
+            executor=get_process_pool() if request.use_process_pool else None
+        )
+
+        return MonteCarloResult(
+            success_probability_percentage=round(success_rate * 100, 2),
+            num_paths=request.num_paths,
+            years=request.years,
+            starting_corpus=round(starting_corpus, 2),
+            annual_withdrawal=round(parameters.desired_annual_fi_expenses, 2),
+            portfolio_expected_return_percentage=round(expected_return_percentage, 4),
+            portfolio_volatility_percentage=round(volatility_percentage, 4),
+            percentiles=request.percentiles,
+            corpus_percentiles=np.round(corpus_percentiles, 2).tolist()
+        )
+    
+    async def project_fi(self, request: FIProjectionRequest) -> FIProjectionResult:
+        """Projects the FI corpus month by month for each savings amount and finds when it reaches the target."""
+        parameters = request.user_fi_parameters
+        net_investable_assets, goals_corpus = await self._load_portfolio_aggregates([parameters])
+        starting_corpus = float(net_investable_assets[0] - goals_corpus[0])
+        required_fi_corpus = self._calculate_required_fi_corpus(
+            parameters.desired_annual_fi_expenses, parameters.swr_percentage / 100.0
+        )
+
+        # Closed form of C_m = C_{m-1} * (1 + r) + S: C_m = C_0 * (1 + r)^m + S * ((1 + r)^m - 1) / r
+        months = request.max_years * 12
+        monthly_rate = (1 + request.expected_annual_return_percentage / 100.0) ** (1 / 12) - 1
+        month_numbers = np.arange(months + 1)
+        growth = (1 + monthly_rate) ** month_numbers
+        annuity = month_numbers.astype(float) if monthly_rate == 0 else (growth - 1) / monthly_rate
+        monthly_savings = np.asarray(request.monthly_savings, dtype=float)
+        corpus = starting_corpus * growth[np.newaxis, :] + monthly_savings[:, np.newaxis] * annuity[np.newaxis, :]
+
+        # First month at or above the target, per savings amount
+        reached = corpus >= required_fi_corpus
+        reaches_fi = reached.any(axis=1)
+        first_month = reached.argmax(axis=1)
+
+        today = date.today()
+        projections = [
+            FIProjectionSeries(
+                monthly_savings=savings,
+                months_to_fi=int(month) if reached_fi else None,
+                fi_date=add_months(today, int(month)).isoformat() if reached_fi else None,
+                corpus=trajectory
+            )
+            for savings, month, reached_fi, trajectory in zip(
+                request.monthly_savings, first_month, reaches_fi, np.round(corpus, 2).tolist()
+            )
+        ]
+
+        return FIProjectionResult(
+            starting_corpus=round(starting_corpus, 2),
+            required_fi_corpus=round(required_fi_corpus, 2) if required_fi_corpus != float('inf') else "N/A",
+            months=months,
+            projections=projections
+        )
+    
+    async def get_summary_data_version(self, user_id: int = 1) -> int:
+        """Version counter that changes whenever the financial summary can change."""
+        return await self._get_data_version(_SUMMARY_RESOURCES, user_id)
+    
+    async def get_financial_summary(self, user_id: int = 1) -> dict:
+        """Get a basic financial summary including net worth and asset/liability breakdown (cached per data version)."""
+        return await self._cached(("summary",), _SUMMARY_RESOURCES, lambda: self._get_financial_summary(user_id), user_id)
+    
+    async def _get_financial_summary(self, user_id: int) -> dict:
         """Get a basic financial summary including net worth and asset/liability breakdown."""
-        # Fetch data from services
-        assets = await self.asset_service.get_all_assets()
-        liabilities = await self.liability_service.get_all_liabilities()
+        # Grouped totals and counts are aggregated by the database
+        asset_breakdown, liability_breakdown = await self._gather_reads(
+            lambda services: services.assets.get_value_by_class(user_id=user_id),
+            lambda services: services.liabilities.get_outstanding_by_type(user_id)
+        )
         
-        # Calculate totals
-        total_assets = self._calculate_total_asset_value(assets)
-        total_liabilities = self._calculate_total_liabilities_value(liabilities)
+        # Calculate totals from the handful of grouped rows
+        total_assets = sum(total for total, _ in asset_breakdown.values())
+        total_liabilities = sum(total for total, _ in liability_breakdown.values())
         net_worth = total_assets - total_liabilities
         
-        # Group assets by class
-        asset_breakdown = {}
-        for asset in assets:
-            asset_class = asset.assetClass
-            if asset_class not in asset_breakdown:
-                asset_breakdown[asset_class] = 0
-            asset_breakdown[asset_class] += asset.valueINR
-        
-        # Group liabilities by type
-        liability_breakdown = {}
-        for liability in liabilities:
-            liability_type = liability.type
-            if liability_type not in liability_breakdown:
-                liability_breakdown[liability_type] = 0
-            liability_breakdown[liability_type] += liability.outstandingAmountINR
-        
         return {
             "net_worth": round(net_worth, 2),
             "total_assets": round(total_assets, 2),
             "total_liabilities": round(total_liabilities, 2),
-            "asset_breakdown": {k: round(v, 2) for k, v in asset_breakdown.items()},
-            "liability_breakdown": {k: round(v, 2) for k, v in liability_breakdown.items()},
-            "asset_count": len(assets),
-            "liability_count": len(liabilities)
+            "asset_breakdown": {k: round(total, 2) for k, (total, _) in asset_breakdown.items()},
+            "liability_breakdown": {k: round(total, 2) for k, (total, _) in liability_breakdown.items()},
+            "asset_count": sum(count for _, count in asset_breakdown.values()),
+            "liability_count": sum(count for _, count in liability_breakdown.values())
         }
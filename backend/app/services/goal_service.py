@@ -1,8 +1,10 @@
-from typing import List, Optional, Union
+from datetime import date
+from typing import List, Optional, Tuple, Union
 from ..models.goal_models import GoalIn, GoalOut
 from ..fixtures.sample_data import StaticDataManager
 from ..repositories import GoalRepository
-from ..utils.converters import goal_db_to_pydantic
+from ..utils.converters import goal_db_to_pydantic, goal_row_to_pydantic
+from ..utils.pagination import decode_date_id_cursor, encode_cursor, fetch_size, split_page
 
 class GoalService:
     """Service for managing goals."""
@@ -15,13 +17,57 @@ class GoalService:
         """Retrieves all goals."""
         if self.is_repository:
             # Database repository
-            goals = await self.data_source.get_all(user_id)
-            return [goal_db_to_pydantic(goal) for goal in goals]
+            goals = await self.data_source.get_all_rows(user_id)
+            return [goal_row_to_pydantic(row) for row in goals]
         else:
             # Static data manager (legacy)
             goal_data = self.data_source.get_all_goals()
             return [GoalOut(**goal) for goal in goal_data]
     
+    async def get_data_version(self, user_id: int = 1) -> Optional[int]:
+        """Version counter that changes with every goal write; None for the legacy data source."""
+        if self.is_repository:
+            return await self.data_source.get_data_version(user_id)
+        return None
+    
+    async def list_goals(
+        self,
+        limit: Optional[int] = None,
+        after: Optional[str] = None,
+        category: Optional[str] = None,
+        priority: Optional[str] = None,
+        user_id: int = 1
+    ) -> Tuple[List[GoalOut], Optional[str]]:
+        """Retrieves one page of goals ordered by (target date, id) and the cursor of the next page."""
+        after_key = decode_date_id_cursor(after)
+        if self.is_repository:
+            # Database repository
+            goals = await self.data_source.get_all_rows(
+                user_id,
+                limit=fetch_size(limit),
+                after=after_key,
+                category=category,
+                priority=priority
+            )
+            goals, has_more = split_page(goals, limit)
+            next_cursor = encode_cursor(goals[-1].targetDate, int(goals[-1].id)) if has_more else None
+            return [goal_row_to_pydantic(row) for row in goals], next_cursor
+        else:
+            # Static data manager (legacy): filter and paginate in memory
+            goals = sorted(
+                (GoalOut(**goal) for goal in self.data_source.get_all_goals()),
+                key=lambda goal: (goal.targetDate, int(goal.id))
+            )
+            goals = [
+                goal for goal in goals
+                if (category is None or goal.category == category)
+                and (priority is None or goal.priority == priority)
+                and (after_key is None or (goal.targetDate, int(goal.id)) > (after_key[0].isoformat(), after_key[1]))
+            ]
+            goals, has_more = split_page(goals, limit)
+            next_cursor = encode_cursor(goals[-1].targetDate, int(goals[-1].id)) if has_more else None
+            return goals, next_cursor
+    
     async def get_goal_by_id(self, goal_id: str, user_id: int = 1) -> Optional[GoalOut]:
         """Retrieves a goal by ID."""
         if self.is_repository:
@@ -33,6 +79,26 @@ class GoalService:
             goal_data = self.data_source.get_goal_by_id(goal_id)
             return GoalOut(**goal_data) if goal_data else None
     
+    async def get_goals_corpus(self, inflation_rate_percentage: float = 0.0, user_id: int = 1) -> float:
+        """Retrieves the amount still needed for unfinished goals, optionally inflated to each target year."""
+        if self.is_repository:
+            # Database repository: grouped by target year in SQL
+            amounts_by_year = await self.data_source.get_open_amounts_by_year(user_id)
+        else:
+            # Static data manager (legacy)
+            amounts_by_year = {}
+            for goal in self.data_source.get_all_goals():
+                if goal["currentAmount"] < goal["targetAmount"]:
+                    year = int(goal["targetDate"][:4])
+                    amounts_by_year[year] = amounts_by_year.get(year, 0.0) + goal["targetAmount"] - goal["currentAmount"]
+        
+        inflation_rate = inflation_rate_percentage / 100.0
+        current_year = date.today().year
+        return sum(
+            remaining * (1 + inflation_rate) ** max(0, year - current_year)
+            for year, remaining in amounts_by_year.items()
+        )
+    
     async def create_goal(self, goal_data: GoalIn, user_id: int = 1) -> GoalOut:
         """Creates a new goal."""
         if self.is_repository:
@@ -44,6 +110,16 @@ class GoalService:
             new_goal_dict = self.data_source.create_goal(goal_data.model_dump())
             return GoalOut(**new_goal_dict)
     
+    async def create_goals_bulk(self, goals_data: List[GoalIn], user_id: int = 1) -> List[str]:
+        """Creates many goals at once and returns their IDs."""
+        if self.is_repository:
+            # Database repository: one batched insert in a single transaction
+            ids = await self.data_source.create_many([goal_data.model_dump() for goal_data in goals_data], user_id)
+            return [str(goal_id) for goal_id in ids]
+        else:
+            # Static data manager (legacy)
+            return [self.data_source.create_goal(goal_data.model_dump())["id"] for goal_data in goals_data]
+    
     async def update_goal(self, goal_id: str, goal_update_data: GoalIn, user_id: int = 1) -> Optional[GoalOut]:
         """Updates an existing goal."""
         if self.is_repository:
@@ -1,27 +1,95 @@
-from typing import List, Optional, Union
-from ..models.liability_models import LiabilityIn, LiabilityOut
+from datetime import date
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional, Tuple, Union
+
+import numpy as np
+
+from ..models.liability_models import (
+    LiabilityIn, LiabilityOut, LiabilitySchedule, AmortizationSummary, PayoffComparison, PayoffStrategyResult
+)
 from ..fixtures.sample_data import StaticDataManager
 from ..repositories import LiabilityRepository
-from ..utils.converters import liability_db_to_pydantic
+from ..utils.converters import liability_db_to_pydantic, liability_row_to_pydantic, str_to_date, add_months, months_between
+from ..utils.amortization import amortize, months_to_repay, simulate_payoff
+from ..utils.cache import CacheBackend
+from ..utils.pagination import decode_id_cursor, encode_cursor, fetch_size, split_page
+from ..config import get_settings
+
+settings = get_settings()
 
 class LiabilityService:
     """Service for managing liabilities."""
     
-    def __init__(self, data_source: Union[StaticDataManager, LiabilityRepository]):
+    def __init__(self, data_source: Union[StaticDataManager, LiabilityRepository], cache: Optional[CacheBackend] = None):
         self.data_source = data_source
         self.is_repository = isinstance(data_source, LiabilityRepository)
+        # Amortization and payoff results are cached per liabilities data version when provided
+        self.cache = cache
+    
+    async def _cached(self, key: Tuple[Hashable, ...], compute: Callable[[], Awaitable[Any]], user_id: int = 1) -> Any:
+        """Return the cached result for `key` at the user's current liabilities data version, computing it on a miss."""
+        if self.cache is None or not self.is_repository:
+            return await compute()
+        # Reading the version first means a concurrent write can only make the
+        # stored result newer than its key, never older
+        versioned_key = ("liabilities", *key, user_id, await self.get_data_version(user_id))
+        result = self.cache.get(versioned_key)
+        if result is None:
+            result = await compute()
+            self.cache.set(versioned_key, result)
+        return result
     
     async def get_all_liabilities(self, user_id: int = 1) -> List[LiabilityOut]:
         """Retrieves all liabilities."""
         if self.is_repository:
             # Database repository
-            liabilities = await self.data_source.get_all(user_id)
-            return [liability_db_to_pydantic(liability) for liability in liabilities]
+            liabilities = await self.data_source.get_all_rows(user_id)
+            return [liability_row_to_pydantic(row) for row in liabilities]
         else:
             # Static data manager (legacy)
             liability_data = self.data_source.get_all_liabilities()
             return [LiabilityOut(**liability) for liability in liability_data]
     
+    async def get_data_version(self, user_id: int = 1) -> Optional[int]:
+        """Version counter that changes with every liability write; None for the legacy data source."""
+        if self.is_repository:
+            return await self.data_source.get_data_version(user_id)
+        return None
+    
+    async def list_liabilities(
+        self,
+        limit: Optional[int] = None,
+        after: Optional[str] = None,
+        liability_type: Optional[str] = None,
+        user_id: int = 1
+    ) -> Tuple[List[LiabilityOut], Optional[str]]:
+        """Retrieves one page of liabilities ordered by id and the cursor of the next page."""
+        after_id = decode_id_cursor(after)
+        if self.is_repository:
+            # Database repository
+            liabilities = await self.data_source.get_all_rows(
+                user_id,
+                limit=fetch_size(limit),
+                after=after_id,
+                liability_type=liability_type
+            )
+            liabilities, has_more = split_page(liabilities, limit)
+            next_cursor = encode_cursor(int(liabilities[-1].id)) if has_more else None
+            return [liability_row_to_pydantic(row) for row in liabilities], next_cursor
+        else:
+            # Static data manager (legacy): filter and paginate in memory
+            liabilities = sorted(
+                (LiabilityOut(**liability) for liability in self.data_source.get_all_liabilities()),
+                key=lambda liability: int(liability.id)
+            )
+            liabilities = [
+                liability for liability in liabilities
+                if (liability_type is None or liability.type == liability_type)
+                and (after_id is None or int(liability.id) > after_id)
+            ]
+            liabilities, has_more = split_page(liabilities, limit)
+            next_cursor = encode_cursor(int(liabilities[-1].id)) if has_more else None
+            return liabilities, next_cursor
+    
     async def get_liability_by_id(self, liability_id: str, user_id: int = 1) -> Optional[LiabilityOut]:
         """Retrieves a liability by ID."""
         if self.is_repository:
@@ -33,6 +101,175 @@ class LiabilityService:
             liability_data = self.data_source.get_liability_by_id(liability_id)
             return LiabilityOut(**liability_data) if liability_data else None
     
+    async def get_total_outstanding(self, user_id: int = 1) -> float:
+        """Retrieves total outstanding amount of all liabilities."""
+        if self.is_repository:
+            # Database repository: aggregated in SQL
+            return await self.data_source.get_total_outstanding(user_id)
+        else:
+            # Static data manager (legacy)
+            return sum(liability["outstandingAmountINR"] for liability in self.data_source.get_all_liabilities())
+    
+    async def get_outstanding_by_type(self, user_id: int = 1) -> Dict[str, Tuple[float, int]]:
+        """Retrieves total outstanding amount and count of liabilities grouped by type."""
+        if self.is_repository:
+            # Database repository: aggregated in SQL
+            return await self.data_source.get_outstanding_by_type(user_id)
+        else:
+            # Static data manager (legacy)
+            breakdown: Dict[str, Tuple[float, int]] = {}
+            for liability in self.data_source.get_all_liabilities():
+                total, count = breakdown.get(liability["type"], (0.0, 0))
+                breakdown[liability["type"]] = (total + liability["outstandingAmountINR"], count + 1)
+            return breakdown
+    
+    async def get_amortization(self, user_id: int = 1) -> AmortizationSummary:
+        """Builds EMI schedules for all liabilities together with the combined monthly debt-service curve (cached per data version and day)."""
+        today = date.today()
+        return await self._cached(("amortization", today), lambda: self._get_amortization(today, user_id), user_id)
+    
+    async def _get_amortization(self, today: date, user_id: int = 1) -> AmortizationSummary:
+        """Builds the amortization summary as of `today` from the current liabilities."""
+        if self.is_repository:
+            # Database repository
+            rows = await self.data_source.get_amortization_inputs(user_id)
+            liabilities = [
+                (str(row.id), row.name, row.outstanding_amount_inr, row.interest_rate, row.due_date)
+                for row in rows
+            ]
+            return self._build_amortization_summary(liabilities, today)
+        else:
+            # Static data manager (legacy)
+            liabilities = [
+                (liability["id"], liability["name"], liability["outstandingAmountINR"],
+                 liability.get("interestRate"), str_to_date(liability.get("dueDate")))
+                for liability in self.data_source.get_all_liabilities()
+            ]
+            return self._build_amortization_summary(liabilities, today)
+    
+    def _revolving_minimum_payments(self, balances: np.ndarray, rates: np.ndarray) -> np.ndarray:
+        """Fixed monthly payment assumed for revolving debt, from the REVOLVING_MINIMUM_PAYMENT settings."""
+        payments = np.maximum(
+            balances * settings.REVOLVING_MINIMUM_PAYMENT_PERCENTAGE / 100,
+            settings.REVOLVING_MINIMUM_PAYMENT_INR
+        )
+        # Never less than the month's interest plus 1% of the balance, so the balance always shrinks
+        return np.maximum(payments, balances * (rates / 1200 + 0.01))
+    
+    def _build_amortization_summary(self, liabilities: List[Tuple[str, str, float, Optional[float], Optional[date]]], today: date) -> AmortizationSummary:
+        """Amortize every liability in one vectorized pass; those without a due date as revolving debt."""
+        principals = np.array([liability[2] for liability in liabilities], dtype=float)
+        rates = np.array([liability[3] or 0.0 for liability in liabilities], dtype=float)
+        revolving = np.array([liability[4] is None for liability in liabilities], dtype=bool)
+        # Loans past their due date are treated as due in full next month
+        tenures = np.array([
+            1 if liability[4] is None else max(1, months_between(today, liability[4]))
+            for liability in liabilities
+        ], dtype=int)
+        if revolving.any():
+            # Revolving debt runs until the minimum payment clears it
+            tenures[revolving] = months_to_repay(
+                principals[revolving], rates[revolving],
+                self._revolving_minimum_payments(principals[revolving], rates[revolving])
+            )
+        schedules = amortize(principals, rates, tenures)
+
+        monthly_debt_service = schedules.payments.sum(axis=0)
+        interest_per_liability = schedules.interest.sum(axis=1)
+        months_to_debt_free = int(tenures.max()) if liabilities else 0
+
+        return AmortizationSummary(
+            totalOutstandingINR=round(sum(liability[2] for liability in liabilities), 2),
+            totalInterestRemaining=round(float(interest_per_liability.sum()), 2),
+            currentMonthlyDebtService=round(float(monthly_debt_service[0]), 2) if liabilities else 0.0,
+            monthsToDebtFree=months_to_debt_free,
+            debtFreeDate=add_months(today, months_to_debt_free).isoformat() if liabilities else None,
+            monthlyDebtService=np.round(monthly_debt_service, 2).tolist(),
+            monthlyInterest=np.round(schedules.interest.sum(axis=0), 2).tolist(),
+            liabilities=[
+                LiabilitySchedule(
+                    id=liability_id,
+                    name=name,
+                    outstandingAmountINR=outstanding,
+                    interestRate=rate,
+                    emi=round(float(emi), 2),
+                    monthsRemaining=int(tenure),
+                    payoffDate=add_months(today, int(tenure)).isoformat(),
+                    totalInterestRemaining=round(float(interest), 2)
+                )
+                for (liability_id, name, outstanding, _, _), rate, emi, tenure, interest in zip(
+                    liabilities, rates, schedules.emi, tenures, interest_per_liability
+                )
+            ],
+            revolvingLiabilityIds=[liability[0] for liability in liabilities if liability[4] is None]
+        )
+    
+    async def compare_payoff_strategies(
+        self,
+        extra_monthly_payment: float,
+        custom_order: Optional[List[str]] = None,
+        user_id: int = 1
+    ) -> PayoffComparison:
+        """Simulates avalanche, snowball and (optionally) custom payoff orders with an extra monthly payment (cached per data version and day)."""
+        key = ("payoff", date.today(), extra_monthly_payment, None if custom_order is None else tuple(custom_order))
+        return await self._cached(key, lambda: self._compare_payoff_strategies(extra_monthly_payment, custom_order, user_id), user_id)
+    
+    async def _compare_payoff_strategies(
+        self,
+        extra_monthly_payment: float,
+        custom_order: Optional[List[str]] = None,
+        user_id: int = 1
+    ) -> PayoffComparison:
+        """Runs the payoff simulation for every strategy."""
+        amortization = await self.get_amortization(user_id)
+        loans = amortization.liabilities
+        loan_ids = [loan.id for loan in loans]
+        if custom_order is not None:
+            unknown_ids = [loan_id for loan_id in custom_order if loan_id not in loan_ids]
+            if unknown_ids:
+                raise ValueError(f"Unknown liability IDs in custom order: {', '.join(unknown_ids)}")
+
+        # Rank loans per strategy, lower ranks are paid first
+        avalanche = sorted(range(len(loans)), key=lambda i: (-loans[i].interestRate, loans[i].outstandingAmountINR))
+        snowball = sorted(range(len(loans)), key=lambda i: (loans[i].outstandingAmountINR, -loans[i].interestRate))
+        strategy_orders = {"avalanche": avalanche, "snowball": snowball}
+        if custom_order is not None:
+            chosen = [loan_ids.index(loan_id) for loan_id in dict.fromkeys(custom_order)]
+            strategy_orders["custom"] = chosen + [i for i in avalanche if i not in chosen]
+        priorities = np.empty((len(strategy_orders), len(loans)), dtype=int)
+        for row, order in enumerate(strategy_orders.values()):
+            priorities[row, order] = np.arange(len(loans))
+
+        principals = np.array([loan.outstandingAmountINR for loan in loans], dtype=float)
+        rates = np.array([loan.interestRate for loan in loans], dtype=float)
+        minimum_payments = np.array([loan.emi for loan in loans], dtype=float)
+        max_months = amortization.monthsToDebtFree + 1
+        # The baseline keeps the same budget and rollover, so savings come from the order and the extra payment only
+        baseline = simulate_payoff(principals, rates, minimum_payments, None, 0.0, max_months)
+        simulation = simulate_payoff(principals, rates, minimum_payments, priorities, extra_monthly_payment, max_months)
+        baseline_interest = float(baseline.total_interest[0])
+
+        today = date.today()
+        return PayoffComparison(
+            extraMonthlyPayment=extra_monthly_payment,
+            baselineMonthsToDebtFree=int(baseline.months_to_debt_free[0]),
+            baselineTotalInterest=round(baseline_interest, 2),
+            strategies=[
+                PayoffStrategyResult(
+                    strategy=strategy,
+                    monthsToDebtFree=int(months),
+                    debtFreeDate=add_months(today, int(months)).isoformat() if loans else None,
+                    totalInterest=round(float(interest), 2),
+                    interestSaved=round(baseline_interest - float(interest), 2),
+                    payoffOrder=[loan_ids[i] for i in np.lexsort((priorities[row], close_months))]
+                )
+                for row, (strategy, months, interest, close_months) in enumerate(zip(
+                    strategy_orders, simulation.months_to_debt_free, simulation.total_interest, simulation.close_months
+                ))
+            ],
+            revolvingLiabilityIds=amortization.revolvingLiabilityIds
+        )
+    
     async def create_liability(self, liability_data: LiabilityIn, user_id: int = 1) -> LiabilityOut:
         """Creates a new liability."""
         if self.is_repository:
@@ -44,6 +281,16 @@ class LiabilityService:
             new_liability_dict = self.data_source.create_liability(liability_data.model_dump())
             return LiabilityOut(**new_liability_dict)
     
+    async def create_liabilities_bulk(self, liabilities_data: List[LiabilityIn], user_id: int = 1) -> List[str]:
+        """Creates many liabilities at once and returns their IDs."""
+        if self.is_repository:
+            # Database repository: one batched insert in a single transaction
+            ids = await self.data_source.create_many([liability_data.model_dump() for liability_data in liabilities_data], user_id)
+            return [str(liability_id) for liability_id in ids]
+        else:
+            # Static data manager (legacy)
+            return [self.data_source.create_liability(liability_data.model_dump())["id"] for liability_data in liabilities_data]
+    
     async def update_liability(self, liability_id: str, liability_update_data: LiabilityIn, user_id: int = 1) -> Optional[LiabilityOut]:
         """Updates an existing liability."""
         if self.is_repository:
@@ -0,0 +1,48 @@
+from typing import List, Optional, Tuple
+from ..db_models import SEARCH_RESOURCE_CODES, SEARCH_ROWID_STRIDE
+from ..models.search_models import SearchHit
+from ..repositories import SearchRepository
+from ..utils.pagination import decode_offset_cursor, encode_cursor, fetch_size, split_page
+
+_RESOURCES_BY_CODE = {code: resource for resource, code in SEARCH_RESOURCE_CODES.items()}
+
+def to_match_query(text: str) -> str:
+    """
+    Turn free text into an FTS5 query matching records that have every word as a prefix of some term.
+
+    Each word is quoted, so characters and keywords with a meaning in FTS5
+    syntax (quotes, AND, NEAR, ...) are searched for literally.
+    """
+    terms = ['"' + word.replace('"', '""') + '"*' for word in text.split()]
+    if not terms:
+        raise ValueError("Search query cannot be empty or just whitespace.")
+    return " ".join(terms)
+
+class SearchService:
+    """Service for ranked full-text search across expenses, goals and assets."""
+    
+    def __init__(self, search_repository: SearchRepository):
+        self.search_repository = search_repository
+    
+    async def search(
+        self,
+        text: str,
+        limit: int = 20,
+        after: Optional[str] = None,
+        user_id: int = 1
+    ) -> Tuple[List[SearchHit], Optional[str]]:
+        """Retrieves one page of matches, best first, and the cursor of the next page."""
+        offset = decode_offset_cursor(after)
+        rows = await self.search_repository.search(to_match_query(text), user_id, fetch_size(limit), offset)
+        rows, has_more = split_page(rows, limit)
+        hits = [
+            SearchHit(
+                resource=_RESOURCES_BY_CODE[row.rowid % SEARCH_ROWID_STRIDE],
+                id=str(row.rowid // SEARCH_ROWID_STRIDE),
+                title=row.title,
+                snippet=row.snippet,
+                score=-row.score
+            )
+            for row in rows
+        ]
+        return hits, encode_cursor(offset + len(rows)) if has_more else None
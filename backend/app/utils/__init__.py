@@ -1,13 +1,30 @@
-from .converters import (
-    asset_db_to_pydantic,
-    liability_db_to_pydantic,
-    expense_db_to_pydantic,
-    goal_db_to_pydantic
-)
+"""
+Shared helpers.
+
+The converters are re-exported lazily: importing a submodule such as
+monte_carlo, which process pool workers load, must not pull in the database
+layer that the converters depend on.
+"""
+
+from importlib import import_module
 
 __all__ = [
     "asset_db_to_pydantic",
     "liability_db_to_pydantic", 
     "expense_db_to_pydantic",
-    "goal_db_to_pydantic"
+    "goal_db_to_pydantic",
+    "categorization_rule_db_to_pydantic",
+    "asset_row_to_pydantic",
+    "liability_row_to_pydantic",
+    "expense_row_to_pydantic",
+    "goal_row_to_pydantic",
+    "str_to_date",
+    "to_db_timestamp",
+    "add_months",
+    "months_between"
 ]
+
+def __getattr__(name: str):
+    if name in __all__:
+        return getattr(import_module(".converters", __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
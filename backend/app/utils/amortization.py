@@ -0,0 +1,144 @@
+"""
+Vectorized EMI amortization for many loans at once.
+
+Every loan is a row of a (loans x months) array padded to the longest tenure;
+months after a loan closes hold zeros.
+"""
+
+from typing import NamedTuple, Optional
+
+import numpy as np
+
+class AmortizationSchedules(NamedTuple):
+    emi: np.ndarray  # (loans,) fixed monthly instalment
+    balances: np.ndarray  # (loans, months + 1) outstanding balance, column 0 is today
+    payments: np.ndarray  # (loans, months) instalment paid in each month
+    interest: np.ndarray  # (loans, months) interest part of each instalment
+
+def amortize(principals: np.ndarray, annual_rates_percentage: np.ndarray, tenures: np.ndarray) -> AmortizationSchedules:
+    """
+    Build EMI schedules for all loans together.
+
+    With a monthly rate r and tenure n, EMI = P r (1+r)^n / ((1+r)^n - 1), or
+    P / n when r is zero. The balance after k instalments is
+    P (1+r)^k - EMI ((1+r)^k - 1) / r.
+    """
+    principals = np.asarray(principals, dtype=float)
+    tenures = np.asarray(tenures, dtype=int)
+    monthly_rates = np.asarray(annual_rates_percentage, dtype=float) / 1200.0
+    max_tenure = int(tenures.max()) if tenures.size else 0
+
+    month_numbers = np.arange(max_tenure + 1)
+    has_interest = monthly_rates > 0
+    safe_rates = np.where(has_interest, monthly_rates, 1.0)
+    growth = (1 + monthly_rates[:, np.newaxis]) ** month_numbers[np.newaxis, :]
+    growth_at_tenure = (1 + monthly_rates) ** tenures
+    emi = np.where(
+        has_interest,
+        principals * safe_rates * growth_at_tenure / np.where(has_interest, growth_at_tenure - 1, 1.0),
+        principals / tenures
+    )
+    annuity = np.where(has_interest[:, np.newaxis], (growth - 1) / safe_rates[:, np.newaxis], month_numbers[np.newaxis, :])
+
+    open_months = month_numbers[np.newaxis, :] <= tenures[:, np.newaxis]
+    balances = np.where(open_months, np.maximum(principals[:, np.newaxis] * growth - emi[:, np.newaxis] * annuity, 0.0), 0.0)
+
+    paying = open_months[:, 1:]
+    payments = np.where(paying, emi[:, np.newaxis], 0.0)
+    interest = np.where(paying, balances[:, :-1] * monthly_rates[:, np.newaxis], 0.0)
+    return AmortizationSchedules(emi=emi, balances=balances, payments=payments, interest=interest)
+
+def months_to_repay(principals: np.ndarray, annual_rates_percentage: np.ndarray, payments: np.ndarray) -> np.ndarray:
+    """
+    Whole months a fixed monthly payment takes to clear each balance, at least one.
+
+    n = -ln(1 - r P / A) / ln(1 + r) for payment A, or P / A when r is zero.
+    Every payment must exceed its loan's first month of interest.
+    """
+    principals = np.asarray(principals, dtype=float)
+    payments = np.asarray(payments, dtype=float)
+    monthly_rates = np.asarray(annual_rates_percentage, dtype=float) / 1200.0
+    has_interest = monthly_rates > 0
+    safe_rates = np.where(has_interest, monthly_rates, 1.0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        months = np.where(
+            has_interest,
+            -np.log1p(-np.minimum(monthly_rates * principals / payments, 1.0 - 1e-12)) / np.log1p(safe_rates),
+            principals / payments
+        )
+    # Shave floating point noise off exact month counts before rounding up
+    return np.maximum(np.ceil(months - 1e-9), 1).astype(int)
+
+class PayoffSimulation(NamedTuple):
+    months_to_debt_free: np.ndarray  # (strategies,)
+    total_interest: np.ndarray  # (strategies,)
+    close_months: np.ndarray  # (strategies, loans) month in which each loan is paid off
+
+def simulate_payoff(
+    principals: np.ndarray,
+    annual_rates_percentage: np.ndarray,
+    minimum_payments: np.ndarray,
+    priorities: Optional[np.ndarray],
+    extra_monthly_payment: float,
+    max_months: int
+) -> PayoffSimulation:
+    """
+    Simulate paying down all loans under several prioritisation strategies at once.
+
+    `priorities` is a (strategies, loans) array of ranks, lower first. Every
+    month each open loan accrues interest and receives its minimum payment. The
+    rest of the budget goes to loans in priority order. The budget is the sum of
+    the minimum payments plus the extra payment, so payments of closed loans
+    roll over to the next target. All strategies and loans advance together as
+    one array, with closed loans masked out.
+
+    With `priorities` None there is a single, untargeted strategy: the rest of
+    the budget is shared by the open loans in proportion to their balances.
+    """
+    strategies = 1 if priorities is None else priorities.shape[0]
+    monthly_rates = np.asarray(annual_rates_percentage, dtype=float) / 1200.0
+    minimum_payments = np.asarray(minimum_payments, dtype=float)
+    balances = np.tile(np.asarray(principals, dtype=float), (strategies, 1))
+    budget = minimum_payments.sum() + extra_monthly_payment
+    order = None if priorities is None else np.argsort(priorities, axis=1, kind="stable")
+
+    total_interest = np.zeros(strategies)
+    close_months = np.zeros(balances.shape, dtype=int)
+    months_to_debt_free = np.zeros(strategies, dtype=int)
+    for month in range(1, max_months + 1):
+        open_loans = balances > 0
+        if not open_loans.any():
+            break
+        interest = balances * monthly_rates
+        total_interest += interest.sum(axis=1)
+        balances = balances + interest
+
+        minimum = np.minimum(np.where(open_loans, minimum_payments, 0.0), balances)
+        balances = balances - minimum
+        leftover = np.maximum(budget - minimum.sum(axis=1), 0.0)
+
+        if order is None:
+            # Share the leftover in proportion to the balances
+            total_balance = balances.sum(axis=1, keepdims=True)
+            share = balances / np.where(total_balance > 0, total_balance, 1.0)
+            extra = np.minimum(leftover[:, np.newaxis] * share, balances)
+        else:
+            # Pour the leftover into the loans in priority order
+            ordered_balances = np.take_along_axis(balances, order, axis=1)
+            paid_before = np.cumsum(ordered_balances, axis=1) - ordered_balances
+            ordered_extra = np.clip(leftover[:, np.newaxis] - paid_before, 0.0, ordered_balances)
+            extra = np.empty_like(ordered_extra)
+            np.put_along_axis(extra, order, ordered_extra, axis=1)
+        balances = balances - extra
+
+        # Treat sub-paisa remainders from floating point as paid off
+        balances = np.where(balances < 0.005, 0.0, balances)
+        closed_now = open_loans & (balances == 0)
+        close_months[closed_now] = month
+        finished_now = open_loans.any(axis=1) & ~(balances > 0).any(axis=1)
+        months_to_debt_free[finished_now] = month
+    return PayoffSimulation(
+        months_to_debt_free=months_to_debt_free,
+        total_interest=total_interest,
+        close_months=close_months
+    )
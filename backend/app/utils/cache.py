@@ -0,0 +1,79 @@
+"""
+Result caches for FI calculations and compiled categorization rules, with a pluggable backend.
+
+Keys carry the user's data version, which every repository write bumps, so
+entries never need a TTL: a write moves readers to new keys and the old
+entries age out of the LRU.
+"""
+
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+import threading
+from typing import Any, Hashable, Optional
+from ..config import get_settings
+
+settings = get_settings()
+
+class CacheBackend(ABC):
+    """Storage interface for cached results; a shared store can implement it later."""
+    
+    @abstractmethod
+    def get(self, key: Hashable) -> Optional[Any]:
+        pass
+    
+    @abstractmethod
+    def set(self, key: Hashable, value: Any) -> None:
+        pass
+    
+    @abstractmethod
+    def clear(self) -> None:
+        pass
+
+class LRUCacheBackend(CacheBackend):
+    """In-process cache bounded by entry count, evicting the least recently used entry."""
+    
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, key: Hashable) -> Optional[Any]:
+        with self._lock:
+            if key not in self._entries:
+                return None
+            self._entries.move_to_end(key)
+            return self._entries[key]
+    
+    def set(self, key: Hashable, value: Any) -> None:
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+    
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+_fi_cache: Optional[CacheBackend] = None
+
+def get_fi_cache() -> CacheBackend:
+    """Get the FI result cache, creating the default in-process LRU on first use."""
+    global _fi_cache
+    if _fi_cache is None:
+        _fi_cache = LRUCacheBackend(settings.FI_CACHE_MAX_ENTRIES)
+    return _fi_cache
+
+def set_fi_cache(backend: CacheBackend) -> None:
+    """Replace the FI result cache backend, e.g. with a shared store."""
+    global _fi_cache
+    _fi_cache = backend
+
+_rule_cache: Optional[CacheBackend] = None
+
+def get_rule_cache() -> CacheBackend:
+    """Get the cache of compiled categorization rules, keyed by user and rule set version."""
+    global _rule_cache
+    if _rule_cache is None:
+        _rule_cache = LRUCacheBackend(settings.RULE_CACHE_MAX_ENTRIES)
+    return _rule_cache
@@ -1,35 +1,57 @@
-from typing import Dict, Any
-from ..db_models import Asset, Liability, Expense, Goal
+from datetime import date, datetime, timezone
+from typing import Dict, Any, Optional, Type, TypeVar, Union
+from pydantic import BaseModel
+from sqlalchemy import Row
+from ..db_models import Asset, Liability, Expense, Goal, CategorizationRule
 from ..models.asset_models import AssetOut
 from ..models.liability_models import LiabilityOut
 from ..models.expense_models import ExpenseOut
 from ..models.goal_models import GoalOut
+from ..models.rule_models import CategorizationRuleOut
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+def _construct_trusted(model: Type[ModelT], values: Dict[str, Any]) -> ModelT:
+    """
+    Build a response model from already-validated values without running validators.
+
+    Rows were validated on the way into the database. This fills the model's
+    instance slots directly, which is several times cheaper per row than either
+    the constructor or model_construct. `values` must contain every field; they
+    are stored in the model's field order so responses serialize as before.
+    """
+    instance = model.__new__(model)
+    object.__setattr__(instance, "__dict__", {name: values[name] for name in model.model_fields})
+    object.__setattr__(instance, "__pydantic_fields_set__", set(values))
+    object.__setattr__(instance, "__pydantic_extra__", None)
+    object.__setattr__(instance, "__pydantic_private__", None)
+    return instance
 
 def asset_db_to_pydantic(asset: Asset) -> AssetOut:
     """Convert database Asset model to Pydantic AssetOut model."""
-    return AssetOut(
+    return _construct_trusted(AssetOut, dict(
         id=str(asset.id),
         name=asset.name,
         valueINR=asset.value_inr,
         assetClass=asset.asset_class,
         assetType=asset.asset_type,
         fpAssetClass=asset.fp_asset_class
-    )
+    ))
 
 def liability_db_to_pydantic(liability: Liability) -> LiabilityOut:
     """Convert database Liability model to Pydantic LiabilityOut model."""
-    return LiabilityOut(
+    return _construct_trusted(LiabilityOut, dict(
         id=str(liability.id),
         name=liability.name,
         type=liability.type,
         outstandingAmountINR=liability.outstanding_amount_inr,
         interestRate=liability.interest_rate,
         dueDate=str(liability.due_date) if liability.due_date else None
-    )
+    ))
 
 def expense_db_to_pydantic(expense: Expense) -> ExpenseOut:
     """Convert database Expense model to Pydantic ExpenseOut model."""
-    return ExpenseOut(
+    return _construct_trusted(ExpenseOut, dict(
         id=str(expense.id),
         category=expense.category,
         details=expense.details,
@@ -37,11 +59,11 @@ def expense_db_to_pydantic(expense: Expense) -> ExpenseOut:
         frequency=expense.frequency,
         needWant=expense.need_want,
         date=str(expense.date)
-    )
+    ))
 
 def goal_db_to_pydantic(goal: Goal) -> GoalOut:
     """Convert database Goal model to Pydantic GoalOut model."""
-    return GoalOut(
+    return _construct_trusted(GoalOut, dict(
         id=str(goal.id),
         name=goal.name,
         targetAmount=goal.target_amount,
@@ -50,4 +72,55 @@ def goal_db_to_pydantic(goal: Goal) -> GoalOut:
         priority=goal.priority,
         category=goal.category,
         notes=goal.notes
-    )
+    ))
+
+def categorization_rule_db_to_pydantic(rule: CategorizationRule) -> CategorizationRuleOut:
+    """Convert database CategorizationRule model to Pydantic CategorizationRuleOut model."""
+    return _construct_trusted(CategorizationRuleOut, dict(
+        id=str(rule.id),
+        keyword=rule.keyword,
+        category=rule.category,
+        needWant=rule.need_want
+    ))
+
+def asset_row_to_pydantic(row: Row) -> AssetOut:
+    """Convert an AssetRepository.get_all_rows row to Pydantic AssetOut model."""
+    return _construct_trusted(AssetOut, row._asdict())
+
+def liability_row_to_pydantic(row: Row) -> LiabilityOut:
+    """Convert a LiabilityRepository.get_all_rows row to Pydantic LiabilityOut model."""
+    return _construct_trusted(LiabilityOut, row._asdict())
+
+def expense_row_to_pydantic(row: Row) -> ExpenseOut:
+    """Convert an ExpenseRepository.get_all_rows row to Pydantic ExpenseOut model."""
+    return _construct_trusted(ExpenseOut, row._asdict())
+
+def goal_row_to_pydantic(row: Row) -> GoalOut:
+    """Convert a GoalRepository.get_all_rows row to Pydantic GoalOut model."""
+    return _construct_trusted(GoalOut, row._asdict())
+
+def str_to_date(value: Optional[Union[str, date]]) -> Optional[date]:
+    """Convert an ISO (YYYY-MM-DD) string to a date; dates and None pass through."""
+    if value is None or isinstance(value, date):
+        return value
+    return datetime.strptime(value, '%Y-%m-%d').date()
+
+def to_db_timestamp(value: datetime) -> str:
+    """
+    Format a datetime like SQLite's CURRENT_TIMESTAMP (UTC, second precision).
+
+    created_at/updated_at are stored as that text, so range filters must bind the
+    same format to compare correctly and keep using their indexes.
+    """
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value.strftime("%Y-%m-%d %H:%M:%S")
+
+def add_months(start: date, months: int) -> date:
+    """First day of the month `months` after the month of `start`."""
+    month_index = start.year * 12 + start.month - 1 + months
+    return date(month_index // 12, month_index % 12 + 1, 1)
+
+def months_between(start: date, end: date) -> int:
+    """Number of calendar months from the month of `start` to the month of `end`."""
+    return (end.year - start.year) * 12 + end.month - start.month
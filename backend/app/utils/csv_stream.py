@@ -0,0 +1,83 @@
+"""
+Incremental CSV parsing of a byte stream.
+
+The stream is decoded as it arrives and split into lines, which feed one
+persistent csv.reader, so quoting is decided by the csv module itself. When a
+record still needs lines that have not arrived yet, its lines are kept and
+parsed again once more of the stream is in.
+"""
+
+import codecs
+import csv
+from collections import deque
+from typing import AsyncIterable, AsyncIterator, Iterator, List
+
+class _NeedMoreInput(Exception):
+    """The reader asked for a line that has not arrived yet."""
+
+class _LineFeed:
+    """Line iterator behind the csv reader, refilled as the stream arrives."""
+
+    def __init__(self):
+        self.lines: deque = deque()
+        # Lines handed to the reader for the record it is parsing
+        self.record: List[str] = []
+        self.closed = False
+
+    def __iter__(self) -> "_LineFeed":
+        return self
+
+    def __next__(self) -> str:
+        if not self.lines:
+            if self.closed:
+                raise StopIteration
+            raise _NeedMoreInput
+        line = self.lines.popleft()
+        self.record.append(line)
+        return line
+
+def _read_available_rows(reader: Iterator[List[str]], feed: _LineFeed) -> Iterator[List[str]]:
+    """Yield the non-blank rows whose lines have all arrived."""
+    while True:
+        feed.record.clear()
+        try:
+            row = next(reader)
+        except _NeedMoreInput:
+            # Put the unfinished record back to parse again with the next chunk
+            feed.lines.extendleft(reversed(feed.record))
+            return
+        except StopIteration:
+            return
+        if row:
+            yield row
+
+async def iter_csv_rows(
+    chunks: AsyncIterable[bytes],
+    max_record_chars: int = 1_000_000,
+    encoding: str = "utf-8-sig"
+) -> AsyncIterator[List[str]]:
+    """
+    Yield the rows of a CSV byte stream, skipping blank lines.
+
+    Only the current partial record is buffered, so memory does not grow with
+    the stream. A record longer than `max_record_chars` (usually an unclosed
+    quote) raises ValueError, as does text that is not valid in `encoding`.
+    """
+    decoder = codecs.getincrementaldecoder(encoding)()
+    feed = _LineFeed()
+    reader = csv.reader(feed)
+    pending = ""
+    async for chunk in chunks:
+        lines = (pending + decoder.decode(chunk)).split("\n")
+        pending = lines.pop()
+        feed.lines.extend(line + "\n" for line in lines)
+        for row in _read_available_rows(reader, feed):
+            yield row
+        if len(pending) + sum(map(len, feed.lines)) > max_record_chars:
+            raise ValueError(f"CSV record exceeds {max_record_chars} characters; check for an unclosed quote.")
+    pending += decoder.decode(b"", final=True)
+    if pending:
+        feed.lines.append(pending)
+    feed.closed = True
+    for row in _read_available_rows(reader, feed):
+        yield row
@@ -0,0 +1,21 @@
+from typing import Optional
+from fastapi import Response, status
+
+ETAG_HEADER = "ETag"
+
+def make_etag(resource: str, version: Optional[int]) -> Optional[str]:
+    """Weak ETag for a resource at a data version; None when the data source has no versions."""
+    return None if version is None else f'W/"{resource}-{version}"'
+
+def is_not_modified(if_none_match: Optional[str], etag: Optional[str]) -> bool:
+    """Whether an If-None-Match header matches `etag`, using the weak comparison GET requires."""
+    if if_none_match is None or etag is None:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque_tag = etag.removeprefix("W/")
+    return any(candidate.strip().removeprefix("W/") == opaque_tag for candidate in if_none_match.split(","))
+
+def not_modified_response(etag: str) -> Response:
+    """Empty 304 response carrying the current ETag."""
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={ETAG_HEADER: etag})
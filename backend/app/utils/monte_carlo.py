@@ -0,0 +1,116 @@
+"""
+Vectorized Monte Carlo simulation of a corpus funding inflation-linked withdrawals.
+
+This module only depends on NumPy so that process pool workers can import it
+without pulling in the web application.
+"""
+
+import asyncio
+from concurrent.futures import Executor, ProcessPoolExecutor
+import multiprocessing
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+_process_pool: Optional[ProcessPoolExecutor] = None
+
+def get_process_pool() -> ProcessPoolExecutor:
+    """Get the shared process pool, creating it on first use."""
+    global _process_pool
+    if _process_pool is None:
+        # Spawned workers avoid forking a process that is running an event loop and threads
+        _process_pool = ProcessPoolExecutor(mp_context=multiprocessing.get_context("spawn"))
+    return _process_pool
+
+def shutdown_process_pool() -> None:
+    """Shut down the shared process pool if it was started."""
+    global _process_pool
+    if _process_pool is not None:
+        _process_pool.shutdown(cancel_futures=True)
+        _process_pool = None
+
+def portfolio_return_assumptions(
+    weights: Dict[str, float],
+    assumptions: Dict[str, Tuple[float, float]]
+) -> Tuple[float, float]:
+    """
+    Combine per-asset-class (expected return %, volatility %) into portfolio figures.
+
+    Asset classes are treated as uncorrelated, so the portfolio variance is the
+    weighted sum of the class variances.
+    """
+    total_weight = sum(weights.values())
+    if total_weight <= 0:
+        return 0.0, 0.0
+    expected_return = sum(weight * assumptions[asset_class][0] for asset_class, weight in weights.items()) / total_weight
+    variance = sum((weight / total_weight * assumptions[asset_class][1]) ** 2 for asset_class, weight in weights.items())
+    return expected_return, float(np.sqrt(variance))
+
+def simulate_corpus_paths(
+    starting_corpus: float,
+    annual_withdrawal: float,
+    inflation: float,
+    expected_return: float,
+    volatility: float,
+    years: int,
+    num_paths: int,
+    seed_sequence: np.random.SeedSequence
+) -> np.ndarray:
+    """
+    Simulate corpus values as a (num_paths, years + 1) array; column 0 is today.
+
+    Yearly growth factors are lognormal with the given arithmetic mean and
+    volatility (as fractions). Each year the corpus grows and then pays out a
+    withdrawal that rises with inflation. With G_t the cumulative growth, the
+    corpus is W_t = G_t * (W_0 - sum_{k<=t} E_k / G_k), so every path comes from
+    one cumprod and one cumsum. Growth is always positive, so once a path is
+    depleted it stays depleted; depleted values are clipped to zero.
+    """
+    rng = np.random.default_rng(seed_sequence)
+    log_volatility = np.sqrt(np.log1p(volatility ** 2 / (1 + expected_return) ** 2))
+    log_mean = np.log1p(expected_return) - log_volatility ** 2 / 2
+
+    growth = np.exp(rng.normal(log_mean, log_volatility, size=(num_paths, years)))
+    cumulative_growth = np.cumprod(growth, axis=1)
+    withdrawals = annual_withdrawal * (1 + inflation) ** np.arange(years)
+    corpus = cumulative_growth * (starting_corpus - np.cumsum(withdrawals / cumulative_growth, axis=1))
+
+    paths = np.empty((num_paths, years + 1))
+    paths[:, 0] = starting_corpus
+    paths[:, 1:] = corpus
+    return np.maximum(paths, 0.0)
+
+async def run_monte_carlo(
+    starting_corpus: float,
+    annual_withdrawal: float,
+    inflation: float,
+    expected_return: float,
+    volatility: float,
+    years: int,
+    num_paths: int,
+    percentiles: List[float],
+    seed: Optional[int] = None,
+    chunk_paths: int = 25000,
+    executor: Optional[Executor] = None
+) -> Tuple[float, np.ndarray]:
+    """
+    Run the simulation in chunks off the event loop.
+
+    Each chunk gets its own child of SeedSequence(seed), so a seeded run gives
+    the same result whether the chunks run in threads or in a process pool.
+    Returns the share of paths that never run out and a (percentiles, years + 1)
+    array of corpus percentiles.
+    """
+    chunk_sizes = [min(chunk_paths, num_paths - start) for start in range(0, num_paths, chunk_paths)]
+    seed_sequences = np.random.SeedSequence(seed).spawn(len(chunk_sizes))
+    loop = asyncio.get_running_loop()
+    chunks = await asyncio.gather(*(
+        loop.run_in_executor(
+            executor, simulate_corpus_paths,
+            starting_corpus, annual_withdrawal, inflation, expected_return, volatility, years, size, seed_sequence
+        )
+        for size, seed_sequence in zip(chunk_sizes, seed_sequences)
+    ))
+    paths = np.concatenate(chunks)
+    success_rate = float(np.mean(paths[:, -1] > 0))
+    return success_rate, np.percentile(paths, percentiles, axis=0)
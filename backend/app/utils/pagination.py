@@ -0,0 +1,59 @@
+import base64
+import json
+from datetime import date
+from typing import Any, List, Optional, Tuple
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+def encode_cursor(*keys: Any) -> str:
+    """Encode the sort key of the last row on a page into an opaque cursor."""
+    payload = [key.isoformat() if isinstance(key, date) else key for key in keys]
+    return base64.urlsafe_b64encode(json.dumps(payload).encode()).decode()
+
+def decode_cursor(cursor: str, key_count: int) -> List[Any]:
+    """Decode an opaque cursor back into its sort key values."""
+    try:
+        keys = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except (ValueError, TypeError):
+        raise ValueError("Invalid pagination cursor.")
+    if not isinstance(keys, list) or len(keys) != key_count:
+        raise ValueError("Invalid pagination cursor.")
+    return keys
+
+def decode_id_cursor(cursor: Optional[str]) -> Optional[int]:
+    """Decode a cursor for collections ordered by id."""
+    if cursor is None:
+        return None
+    (entity_id,) = decode_cursor(cursor, 1)
+    if not isinstance(entity_id, int):
+        raise ValueError("Invalid pagination cursor.")
+    return entity_id
+
+def decode_date_id_cursor(cursor: Optional[str]) -> Optional[Tuple[date, int]]:
+    """Decode a cursor for collections ordered by (date, id)."""
+    if cursor is None:
+        return None
+    key_date, entity_id = decode_cursor(cursor, 2)
+    try:
+        return date.fromisoformat(key_date), int(entity_id)
+    except (ValueError, TypeError):
+        raise ValueError("Invalid pagination cursor.")
+
+def split_page(rows: List[Any], limit: Optional[int]) -> Tuple[List[Any], bool]:
+    """Trim a `limit + 1` fetch down to one page and report whether more rows follow."""
+    if limit is None or len(rows) <= limit:
+        return rows, False
+    return rows[:limit], True
+
+def fetch_size(limit: Optional[int]) -> Optional[int]:
+    """Rows to fetch for a page: one extra row reveals whether a next page exists."""
+    return None if limit is None else limit + 1
+
+def decode_offset_cursor(cursor: Optional[str]) -> int:
+    """Decode a cursor for ranked results, which are paged by position."""
+    if cursor is None:
+        return 0
+    (offset,) = decode_cursor(cursor, 1)
+    if not isinstance(offset, int) or offset < 0:
+        raise ValueError("Invalid pagination cursor.")
+    return offset
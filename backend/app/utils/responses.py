@@ -0,0 +1,29 @@
+"""
+orjson-based JSON response class.
+
+FastAPI turns response models into plain JSON-compatible data before the
+response class renders it. The default JSONResponse then encodes that data
+with the stdlib json module. For large lists that encoding costs more than
+the rest of serialization put together.
+"""
+
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+# Built once and reused for every response
+_ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+def _encode_fallback(value: Any) -> Any:
+    """Encode values orjson does not handle natively (models returned without a response_model)."""
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json")
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+class FastJSONResponse(JSONResponse):
+    """JSONResponse rendered with orjson."""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, default=_encode_fallback, option=_ORJSON_OPTIONS)
@@ -0,0 +1,58 @@
+"""
+Keyword rules for categorizing expenses, compiled into one regular expression.
+
+Keywords are matched as case-insensitive substrings of the normalized
+details. Instead of one alternative per keyword, the keywords are merged into
+a trie and emitted as nested groups, e.g. "amazon", "amazon prime" and "atm"
+become a(?:mazon(?: prime)?|tm). Keywords sharing a prefix share the work of
+matching it, so a search costs about the same with thousands of rules as with
+a few. The optional longer branches are greedy, so the leftmost match in the
+details wins and, at that position, the longest keyword.
+"""
+
+import re
+from typing import Dict, Iterable, NamedTuple, Optional
+
+def normalize_text(value: str) -> str:
+    """Casefold and collapse whitespace, as done for both keywords and details."""
+    return " ".join(value.split()).casefold()
+
+class RuleOutcome(NamedTuple):
+    category: str
+    need_want: Optional[str]  # None leaves the expense's need/want unchanged
+
+def _trie_pattern(keywords: Iterable[str]) -> str:
+    """Regex matching any of `keywords`, with shared prefixes factored out."""
+    trie: Dict[str, dict] = {}
+    for keyword in keywords:
+        node = trie
+        for char in keyword:
+            node = node.setdefault(char, {})
+        node[""] = {}  # A keyword ends here
+    
+    def emit(node: Dict[str, dict]) -> str:
+        branches = [re.escape(char) + emit(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        return f"(?:{body})?" if "" in node else body
+    
+    return emit(trie)
+
+class CompiledRules:
+    """A user's keyword rules compiled for matching against expense details."""
+    
+    def __init__(self, rules: Dict[str, RuleOutcome]):
+        # Keys are normalized keywords
+        self._outcomes = rules
+        self._pattern = re.compile(_trie_pattern(rules)) if rules else None
+    
+    def __len__(self) -> int:
+        return len(self._outcomes)
+    
+    def match(self, details: Optional[str]) -> Optional[RuleOutcome]:
+        """Outcome of the rule whose keyword occurs first in `details` (the longest one at that position)."""
+        if self._pattern is None or not details:
+            return None
+        found = self._pattern.search(normalize_text(details))
+        return self._outcomes[found.group()] if found else None
@@ -1,4 +1,5 @@
 from fastapi import FastAPI
+from fastapi.responses import JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 
 # Import routers
@@ -7,16 +8,26 @@ from app.api.expenses_router import router as expenses_api_router
 from app.api.liabilities_router import router as liabilities_api_router
 from app.api.goals_router import router as goals_api_router
 from app.api.fi_router import router as fi_api_router
+from app.api.dashboard_router import router as dashboard_api_router
+from app.api.sync_router import router as sync_api_router
+from app.api.export_router import router as export_api_router
+from app.api.categorization_rules_router import router as categorization_rules_api_router
+from app.api.search_router import router as search_api_router
 
 # Import configuration
 from app.config import get_settings
+from app.utils.pagination import NEXT_CURSOR_HEADER
+from app.utils.etag import ETAG_HEADER
+from app.utils.monte_carlo import shutdown_process_pool
+from app.utils.responses import FastJSONResponse
 
 settings = get_settings()
 
 app = FastAPI(
     title=settings.API_TITLE,
     description=settings.API_DESCRIPTION,
-    version=settings.API_VERSION
+    version=settings.API_VERSION,
+    default_response_class=FastJSONResponse if settings.FAST_JSON_RESPONSES else JSONResponse
 )
 
 # CORS configuration
@@ -26,6 +37,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],  # Allows all methods
     allow_headers=["*"],  # Allows all headers
+    expose_headers=[NEXT_CURSOR_HEADER, ETAG_HEADER],  # Lets the UI read pagination cursors and ETags
 )
 
 # Include API routers
@@ -34,6 +46,16 @@ app.include_router(expenses_api_router)
 app.include_router(liabilities_api_router)
 app.include_router(goals_api_router)
 app.include_router(fi_api_router)
+app.include_router(dashboard_api_router)
+app.include_router(sync_api_router)
+app.include_router(export_api_router)
+app.include_router(categorization_rules_api_router)
+app.include_router(search_api_router)
+
+@app.on_event("shutdown")
+async def shutdown():
+    # Stop Monte Carlo worker processes, if any were started
+    shutdown_process_pool()
 
 @app.get("/")
 async def root():
@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# Make the `app` package importable when pytest runs from any directory
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
@@ -0,0 +1,36 @@
+"""
+Tests for the batched create_many repository methods.
+"""
+
+import asyncio
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.database import Base
+from app.db_models import Expense
+from app.repositories import ExpenseRepository
+
+def test_create_many_returns_ids_in_request_order():
+    async def run():
+        engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        try:
+            async with async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)() as session:
+                repository = ExpenseRepository(session)
+                await repository.create_many([
+                    {"category": "Food", "details": "seed", "amount": 1.0, "frequency": "Monthly", "needWant": "Need", "date": "2024-01-01"}
+                ])
+                details = [f"row {i}" for i in range(250)]
+                ids = await repository.create_many([
+                    {"category": "Food", "details": detail, "amount": 1.0, "frequency": "Monthly", "needWant": "Need", "date": "2024-01-02"}
+                    for detail in details
+                ])
+                rows = dict((await session.execute(select(Expense.id, Expense.details).where(Expense.id.in_(ids)))).all())
+                return [rows[expense_id] for expense_id in ids], details
+        finally:
+            await engine.dispose()
+
+    returned, requested = asyncio.run(run())
+    assert returned == requested
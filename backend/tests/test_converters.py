@@ -0,0 +1,75 @@
+"""
+Tests that the trusted converters build the same models as the validating constructor.
+
+_construct_trusted fills pydantic's instance slots directly, so these catch a
+pydantic upgrade that adds or renames a slot.
+"""
+
+from datetime import date
+
+import pytest
+
+from app.db_models import Asset, CategorizationRule, Expense, Goal, Liability
+from app.models.asset_models import AssetOut
+from app.models.expense_models import ExpenseOut
+from app.models.goal_models import GoalOut
+from app.models.liability_models import LiabilityOut
+from app.models.rule_models import CategorizationRuleOut
+from app.utils.converters import (
+    asset_db_to_pydantic, categorization_rule_db_to_pydantic, expense_db_to_pydantic,
+    goal_db_to_pydantic, liability_db_to_pydantic
+)
+
+CASES = [
+    (
+        asset_db_to_pydantic,
+        Asset(id=1, user_id=1, name="Index Fund", value_inr=25000.0, asset_class="Equity",
+              asset_type="Equity Mutual Fund", fp_asset_class="Retirement"),
+        AssetOut,
+        dict(id="1", name="Index Fund", valueINR=25000.0, assetClass="Equity",
+             assetType="Equity Mutual Fund", fpAssetClass="Retirement"),
+    ),
+    (
+        liability_db_to_pydantic,
+        Liability(id=2, user_id=1, name="Home Loan", type="Home Loan", outstanding_amount_inr=500000.0,
+                  interest_rate=8.5, due_date=date(2040, 3, 1)),
+        LiabilityOut,
+        dict(id="2", name="Home Loan", type="Home Loan", outstandingAmountINR=500000.0,
+             interestRate=8.5, dueDate="2040-03-01"),
+    ),
+    (
+        expense_db_to_pydantic,
+        Expense(id=3, user_id=1, category="Food", details="Groceries", amount=1500.0,
+                frequency="Monthly", need_want="Need", date=date(2024, 1, 2)),
+        ExpenseOut,
+        dict(id="3", category="Food", details="Groceries", amount=1500.0,
+             frequency="Monthly", needWant="Need", date="2024-01-02"),
+    ),
+    (
+        goal_db_to_pydantic,
+        Goal(id=4, user_id=1, name="Retire", target_amount=1000000.0, current_amount=10.0,
+             target_date=date(2050, 1, 1), priority="high", category="Retirement", notes=None),
+        GoalOut,
+        dict(id="4", name="Retire", targetAmount=1000000.0, currentAmount=10.0,
+             targetDate="2050-01-01", priority="high", category="Retirement", notes=None),
+    ),
+    (
+        categorization_rule_db_to_pydantic,
+        CategorizationRule(id=5, user_id=1, keyword="swiggy", category="Food", need_want="Want"),
+        CategorizationRuleOut,
+        dict(id="5", keyword="swiggy", category="Food", needWant="Want"),
+    ),
+]
+
+@pytest.mark.parametrize("convert, row, model, values", CASES, ids=lambda case: getattr(case, "__name__", None))
+def test_trusted_converter_matches_validated_model(convert, row, model, values):
+    trusted = convert(row)
+    validated = model(**values)
+    assert type(trusted) is model
+    assert trusted == validated
+    assert trusted.model_dump() == validated.model_dump()
+    assert trusted.model_dump_json() == validated.model_dump_json()
+    assert trusted.model_fields_set == validated.model_fields_set
+    assert trusted.__pydantic_extra__ == validated.__pydantic_extra__
+    assert trusted.__pydantic_private__ == validated.__pydantic_private__
+    assert trusted.model_copy(update={"id": "9"}).id == "9"
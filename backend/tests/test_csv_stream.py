@@ -0,0 +1,45 @@
+"""
+Tests for incremental CSV parsing of a byte stream.
+"""
+
+import asyncio
+import csv
+import io
+
+import pytest
+
+from app.utils.csv_stream import iter_csv_rows
+
+def _parse(data: bytes, chunk_size: int, **kwargs):
+    """Stream `data` in chunks of `chunk_size` bytes and collect the rows."""
+    async def chunks():
+        for start in range(0, len(data), chunk_size):
+            yield data[start:start + chunk_size]
+
+    async def collect():
+        return [row async for row in iter_csv_rows(chunks(), **kwargs)]
+    return asyncio.run(collect())
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 64, 1 << 16])
+def test_rows_match_the_csv_module(chunk_size):
+    text = (
+        "Date,Amount,Description\r\n"
+        '2024-02-01,100,"ATM, Main St"\r\n'
+        '2024-02-02,5,"note spanning\nlines with ""quotes"""\r\n'
+        "\r\n"
+        "2024-02-03,70,₹ lunch"
+    )
+    expected = [row for row in csv.reader(io.StringIO(text, newline="")) if row]
+    assert _parse(text.encode(), chunk_size) == expected
+
+def test_stray_quote_in_unquoted_field_does_not_swallow_the_file():
+    lines = ["Date,Amount,Description", '2024-02-01,15000,TV 32" screen']
+    lines += [f"2024-02-02,{i},coffee" for i in range(20000)]
+    rows = _parse("\n".join(lines).encode(), 4096, max_record_chars=1000)
+    assert len(rows) == 20002
+    assert rows[1][2] == 'TV 32" screen'
+
+def test_unclosed_quote_is_reported():
+    data = b'Date,Amount,Description\n2024-02-01,1,"never closed\n' + b"2024-02-02,2,more\n" * 100
+    with pytest.raises(ValueError):
+        _parse(data, 64, max_record_chars=500)
@@ -0,0 +1,95 @@
+"""
+Tests for the CSV statement import and its duplicate detection.
+"""
+
+import asyncio
+
+import pytest
+from pydantic import ValidationError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.database import Base
+from app.models.expense_models import ExpenseImportMapping
+from app.repositories import ExpenseRepository
+from app.services.expense_service import ExpenseService, settings
+
+async def _import(statements):
+    """Import each CSV text in turn into a fresh in-memory database and return the results."""
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    session_factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    results = []
+    try:
+        async with session_factory() as session:
+            service = ExpenseService(ExpenseRepository(session))
+            for statement in statements:
+                async def rows():
+                    for line in statement.strip().splitlines():
+                        yield line.split(",")
+                results.append(await service.import_expenses(rows(), ExpenseImportMapping()))
+    finally:
+        await engine.dispose()
+    return results
+
+def test_repeated_rows_in_interleaved_dates_are_kept():
+    statement = """
+Date,Amount,Description
+2024-02-01,100,ATM withdrawal
+2024-02-02,5,coffee
+2024-02-01,100,ATM withdrawal
+"""
+    (result,) = asyncio.run(_import([statement]))
+    assert result.importedCount == 3
+    assert result.duplicateCount == 0
+
+def test_reimport_skips_rows_already_imported():
+    first = """
+Date,Amount,Description
+2024-02-01,100,ATM withdrawal
+2024-02-02,5,coffee
+2024-02-01,100,ATM withdrawal
+"""
+    overlapping = first + """
+2024-02-03,70,lunch
+2024-02-01,100,ATM withdrawal
+"""
+    first_result, second_result = asyncio.run(_import([first, overlapping]))
+    assert first_result.importedCount == 3
+    assert second_result.importedCount == 2
+    assert second_result.duplicateCount == 3
+
+def test_credit_amounts_are_skipped():
+    statement = """
+Date,Amount,Description
+2024-02-01,500 Cr,refund
+2024-02-01,(250.00),reversal
+2024-02-01,CR 75,cashback
+2024-02-02,₹1200.50 Dr,rent
+2024-02-03,,blank
+"""
+    (result,) = asyncio.run(_import([statement]))
+    assert result.importedCount == 1
+    assert result.skippedCount == 4
+    assert result.errorCount == 0
+
+def test_mapping_rejects_values_every_row_would_fail():
+    with pytest.raises(ValidationError):
+        ExpenseImportMapping(frequency="Weekly")
+    with pytest.raises(ValidationError):
+        ExpenseImportMapping(needWant="Maybe")
+    assert ExpenseImportMapping(frequency=" Monthly ").frequency == "Monthly"
+
+def test_occurrences_are_kept_for_a_bounded_window_of_dates(monkeypatch):
+    monkeypatch.setattr(settings, "IMPORT_OCCURRENCE_DATES", 2)
+    statement = """
+Date,Amount,Description
+2024-02-01,100,ATM withdrawal
+2024-02-02,5,coffee
+2024-02-01,100,ATM withdrawal
+2024-02-03,5,coffee
+2024-02-04,5,coffee
+"""
+    (result,) = asyncio.run(_import([statement]))
+    assert result.importedCount == 5
+    assert result.duplicateCount == 0
@@ -0,0 +1,77 @@
+"""
+Tests for liability amortization and payoff strategies.
+"""
+
+import asyncio
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.database import Base
+from app.models.liability_models import LiabilityIn
+from app.repositories import LiabilityRepository
+from app.services.liability_service import LiabilityService
+from app.utils.cache import LRUCacheBackend
+
+HOME_LOAN = LiabilityIn(name="Home Loan", type="Secured Loan", outstandingAmountINR=2_000_000, interestRate=8.5, dueDate="2040-01-01")
+CAR_LOAN = LiabilityIn(name="Car Loan", type="Secured Loan", outstandingAmountINR=500_000, interestRate=9.5, dueDate="2029-06-01")
+
+async def _with_service(run):
+    """Run `run(service)` against a fresh in-memory database with a result cache."""
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    try:
+        async with async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)() as session:
+            return await run(LiabilityService(LiabilityRepository(session), LRUCacheBackend(8)))
+    finally:
+        await engine.dispose()
+
+def test_amortization_is_cached_until_liabilities_change():
+    async def run(service):
+        await service.create_liability(HOME_LOAN)
+        first = await service.get_amortization()
+        cached = await service.get_amortization()
+        await service.create_liability(CAR_LOAN)
+        refreshed = await service.get_amortization()
+        return first, cached, refreshed
+
+    first, cached, refreshed = asyncio.run(_with_service(run))
+    assert cached is first
+    assert len(first.liabilities) == 1
+    assert len(refreshed.liabilities) == 2
+
+CREDIT_CARD = LiabilityIn(name="Credit Card", type="Credit Card", outstandingAmountINR=80_000, interestRate=42)
+
+def test_revolving_debt_is_amortized_at_the_minimum_payment():
+    async def run(service):
+        card = await service.create_liability(CREDIT_CARD)
+        return card.id, await service.get_amortization()
+
+    card_id, amortization = asyncio.run(_with_service(run))
+    assert amortization.revolvingLiabilityIds == [card_id]
+    (schedule,) = amortization.liabilities
+    # 5% of the balance, paid until the card is cleared
+    assert schedule.emi <= 4000.0
+    assert schedule.emi > 3900.0
+    assert schedule.monthsRemaining == 35
+
+def test_payoff_savings_come_from_the_strategy_and_extra_payment_only():
+    async def run(service):
+        await service.create_liability(CAR_LOAN)
+        single = await service.compare_payoff_strategies(0.0)
+        await service.create_liability(HOME_LOAN)
+        await service.create_liability(CREDIT_CARD)
+        without_extra = await service.compare_payoff_strategies(0.0)
+        with_extra = await service.compare_payoff_strategies(10_000.0)
+        return single, without_extra, with_extra
+
+    single, without_extra, with_extra = asyncio.run(_with_service(run))
+    # One loan leaves nothing to target, so it matches the baseline
+    assert all(strategy.interestSaved == 0 for strategy in single.strategies)
+    avalanche = {strategy.strategy: strategy for strategy in without_extra.strategies}["avalanche"]
+    assert 0 <= avalanche.interestSaved < without_extra.baselineTotalInterest
+    assert with_extra.baselineTotalInterest == without_extra.baselineTotalInterest
+    assert all(
+        extra.interestSaved > plain.interestSaved
+        for extra, plain in zip(with_extra.strategies, without_extra.strategies)
+    )
@@ -461,42 +461,6 @@ function App() {
     darkMode: darkMode,
   };
 
-  // Fetch goals from backend
-  useEffect(() => {
-    const fetchGoals = async () => {
-      try {
-        console.log('Fetching goals from API...');
-        const response = await fetch('http://localhost:5001/api/goals');
-        if (!response.ok) {
-          throw new Error(`HTTP error! status: ${response.status}`);
-        }
-        const fetchedGoals = await response.json();
-        console.log('Raw goals data from API:', fetchedGoals);
-        
-        // Ensure all required fields are present and properly typed
-        const validatedGoals: Goal[] = fetchedGoals.map((goal: any) => ({
-          id: goal.id?.toString() || '',
-          name: goal.name?.toString() || 'Unnamed Goal',
-          targetAmount: Number(goal.targetAmount) || 0,
-          currentAmount: Number(goal.currentAmount) || 0,
-          targetDate: goal.targetDate?.toString() || new Date().toISOString().split('T')[0],
-          priority: (['high', 'medium', 'low'].includes(goal.priority?.toString().toLowerCase())
-            ? goal.priority.toString().toLowerCase() as 'high' | 'medium' | 'low'
-            : 'medium'),
-          category: goal.category?.toString() || 'Other',
-          notes: goal.notes?.toString() || ''
-        }));
-        
-        console.log('Validated goals:', validatedGoals);
-        setGoals(validatedGoals);
-      } catch (error) {
-        console.error("Failed to fetch goals:", error);
-      }
-    };
-
-    fetchGoals();
-  }, []);
-
   const goalsManagerProps = {
     goals: goals,
     saveData: async (collectionName: string, data: any, id?: string) => {
@@ -606,55 +570,39 @@ function App() {
     darkMode: darkMode,
   };
   useEffect(() => {
-    // Fetch initial assets
-    const fetchAssets = async () => {
+    // Fetch the initial assets, liabilities, expenses and goals in one request
+    const fetchDashboard = async () => {
       try {
-        const response = await fetch('http://localhost:5001/api/assets');
+        const response = await fetch('http://localhost:5001/api/dashboard');
         if (!response.ok) {
           throw new Error(`HTTP error! status: ${response.status}`);
         }
-        const fetchedAssets = await response.json();
-        setAssets(fetchedAssets);
-        console.log('Assets fetched successfully:', fetchedAssets);
-      } catch (error) {
-        console.error("Failed to fetch assets:", error);
-        // Optionally: openModalHandler(<div>Error fetching assets: {error.message}</div>, "Error");
-      }
-    };
-
-    fetchAssets();
-
-    const fetchExpenses = async () => {
-      try {
-        const response = await fetch('http://localhost:5001/api/expenses');
-        if (!response.ok) {
-          throw new Error(`HTTP error! status: ${response.status}`);
-        }
-        const fetchedExpenses = await response.json() as Expense[];
-        setExpenses(fetchedExpenses);
-        console.log('Expenses fetched successfully:', fetchedExpenses);
-      } catch (error) {
-        console.error("Failed to fetch expenses:", error);
-      }
-    };
-
-    fetchExpenses();
-
-    const fetchLiabilities = async () => {
-      try {
-        const response = await fetch('http://localhost:5001/api/liabilities');
-        if (!response.ok) {
-          throw new Error(`HTTP error! status: ${response.status}`);
-        }
-        const fetchedLiabilities = await response.json() as Liability[];
-        setLiabilities(fetchedLiabilities);
-        console.log('Liabilities fetched successfully:', fetchedLiabilities);
+        const dashboard = await response.json();
+        setAssets(dashboard.assets);
+        setLiabilities(dashboard.liabilities as Liability[]);
+        setExpenses(dashboard.expenses as Expense[]);
+        console.log('Dashboard data fetched successfully:', dashboard);
+
+        // Ensure all required goal fields are present and properly typed
+        const validatedGoals: Goal[] = dashboard.goals.map((goal: any) => ({
+          id: goal.id?.toString() || '',
+          name: goal.name?.toString() || 'Unnamed Goal',
+          targetAmount: Number(goal.targetAmount) || 0,
+          currentAmount: Number(goal.currentAmount) || 0,
+          targetDate: goal.targetDate?.toString() || new Date().toISOString().split('T')[0],
+          priority: (['high', 'medium', 'low'].includes(goal.priority?.toString().toLowerCase())
+            ? goal.priority.toString().toLowerCase() as 'high' | 'medium' | 'low'
+            : 'medium'),
+          category: goal.category?.toString() || 'Other',
+          notes: goal.notes?.toString() || ''
+        }));
+        setGoals(validatedGoals);
       } catch (error) {
-        console.error("Failed to fetch liabilities:", error);
+        console.error("Failed to fetch dashboard data:", error);
       }
     };
 
-    fetchLiabilities();
+    fetchDashboard();
 
     // Test: Apply a Tailwind class to the body
     document.body.classList.add('bg-sky-500'); // A bright Tailwind color
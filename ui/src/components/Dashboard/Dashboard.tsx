@@ -90,7 +90,7 @@ const Dashboard: React.FC<DashboardProps> = ({
     swr_percentage: 4.0,
     emergency_fund_to_exclude: 500000,
     primary_residence_equity_to_exclude: 0,
-    fp_asset_classes_for_investable: ["Retirement", "General Investment", "Equity", "Debt"],
+    fp_asset_classes_for_investable: ["Retirement", "General Investment / Wealth Creation"],
   });
   const [fiResult, setFiResult] = useState<FinancialIndependenceResult | null>(null);
   const [isLoadingFI, setIsLoadingFI] = useState<boolean>(true);